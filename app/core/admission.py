@@ -0,0 +1,256 @@
+import asyncio
+import heapq
+import itertools
+import math
+import random
+import time
+
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.logs.setup_logger import LoggerManager, LOGGER
+from app.settings.setting import OpenAISettings, get_settings
+
+T = TypeVar("T")
+
+# Slot priorities, lowest first: follow-up turns of a conversation already in
+# progress go before first turns, so admitted prompts finish before new ones start.
+PRIORITY_CONTINUATION = 0
+PRIORITY_NEW = 1
+
+# Upstream failures worth retrying: rate limits, overloaded or failing servers,
+# and connection problems. Matched by name so the OpenAI SDK is not imported here.
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+_RETRYABLE_ERRORS = frozenset(
+    {"APIConnectionError", "APITimeoutError", "TimeoutException", "NetworkError"}
+)
+
+
+class OverloadedError(RuntimeError):
+    """
+    Raised when a model call is shed because the admission queue is full or too slow.
+
+    Attributes:
+        retry_after (float): Suggested delay, in seconds, before the client retries.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__("The service is overloaded, retry later.")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter handing out reservations.
+
+    Each call takes a token immediately and returns how long the caller must wait
+    for it, so callers are served in arrival order without polling.
+
+    Attributes:
+        rate (float): Tokens added per second; 0 or less disables the limiter.
+        burst (int): Maximum number of tokens kept for bursts.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Takes a token.
+
+        Returns:
+            float: Seconds to wait before the token is valid; 0 when available now.
+        """
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class AdmissionController:
+    """
+    Admission control for outbound model calls.
+
+    Calls first wait for one of `max_in_flight` slots, handed out by priority then
+    arrival order; when `max_queued` calls are already waiting, or a slot is not
+    free within `queue_timeout`, the call is shed with an OverloadedError instead
+    of queuing further. Admitted calls are paced by a token bucket and retried on
+    transient upstream errors with jittered exponential backoff, keeping their slot
+    so that retries cannot stampede.
+
+    Must be used from a single event loop.
+
+    Only model calls go through the controller: operation requests and prompts
+    resolved by the fast path never wait behind LLM work.
+
+    Attributes:
+        max_in_flight (int): Maximum number of concurrent model calls.
+        max_queued (int): Maximum number of calls waiting for a slot.
+        queue_timeout (float): Maximum time, in seconds, a call waits for a slot.
+        max_retries (int): Retries of a call failing with a transient error.
+        backoff_base (float): Backoff ceiling of the first retry, in seconds.
+        backoff_max (float): Maximum backoff, in seconds.
+        rate_limiter (TokenBucket): Limiter pacing the model calls.
+        logger (LoggerManager): Logger instance for recording shed and retried calls.
+        shed (int): Number of calls rejected since startup.
+        retries (int): Number of retries made since startup.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[OpenAISettings] = None,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self._settings = settings
+        self.logger = logger or LOGGER
+        self.rate_limiter: Optional[TokenBucket] = None
+        self._available: Optional[int] = None
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._sequence = itertools.count()
+        self.shed = 0
+        self.retries = 0
+
+    @property
+    def waiting(self) -> int:
+        """
+        Number of calls waiting for a slot.
+        """
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def _configure(self) -> None:
+        settings = self._settings or get_settings().openai
+        self.max_in_flight = settings.max_concurrent_calls
+        self.max_queued = settings.max_queued_calls
+        self.queue_timeout = settings.queue_timeout
+        self.max_retries = settings.max_retries
+        self.backoff_base = settings.retry_backoff_base
+        self.backoff_max = settings.retry_backoff_max
+        self.rate_limiter = TokenBucket(
+            settings.rate_limit_per_second, settings.rate_limit_burst
+        )
+        self._available = self.max_in_flight
+
+    async def run(
+        self, call: Callable[[], Awaitable[T]], priority: int = PRIORITY_NEW
+    ) -> T:
+        """
+        Runs a model call under the admission rules.
+
+        Args:
+            call (Callable[[], Awaitable[T]]): Factory of the model call; invoked once per attempt.
+            priority (int): Slot priority, lowest first (see PRIORITY_CONTINUATION).
+
+        Returns:
+            T: The result of the call.
+
+        Raises:
+            OverloadedError: If the call is shed.
+            Exception: The error of the last attempt, when it is not retryable or
+            the retries are exhausted.
+        """
+        if self._available is None:
+            self._configure()
+
+        await self._acquire(priority)
+        try:
+            attempt = 0
+            while True:
+                delay = self.rate_limiter.reserve()
+                if delay:
+                    await asyncio.sleep(delay)
+                try:
+                    return await call()
+                except Exception as e:
+                    if attempt >= self.max_retries or not _is_retryable(e):
+                        raise
+                    backoff = self._backoff(attempt, e)
+                    attempt += 1
+                    self.retries += 1
+                    self.logger.log_error(
+                        "[admission] retry %d in %.2fs after: %s", attempt, backoff, e
+                    )
+                    await asyncio.sleep(backoff)
+        finally:
+            self._release()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the admission counters.
+
+        Returns:
+            Dict[str, int]: Calls waiting for a slot, shed calls and retries.
+        """
+        return {"waiting": self.waiting, "shed": self.shed, "retries": self.retries}
+
+    async def _acquire(self, priority: int) -> None:
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+
+        if self.waiting >= self.max_queued:
+            self._shed("queue full")
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done():
+                # The slot was handed over as the timeout fired: give it back.
+                self._release()
+            else:
+                future.cancel()
+            self._shed("no slot within the queue timeout")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            else:
+                future.cancel()
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._available += 1
+
+    def _shed(self, reason: str) -> None:
+        self.shed += 1
+        self.logger.log_error("[admission] model call shed: %s", reason)
+        raise OverloadedError(retry_after=max(self.queue_timeout, 1.0))
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        # Full jitter spreads the retries of concurrent callers; an upstream
+        # Retry-After, when given, is a lower bound.
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return min(
+            self.backoff_max, max(random.uniform(0, ceiling), _retry_after(error))
+        )
+
+
+def _is_retryable(error: Exception) -> bool:
+    if getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES:
+        return True
+    return any(cls.__name__ in _RETRYABLE_ERRORS for cls in type(error).__mro__)
+
+
+def _retry_after(error: Exception) -> float:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return 0.0
+    try:
+        value = float(headers.get("retry-after", 0))
+    except (TypeError, ValueError):
+        return 0.0
+    return value if math.isfinite(value) and value > 0 else 0.0
+
+
+LLM_ADMISSION = AdmissionController()
@@ -0,0 +1,275 @@
+import asyncio
+import threading
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.tools import BaseTool
+
+from app.logs.setup_logger import LoggerManager, LOGGER
+from app.core.admission import (
+    LLM_ADMISSION,
+    PRIORITY_CONTINUATION,
+    PRIORITY_NEW,
+    AdmissionController,
+)
+from app.core.engine import ChallengeEngine
+from app.core.llm_client import LLM_CLIENT
+from app.core.tools import TOOL_SCHEMAS, build_challenge_tools
+from app.core.validator import ChallengeValidator
+from app.metrics.metrics import METRICS
+from app.settings.setting import get_settings
+
+SYSTEM_PROMPT = (
+    "You are a calculator. Identify the mathematical operation requested by the user "
+    "and answer ONLY by calling the provided tools. Never compute or state a result "
+    "yourself. When the prompt combines several operations, call evaluate_expression "
+    "once with the whole expression instead of chaining single operations."
+)
+
+# Receives the agent progress events, as (event name, payload).
+EventCallback = Callable[[str, Dict[str, Any]], None]
+
+
+class AgentRun(NamedTuple):
+    """The outcome of one agent run."""
+
+    # The result of the last tool call, or the list of results when the last turn
+    # called several tools.
+    result: Any
+    # The tool calls of that turn, each with its `name` and `args`.
+    tool_calls: List[Dict[str, Any]]
+    # Number of model round trips the run made.
+    round_trips: int
+
+
+class ChallengeAgent:
+    """
+    LLM agent that interprets a prompt and answers it by calling the challenge tools.
+
+    The model is forced to call a tool on its first turn, and only tool outputs
+    are returned: the model's own text is never used as a result.
+
+    The chat model is resolved through `LLM_CLIENT` on each run, unless one was
+    injected, so a client closed or rebuilt by the provider is never reused.
+
+    Attributes:
+        llm (BaseChatModel): Chat model used to pick the tools and their arguments.
+        tools (List[BaseTool]): Tools exposing the ChallengeEngine operations.
+        admission (AdmissionController): Concurrency, rate and retry policy of the model calls.
+        max_iterations (int): Maximum number of model round trips per prompt.
+        round_trips (int): Number of model round trips made since startup, by every run;
+            each run reports its own count in `AgentRun.round_trips`.
+        logger (LoggerManager): Logger instance for recording agent steps and errors.
+    """
+
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        tools: Optional[List[BaseTool]] = None,
+        engine: Optional[ChallengeEngine] = None,
+        validator: Optional[ChallengeValidator] = None,
+        max_iterations: Optional[int] = None,
+        admission: Optional[AdmissionController] = None,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self.logger = logger or LOGGER
+        self.admission = admission or LLM_ADMISSION
+        self.tools = tools or build_challenge_tools(engine, validator)
+        self._tool_schemas = TOOL_SCHEMAS if tools is None else self.tools
+        self._llm = llm
+        self._tools_by_name: Dict[str, BaseTool] = {
+            tool.name: tool for tool in self.tools
+        }
+        self.max_iterations = (
+            max_iterations or get_settings().openai.max_agent_iterations
+        )
+        self.round_trips = 0
+        self._counter_lock = threading.Lock()
+        # (model, model forced to call a tool, model free to stop), bound once per model.
+        self._bound: Optional[Tuple[BaseChatModel, Any, Any]] = None
+
+    @property
+    def llm(self) -> BaseChatModel:
+        """
+        The injected chat model, or the current one of the LLM client provider.
+        """
+        return self._llm or LLM_CLIENT.chat_model
+
+    async def run(self, prompt: str) -> Any:
+        """
+        Runs the tool-calling loop for the prompt (see `run_with_trace`).
+
+        Args:
+            prompt (str): The user prompt.
+
+        Returns:
+            Any: The result of the last tool call, or the list of results when the
+            last turn called several tools.
+        """
+        return (await self.run_with_trace(prompt)).result
+
+    async def run_with_trace(
+        self, prompt: str, on_event: Optional[EventCallback] = None
+    ) -> AgentRun:
+        """
+        Runs the tool-calling loop for the prompt and reports the tool calls behind the result.
+
+        The first turn forces a tool call. All tool calls of a model response are
+        independent, so they are executed concurrently and their results are sent
+        back in a single turn. The loop ends when the model stops calling tools or
+        after `max_iterations` model round trips.
+
+        Progress is reported to `on_event` as it happens: "tool_selected" and
+        "tool_arguments" for each tool call of a model response, then "tool_result"
+        as each call completes (with an "error" instead of a "result" on failure).
+
+        Args:
+            prompt (str): The user prompt.
+            on_event (Optional[EventCallback]): Receiver of the progress events.
+
+        Returns:
+            AgentRun: The result of the last turn, its tool calls and the number of
+            model round trips of this run.
+
+        Raises:
+            ValueError: If the model calls no tool or an unknown tool, a tool rejects
+            its input, or the iteration limit is reached.
+            OverloadedError: If a model call is shed by the admission controller.
+        """
+        messages: List[BaseMessage] = [
+            SystemMessage(content=SYSTEM_PROMPT),
+            HumanMessage(content=prompt),
+        ]
+        llm, llm_with_tools = self._bind_tools()
+        results: Optional[List[Any]] = None
+        tool_calls: List[Dict[str, Any]] = []
+
+        for iteration in range(1, self.max_iterations + 1):
+            with METRICS.span("llm", "prompt"):
+                ai_message = await self.admission.run(
+                    lambda: self._invoke_model(llm, messages),
+                    priority=PRIORITY_NEW if iteration == 1 else PRIORITY_CONTINUATION,
+                )
+            self._count_round_trip()
+            round_trips = iteration
+
+            if not ai_message.tool_calls:
+                break
+
+            self.logger.log_debug(
+                "[agent] iteration %d: %d tool calls",
+                iteration,
+                len(ai_message.tool_calls),
+            )
+            if on_event is not None:
+                for tool_call in ai_message.tool_calls:
+                    on_event(
+                        "tool_selected",
+                        {
+                            "iteration": iteration,
+                            "id": tool_call["id"],
+                            "tool": tool_call["name"],
+                        },
+                    )
+                    on_event(
+                        "tool_arguments",
+                        {"id": tool_call["id"], "arguments": tool_call["args"]},
+                    )
+            results = await asyncio.gather(
+                *(
+                    self._call_tool(tool_call, on_event)
+                    for tool_call in ai_message.tool_calls
+                )
+            )
+            tool_calls = ai_message.tool_calls
+            messages.append(ai_message)
+            messages.extend(
+                ToolMessage(content=str(result), tool_call_id=tool_call["id"])
+                for tool_call, result in zip(ai_message.tool_calls, results)
+            )
+            llm = llm_with_tools
+        else:
+            self.logger.log_error(
+                "[agent] iteration limit of %d reached", self.max_iterations
+            )
+            raise ValueError("The agent reached its iteration limit.")
+
+        if results is None:
+            self.logger.log_error("[agent] model answered without calling a tool")
+            raise ValueError("The model did not call any tool.")
+
+        trace = [{"name": call["name"], "args": call["args"]} for call in tool_calls]
+        return AgentRun(
+            result=results[0] if len(results) == 1 else results,
+            tool_calls=trace,
+            round_trips=round_trips,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the agent counters.
+
+        Returns:
+            Dict[str, int]: Number of model round trips made since startup.
+        """
+        return {"round_trips": self.round_trips}
+
+    def _bind_tools(self) -> Tuple[Any, Any]:
+        llm = self.llm
+        bound = self._bound
+        if bound is None or bound[0] is not llm:
+            bound = self._bound = (
+                llm,
+                llm.bind_tools(self._tool_schemas, tool_choice="required"),
+                llm.bind_tools(self._tool_schemas),
+            )
+        return bound[1], bound[2]
+
+    async def _invoke_model(self, llm: Any, messages: List[BaseMessage]) -> Any:
+        async with LLM_CLIENT.track():
+            return await llm.ainvoke(messages)
+
+    async def _call_tool(
+        self, tool_call: Dict[str, Any], on_event: Optional[EventCallback] = None
+    ) -> Any:
+        """
+        Executes a single tool call emitted by the model.
+
+        Args:
+            tool_call (Dict[str, Any]): The tool call, with its `name` and `args`.
+            on_event (Optional[EventCallback]): Receiver of the "tool_result" event.
+
+        Returns:
+            Any: The tool output.
+        """
+        tool = self._tools_by_name.get(tool_call["name"])
+        if tool is None:
+            raise ValueError(f"Unknown tool: {tool_call['name']}")
+
+        self.logger.log_debug(
+            "[agent] calling tool '%s' with args: %s",
+            tool_call["name"],
+            tool_call["args"],
+        )
+        try:
+            with METRICS.span("tool", tool_call["name"]):
+                result = await tool.ainvoke(tool_call["args"])
+        except Exception as e:
+            if on_event is not None:
+                on_event("tool_result", {"id": tool_call["id"], "error": str(e)})
+            raise
+
+        if on_event is not None:
+            on_event("tool_result", {"id": tool_call["id"], "result": result})
+        return result
+
+    def _count_round_trip(self) -> None:
+        with self._counter_lock:
+            self.round_trips += 1
@@ -0,0 +1,77 @@
+from typing import Any, Dict
+
+import numpy as np
+
+from app.schemas.schema import Number
+
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
+# Operand buffers are always little-endian, whatever the server architecture.
+OPERAND_DTYPES: Dict[str, np.dtype] = {
+    "float64": np.dtype("<f8"),
+    "int64": np.dtype("<i8"),
+}
+
+
+def decode_operands(body: bytes, dtype: str) -> np.ndarray:
+    """
+    Wraps a binary operand buffer as a read-only NumPy array without copying it.
+
+    Args:
+        body (bytes): The raw request body.
+        dtype (str): The operand type, "float64" or "int64".
+
+    Returns:
+        np.ndarray: A one-dimensional view over the body.
+
+    Raises:
+        ValueError: If the dtype is unknown, the body size is not a multiple of the
+        item size, or float operands are not finite.
+    """
+    if dtype not in OPERAND_DTYPES:
+        raise ValueError(f"Unsupported operand dtype: {dtype}")
+    item_dtype = OPERAND_DTYPES[dtype]
+    if len(body) % item_dtype.itemsize:
+        raise ValueError(
+            f"Body size must be a multiple of {item_dtype.itemsize} bytes for {dtype}."
+        )
+
+    operands = np.frombuffer(body, dtype=item_dtype)
+    if item_dtype.kind == "f" and not np.isfinite(operands).all():
+        raise ValueError("All operands must be finite numbers.")
+    return operands
+
+
+_INT64 = np.iinfo(np.int64)
+
+
+def is_encodable(result: Any) -> bool:
+    """
+    Tells whether `encode_result` can encode the result in 8 bytes.
+
+    Exact integer results outside the int64 range are only returned as JSON.
+    """
+    if isinstance(result, float):
+        return True
+    return isinstance(result, int) and _INT64.min <= result <= _INT64.max
+
+
+def encode_result(result: Number) -> bytes:
+    """
+    Encodes a result as a single little-endian value.
+
+    Args:
+        result (Number): The operation result.
+
+    Returns:
+        bytes: 8 bytes, int64 for integer results and float64 otherwise.
+    """
+    dtype = OPERAND_DTYPES["int64" if isinstance(result, int) else "float64"]
+    return np.array([result], dtype=dtype).tobytes()
+
+
+def result_dtype(result: Number) -> str:
+    """
+    Returns the dtype name used by `encode_result` for the result.
+    """
+    return "int64" if isinstance(result, int) else "float64"
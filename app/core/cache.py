@@ -0,0 +1,393 @@
+import copy
+import hashlib
+import json
+import re
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Protocol, Tuple
+
+from app.schemas.schema import Number, Precision
+from app.logs.setup_logger import LoggerManager, LOGGER
+from app.settings.setting import CacheBackendType, CacheSettings, get_settings
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def operation_key(
+    operation: str, operands: List[Number], *options: Hashable
+) -> Hashable:
+    """
+    Builds the key identifying an operation request.
+
+    Operand types are part of the key, so `[1, 2]` and `[1.0, 2.0]` do not share
+    an entry (their sums serialize differently).
+
+    Args:
+        operation (str): The operation name.
+        operands (List[Number]): The operands of the request.
+        *options (Hashable): Request options changing the result (e.g. precision mode).
+
+    Returns:
+        Hashable: The key.
+    """
+    return (
+        "operation",
+        operation,
+        tuple((type(v), v) for v in operands),
+        options,
+    )
+
+
+def precision_options(
+    precision: Optional[Precision], decimal_precision: int
+) -> Tuple[Hashable, ...]:
+    """
+    Returns the key options of an operation request's arithmetic mode.
+
+    The number of digits only changes results in decimal mode, so it is left out
+    of the other modes and their identical requests share a key.
+
+    Args:
+        precision (Optional[Precision]): The precision mode, None for the native handler.
+        decimal_precision (int): Significant digits used by the decimal mode.
+
+    Returns:
+        Tuple[Hashable, ...]: The options to pass to `operation_key`.
+    """
+    if precision == "decimal":
+        return (precision, decimal_precision)
+    return (precision,)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Returns the canonical text of a prompt.
+
+    Normalization lower-cases the prompt, collapses whitespace and drops
+    trailing punctuation, so "What is 10 divided by 2?" and
+    "what is 10  divided by 2" are equal.
+
+    Args:
+        prompt (str): The user prompt.
+
+    Returns:
+        str: The normalized prompt.
+    """
+    return _WHITESPACE.sub(" ", prompt).strip().lower().rstrip("?!. ")
+
+
+def prompt_key(prompt: str) -> Hashable:
+    """
+    Builds the key identifying a prompt request from its normalized text (see `normalize_prompt`).
+
+    Args:
+        prompt (str): The user prompt.
+
+    Returns:
+        Hashable: The key.
+    """
+    return ("prompt", normalize_prompt(prompt))
+
+
+class CacheBackend(ABC):
+    """
+    Storage interface used by ResponseCache.
+
+    Implementations may be in-process or shared between workers (e.g. Redis), as long
+    as they honor the bounded size and TTL semantics they are configured with.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the value stored for `key`, or None on a miss or an expired entry."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores `value` under `key`, evicting entries if the backend is full."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every entry."""
+
+    @abstractmethod
+    def size(self) -> int:
+        """Returns the number of stored entries."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Thread-safe in-process backend with LRU eviction and a per-entry TTL.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept; the least recently used is evicted first.
+        ttl_seconds (float): Time, in seconds, after which an entry expires.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Entries are copied in and out, so callers never share them.
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class SharedStore(Protocol):
+    """
+    The subset of the Redis client API used by SharedCacheBackend.
+
+    `redis.Redis` satisfies it, and so does any in-process fake used in tests.
+    """
+
+    def get(self, name: str) -> Optional[bytes]: ...
+
+    def set(self, name: str, value: str, px: Optional[int] = None) -> Any: ...
+
+    def delete(self, *names: str) -> Any: ...
+
+    def scan_iter(self, match: Optional[str] = None) -> Iterator[Any]: ...
+
+
+class SharedCacheBackend(CacheBackend):
+    """
+    Backend storing entries in a key-value store shared by every worker (e.g. Redis).
+
+    Keys are hashed into `key_prefix` + a SHA-256 digest, and values are stored as
+    JSON with a per-entry TTL. The size bound is enforced by the store itself (for
+    Redis, `maxmemory` with an LRU eviction policy). A store that cannot be reached
+    makes lookups miss instead of failing the request.
+
+    Attributes:
+        store (SharedStore): Client of the shared store.
+        key_prefix (str): Prefix of every key written by this backend.
+        ttl_seconds (float): Time, in seconds, after which an entry expires.
+        logger (LoggerManager): Logger instance for recording store errors.
+    """
+
+    def __init__(
+        self,
+        store: SharedStore,
+        key_prefix: str = "challenge:cache:",
+        ttl_seconds: float = 300.0,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self.store = store
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        self.logger = logger or LOGGER
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        try:
+            raw = self.store.get(self._name(key))
+        except Exception as e:  # The client's error types depend on the store.
+            self.logger.log_error("[cache] shared store read failed: %s", e)
+            return None
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        try:
+            self.store.set(
+                self._name(key),
+                json.dumps(value),
+                px=max(1, int(self.ttl_seconds * 1000)),
+            )
+        except Exception as e:
+            self.logger.log_error("[cache] shared store write failed: %s", e)
+
+    def clear(self) -> None:
+        try:
+            names = list(self.store.scan_iter(match=f"{self.key_prefix}*"))
+            if names:
+                self.store.delete(*names)
+        except Exception as e:
+            self.logger.log_error("[cache] shared store clear failed: %s", e)
+
+    def size(self) -> int:
+        try:
+            return sum(1 for _ in self.store.scan_iter(match=f"{self.key_prefix}*"))
+        except Exception as e:
+            self.logger.log_error("[cache] shared store scan failed: %s", e)
+            return 0
+
+    def _name(self, key: Hashable) -> str:
+        # Keys hold operand types, so their repr (not JSON) identifies them.
+        return self.key_prefix + hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Cache of successful workflow results, keyed on (operation, operands) or on a normalized prompt.
+
+    Only results produced by tool execution (the ChallengeEngine operations) are
+    stored; failures and any model free text are never cached.
+
+    Attributes:
+        backend (CacheBackend): Storage used for the cached results.
+        max_key_operands (int): Requests with more operands than this are not cached.
+        logger (LoggerManager): Logger instance for recording cache events.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups not found in the cache.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_key_operands: int = 64,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.max_key_operands = max_key_operands
+        self.logger = logger or LOGGER
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+    def operation_key(
+        self, operation: str, operands: List[Number], *options: Hashable
+    ) -> Optional[Hashable]:
+        """
+        Builds the cache key of an operation request (see `operation_key`).
+
+        Args:
+            operation (str): The operation name.
+            operands (List[Number]): The operands of the request.
+            *options (Hashable): Request options changing the result (e.g. precision mode).
+
+        Returns:
+            Optional[Hashable]: The key, or None when the request is too large to be cached.
+        """
+        if len(operands) > self.max_key_operands:
+            return None
+        return operation_key(operation, operands, *options)
+
+    def prompt_key(self, prompt: str) -> Hashable:
+        """
+        Builds the cache key of a prompt request (see `prompt_key`).
+
+        Args:
+            prompt (str): The user prompt.
+
+        Returns:
+            Hashable: The key.
+        """
+        return prompt_key(prompt)
+
+    def get(self, key: Optional[Hashable]) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a cached result and updates the hit/miss counters.
+
+        Args:
+            key (Optional[Hashable]): The cache key; None always misses.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached workflow result, or None on a miss.
+        """
+        value = self.backend.get(key) if key is not None else None
+        with self._counter_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is not None:
+            self.logger.log_debug("[cache] hit for key: %s", key)
+        return value
+
+    def set(self, key: Optional[Hashable], result: Dict[str, Any]) -> None:
+        """
+        Stores a workflow result if it was successfully produced by a tool.
+
+        Args:
+            key (Optional[Hashable]): The cache key; None skips caching.
+            result (Dict[str, Any]): The workflow result dictionary.
+        """
+        if key is None or not result.get("success"):
+            return
+        data = result.get("data")
+        if not isinstance(data, dict) or "result" not in data:
+            return
+        self.backend.set(key, result)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit rate and current number of entries.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": self.backend.size(),
+        }
+
+
+def build_cache_backend(settings: CacheSettings) -> CacheBackend:
+    """
+    Builds the storage described by the cache settings.
+
+    The Redis backend needs the optional `redis` package.
+
+    Args:
+        settings (CacheSettings): The cache settings.
+
+    Returns:
+        CacheBackend: The configured backend.
+    """
+    if settings.backend == CacheBackendType.REDIS:
+        import redis
+
+        return SharedCacheBackend(
+            store=redis.Redis.from_url(settings.redis_url),
+            key_prefix=settings.key_prefix,
+            ttl_seconds=settings.ttl_seconds,
+        )
+    return InMemoryCacheBackend(
+        max_size=settings.max_size, ttl_seconds=settings.ttl_seconds
+    )
+
+
+def build_response_cache() -> Optional[ResponseCache]:
+    """
+    Builds the response cache described by the cache settings.
+
+    Returns:
+        Optional[ResponseCache]: The cache, or None when caching is disabled.
+    """
+    settings = get_settings().cache
+    if not settings.enabled:
+        return None
+    return ResponseCache(
+        backend=build_cache_backend(settings),
+        max_key_operands=settings.max_key_operands,
+    )
@@ -1,7 +1,145 @@
-from typing import List, Optional
+import sys
 
-from app.schemas.schema import Number
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+import numpy as np
+
+from app.schemas.schema import Number, Precision
 from app.logs.setup_logger import LoggerManager, LOGGER
+from app.core.registry import DivisionByZeroError, OperationSpec, get_operation
+
+
+def _require_operation(operation: str) -> OperationSpec:
+    spec = get_operation(operation)
+    if spec is None:
+        raise ValueError(f"Unsupported operation: {operation}")
+    return spec
+
+
+def to_fraction(value: Number) -> Fraction:
+    """
+    Converts an operand for exact arithmetic; floats are read as their shortest
+    decimal representation (0.1 is 1/10).
+    """
+    return Fraction(value) if isinstance(value, int) else Fraction(repr(value))
+
+
+@lru_cache(maxsize=4)
+def _int_str_bound(limit: int) -> int:
+    return 10 ** (limit - 1)
+
+
+def _exceeds_int_str_limit(value: int) -> bool:
+    limit = sys.get_int_max_str_digits()
+    return bool(limit) and abs(value) >= _int_str_bound(limit)
+
+
+def decimal_str(value: int) -> str:
+    """
+    Formats an integer in base 10, without the int-to-str digit limit (4300 by default).
+
+    Integers beyond the limit are formatted through `Decimal`, which is not limited
+    and converts large integers faster than `str`.
+    """
+    return str(Decimal(value)) if _exceeds_int_str_limit(value) else str(value)
+
+
+def json_int(value: int) -> Union[int, str]:
+    """
+    Returns an integer result in a form JSON encoding and logging accept: the int
+    itself, or its decimal string when it is beyond the int-to-str digit limit.
+    """
+    return str(Decimal(value)) if _exceeds_int_str_limit(value) else value
+
+
+def tree_reduce(values: List[Any], step: Callable[[Any, Any], Any]) -> Any:
+    """
+    Reduces the values with an associative step as a balanced binary tree.
+
+    Combining neighbours pairwise keeps both sides of every step about the same
+    size, so big-integer products and Fraction sums cost close to a single
+    multiplication of the final size instead of growing one side linearly.
+
+    Args:
+        values (List[Any]): The values to reduce; must not be empty.
+        step (Callable[[Any, Any], Any]): Associative step.
+
+    Returns:
+        Any: The reduced value.
+    """
+    while len(values) > 1:
+        paired = [step(left, right) for left, right in zip(values[::2], values[1::2])]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+class StreamingReduction:
+    """
+    Incremental, constant-memory reduction of an operand stream.
+
+    Operands are folded into the running result as they arrive, with the same
+    semantics as the ChallengeEngine list methods. Division by zero is detected
+    in the same pass.
+
+    Attributes:
+        operation (str): The operation being reduced.
+        count (int): Number of operands consumed so far.
+    """
+
+    def __init__(self, operation: str):
+        self._spec = _require_operation(operation)
+        self.operation = operation
+        self.count = 0
+        self._step: Callable[[Number, Number], Number] = self._spec.step
+        self._result: Number = self._spec.initial
+
+    def push(self, value: Number) -> None:
+        """
+        Folds one operand into the running result.
+
+        Args:
+            value (Number): The next operand.
+
+        Raises:
+            ValueError: If a divisor is zero.
+        """
+        if self.count == 0 and self._spec.initial is None:
+            self._result = value
+        else:
+            self._result = self._step(self._result, value)
+        self.count += 1
+
+    def extend(self, values: Iterable[Number]) -> None:
+        """
+        Folds every operand of the iterable into the running result.
+
+        Args:
+            values (Iterable[Number]): The next operands.
+        """
+        for value in values:
+            self.push(value)
+
+    def result(self) -> Number:
+        """
+        Returns the reduction result.
+
+        Returns:
+            Number: The result of the operation over all consumed operands.
+
+        Raises:
+            ValueError: If fewer than two operands were consumed.
+        """
+        if self.count < 2:
+            raise ValueError("At least two operands are required.")
+        if self._spec.finalize is not None:
+            return self._spec.finalize(self._result, self.count)
+        return self._result
 
 
 class ChallengeEngine:
@@ -9,7 +147,8 @@ class ChallengeEngine:
     Engine responsible for executing mathematical operations on a list of operands.
 
     This class provides methods for summing, subtracting, multiplying, and dividing
-    numeric operands, along with logging the computation steps.
+    numeric operands, along with logging the computation steps. Any other operation
+    of the registry (see `app.core.registry`) is executed through its fold step.
 
     Attributes:
         logger (LoggerManager): Logger instance for recording debug information and errors.
@@ -28,7 +167,7 @@ class ChallengeEngine:
         Returns:
             float: The sum of the operands.
         """
-        self.logger.log_debug(f"[engine] Summing: {operands}")
+        self.logger.log_debug("[engine] Summing: %s", operands)
         return sum(operands)
 
     def subtract_operands(self, operands: List[Number]) -> float:
@@ -42,9 +181,9 @@ class ChallengeEngine:
         Returns:
             float: The result of the subtraction.
         """
-        self.logger.log_debug(f"[engine] Subtracting: {operands}")
+        self.logger.log_debug("[engine] Subtracting: %s", operands)
         result = operands[0]
-        for value in operands[1:]:
+        for value in islice(operands, 1, None):
             result -= value
         return result
 
@@ -58,7 +197,7 @@ class ChallengeEngine:
         Returns:
             float: The product of all operands.
         """
-        self.logger.log_debug(f"[engine] Multiplying: {operands}")
+        self.logger.log_debug("[engine] Multiplying: %s", operands)
         result = 1.0
         for value in operands:
             result *= value
@@ -68,6 +207,9 @@ class ChallengeEngine:
         """
         Divides the first operand by each of the subsequent operands in order.
 
+        Zero divisors are detected in the same pass as the division, without copying
+        the operands, so this method also acts as the division validation.
+
         Args:
             operands (List[Number]): A list of numeric operands. The first value is divided by each of the subsequent values.
 
@@ -75,12 +217,373 @@ class ChallengeEngine:
             float: The result of the division.
 
         Raises:
-            ValueError: If any of the subsequent operands is zero.
+            DivisionByZeroError: If any of the subsequent operands is zero.
         """
-        self.logger.log_debug(f"[engine] Dividing: {operands}")
+        self.logger.log_debug("[engine] Dividing: %s", operands)
         result = operands[0]
-        for value in operands[1:]:
-            if value == 0:
-                raise ValueError("Division by zero is not allowed.")
-            result /= value
+        divisors = islice(operands, 1, None)
+        try:
+            for value in divisors:
+                if value == 0:
+                    raise DivisionByZeroError()
+                result /= value
+        except OverflowError:
+            # A zero divisor takes precedence over an overflow, as it would have
+            # been rejected before any division was performed.
+            if any(value == 0 for value in divisors):
+                raise DivisionByZeroError()
+            raise
+        return result
+
+    def reduce_operands(self, operation: str, operands: List[Number]) -> Number:
+        """
+        Applies any registered operation as a left fold over the operands.
+
+        Used for operations without a dedicated method (e.g. power, modulo, mean).
+
+        Args:
+            operation (str): The registered operation name.
+            operands (List[Number]): A list of numeric operands.
+
+        Returns:
+            Number: The result of the operation.
+
+        Raises:
+            ValueError: If the operation is unknown or a divisor is zero.
+        """
+        self.logger.log_debug("[engine] Reducing with '%s': %s", operation, operands)
+        spec = _require_operation(operation)
+        return self._fold(spec, operands, spec.step)
+
+    def reduce_with_precision(
+        self,
+        operation: str,
+        operands: List[Number],
+        precision: Precision,
+        decimal_precision: int = 28,
+    ) -> Union[Number, str]:
+        """
+        Applies a registered operation with an explicit precision mode.
+
+        Modes:
+            - "float": float64 arithmetic through the vectorized array path.
+            - "compensated": correctly rounded `math.fsum` for additive operations
+              (sum, subtract, mean), float64 fold for the others.
+            - "exact": integer/Fraction arithmetic. Float operands are read as their
+              shortest decimal representation (0.1 is 1/10).
+            - "decimal": Decimal arithmetic with `decimal_precision` significant digits.
+
+        Args:
+            operation (str): The registered operation name.
+            operands (List[Number]): A list of numeric operands.
+            precision (Precision): The precision mode.
+            decimal_precision (int): Significant digits used by the "decimal" mode.
+
+        Returns:
+            Union[Number, str]: A float for "float" and "compensated"; for "exact", an
+            int when the result is integral (a decimal string beyond the int-to-str
+            digit limit) and a "numerator/denominator" string otherwise; for
+            "decimal", the decimal string.
+
+        Raises:
+            ValueError: If the operation or mode is unknown or a divisor is zero.
+        """
+        self.logger.log_debug(
+            "[engine] Reducing with '%s' in %s precision: %s",
+            operation,
+            precision,
+            operands,
+        )
+        spec = _require_operation(operation)
+
+        if precision == "float":
+            return self.reduce_array(operation, np.asarray(operands, dtype=np.float64))
+
+        if precision == "compensated":
+            if spec.compensated is not None:
+                return spec.compensated(operands)
+            return self._fold(spec, [float(value) for value in operands], spec.step)
+
+        if precision == "exact":
+            values = [to_fraction(value) for value in operands]
+            if spec.exact_combine is not None:
+                combined = tree_reduce(values[1:], spec.exact_combine)
+                return self.combine_exact(operation, values[0], combined, len(values))
+            result = self._fold(spec, values, spec.exact_step or spec.step, Fraction)
+            return self._exact_result(result)
+
+        if precision == "decimal":
+            with localcontext() as context:
+                context.prec = decimal_precision
+                values = [Decimal(repr(value)) for value in operands]
+                result = self._fold(spec, values, spec.exact_step or spec.step, Decimal)
+                return str(+result)
+
+        raise ValueError(f"Unsupported precision mode: {precision}")
+
+    def combine_exact(
+        self, operation: str, first: Fraction, combined: Any, count: int
+    ) -> Union[Number, str]:
+        """
+        Finishes a regrouped exact reduction (see `OperationSpec.exact_combine`).
+
+        Args:
+            operation (str): The registered operation name.
+            first (Fraction): The first operand.
+            combined (Any): The remaining operands reduced with `exact_combine`.
+            count (int): The total number of operands.
+
+        Returns:
+            Union[Number, str]: An int when the result is integral (a decimal string
+            beyond the int-to-str digit limit), otherwise a "numerator/denominator" string.
+
+        Raises:
+            ValueError: If the operation is unknown or a divisor is zero.
+        """
+        spec = _require_operation(operation)
+        result = (spec.exact_step or spec.step)(first, combined)
+        if spec.finalize is not None:
+            result = spec.finalize(result, count)
+        return self._exact_result(result)
+
+    def get_handler(self, operation: str) -> Callable[[List[Number]], Number]:
+        """
+        Returns the callable executing a registered operation on a list of operands.
+
+        Args:
+            operation (str): The registered operation name.
+
+        Returns:
+            Callable[[List[Number]], Number]: The dedicated engine method, or the generic fold.
+
+        Raises:
+            ValueError: If the operation is unknown.
+        """
+        spec = _require_operation(operation)
+        if spec.engine_method is not None:
+            return getattr(self, spec.engine_method)
+        return partial(self.reduce_operands, operation)
+
+    def reduce_array(self, operation: str, operands: np.ndarray) -> Number:
+        """
+        Applies the operation to a NumPy operand array without copying it.
+
+        Each operation is a left fold performed by its registered ufunc `reduce`.
+        Operations flagged with a float accumulator (e.g. products and quotients)
+        are accumulated in float64, like their list counterparts; integer
+        reductions that could leave the int64 range are folded with Python ints,
+        so they stay exact like their list counterparts.
+
+        Args:
+            operation (str): The registered operation name.
+            operands (np.ndarray): One-dimensional int64 or float64 operand array.
+
+        Returns:
+            Number: The result of the operation.
+
+        Raises:
+            ValueError: If the operation is unknown or a divisor is zero.
+        """
+        self.logger.log_debug(
+            "[engine] Reducing %d array operands with '%s'", operands.size, operation
+        )
+        spec = _require_operation(operation)
+        if spec.nonzero_divisors and not np.all(operands[1:]):
+            raise DivisionByZeroError()
+        if spec.ufunc is None:
+            return self.reduce_operands(operation, operands.tolist())
+
+        if spec.float_accumulator:
+            dtype = np.float64
+        elif operands.dtype.kind == "i" and self._may_overflow_int64(operands):
+            return self._fold(spec, operands.tolist(), spec.step)
+        else:
+            dtype = None
+
+        result = spec.ufunc.reduce(operands, dtype=dtype)
+        if spec.finalize is not None:
+            result = spec.finalize(result, operands.size)
+        return result.item()
+
+    def stream_reduction(self, operation: str) -> StreamingReduction:
+        """
+        Starts an incremental reduction for operands that arrive as a stream.
+
+        Args:
+            operation (str): The registered operation name.
+
+        Returns:
+            StreamingReduction: The reduction to feed with the operands.
+        """
+        self.logger.log_debug("[engine] Streaming reduction: %s", operation)
+        return StreamingReduction(operation)
+
+    def reduce_batch(
+        self, operation: str, operands_batch: List[List[Number]]
+    ) -> List[Number]:
+        """
+        Applies the operation to each operand list of a batch in a single vectorized reduction.
+
+        Operations without a ufunc fall back to the scalar handler for each item.
+
+        Args:
+            operation (str): The registered operation name.
+            operands_batch (List[List[Number]]): Operand lists, one per batched item.
+
+        Returns:
+            List[Number]: The result of each operand list, in input order.
+
+        Raises:
+            ValueError: If the operation is unknown, or, for operations with a divisor
+            rule, if any of the subsequent operands of any item is zero.
+        """
+        self.logger.log_debug(
+            "[engine] Reducing batch of %d items with '%s'",
+            len(operands_batch),
+            operation,
+        )
+        spec = _require_operation(operation)
+        if spec.ufunc is None:
+            handler = self.get_handler(operation)
+            return [handler(operands) for operands in operands_batch]
+
+        if not spec.nonzero_divisors:
+            return self._reduce_batch(spec, operands_batch)
+        try:
+            with np.errstate(divide="raise", invalid="raise"):
+                return self._reduce_batch(spec, operands_batch)
+        except FloatingPointError:
+            raise DivisionByZeroError()
+
+    @staticmethod
+    def _fold(
+        spec: OperationSpec,
+        values: List[Any],
+        step: Callable[[Any, Any], Any],
+        number_type: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Left-folds already converted operands with the given step.
+
+        Args:
+            spec (OperationSpec): The operation, providing the seed and finalizer.
+            values (List[Any]): The converted operands.
+            step (Callable[[Any, Any], Any]): The fold step.
+            number_type (Optional[Callable[[Any], Any]]): Type the seed is converted to,
+                so e.g. the float seed of a product does not turn Fractions into floats.
+
+        Returns:
+            Any: The folded and finalized value.
+        """
+        if spec.initial is None:
+            result = values[0]
+            remaining = islice(values, 1, None)
+        else:
+            result = spec.initial
+            if number_type is not None:
+                if isinstance(result, float) and result.is_integer():
+                    # An integral seed (e.g. the product's 1.0) adds no trailing zero.
+                    result = int(result)
+                result = number_type(repr(result))
+            remaining = iter(values)
+        for value in remaining:
+            result = step(result, value)
+        if spec.finalize is not None:
+            return spec.finalize(result, len(values))
         return result
+
+    @staticmethod
+    def _exact_result(result: Any) -> Union[Number, str]:
+        if isinstance(result, float):
+            return result
+        if result.denominator == 1:
+            return json_int(int(result))
+        return f"{decimal_str(result.numerator)}/{decimal_str(result.denominator)}"
+
+    @staticmethod
+    def _may_overflow_int64(operands: np.ndarray) -> bool:
+        bound = max(abs(int(operands.max())), abs(int(operands.min())))
+        return bound * operands.size > np.iinfo(np.int64).max
+
+    def _reduce_batch(
+        self, spec: OperationSpec, operands_batch: List[List[Number]]
+    ) -> List[Number]:
+        """
+        Folds every operand list of a batch from left to right with the operation ufunc.
+
+        Operations with a float accumulator are reduced in float64. For the others,
+        integer-only operand lists are reduced in int64, so they return ints like the
+        scalar handlers, and the remaining lists in float64.
+
+        Args:
+            spec (OperationSpec): The operation, providing the ufunc and finalizer.
+            operands_batch (List[List[Number]]): Non-empty operand lists.
+
+        Returns:
+            List[Number]: One reduced value per operand list, in input order.
+
+        Raises:
+            OverflowError: If an operand does not fit the array type, or an int64
+            reduction could overflow.
+        """
+        if not operands_batch:
+            return []
+        if spec.float_accumulator:
+            return self._reduce_segments(spec, operands_batch, np.float64)
+
+        integral = [
+            all(type(value) is int for value in operands) for operands in operands_batch
+        ]
+        if all(integral) or not any(integral):
+            dtype = np.int64 if integral[0] else np.float64
+            return self._reduce_segments(spec, operands_batch, dtype)
+
+        results: List[Number] = [None] * len(operands_batch)
+        for flag, dtype in ((True, np.int64), (False, np.float64)):
+            indexes = [index for index, kind in enumerate(integral) if kind is flag]
+            values = self._reduce_segments(
+                spec, [operands_batch[index] for index in indexes], dtype
+            )
+            for index, value in zip(indexes, values):
+                results[index] = value
+        return results
+
+    def _reduce_segments(
+        self,
+        spec: OperationSpec,
+        operands_batch: List[List[Number]],
+        dtype: Any,
+    ) -> List[Number]:
+        """
+        Flattens the operand lists into one array and reduces each segment.
+
+        `ufunc.reduceat` applies the same left fold as the scalar methods
+        (e.g. `a / b / c`) to each segment.
+
+        Args:
+            spec (OperationSpec): The operation, providing the ufunc and finalizer.
+            operands_batch (List[List[Number]]): Non-empty operand lists.
+            dtype (Any): Array type, np.int64 or np.float64.
+
+        Returns:
+            List[Number]: One reduced value per operand list, in input order.
+        """
+        lengths = np.fromiter(
+            (len(operands) for operands in operands_batch),
+            dtype=np.intp,
+            count=len(operands_batch),
+        )
+        offsets = np.zeros(len(operands_batch), dtype=np.intp)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+
+        flat = np.fromiter(
+            (value for operands in operands_batch for value in operands),
+            dtype=dtype,
+            count=int(lengths.sum()),
+        )
+        if dtype is np.int64 and self._may_overflow_int64(flat):
+            raise OverflowError("Batch reduction could overflow int64.")
+        results = spec.ufunc.reduceat(flat, offsets)
+        if spec.finalize is not None:
+            results = spec.finalize(results, lengths)
+        return results.tolist()
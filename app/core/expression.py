@@ -0,0 +1,285 @@
+import ast
+import re
+import threading
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+from app.schemas.schema import Number
+from app.logs.setup_logger import LoggerManager, LOGGER
+from app.core.engine import ChallengeEngine
+from app.core.registry import get_operation, operation_names
+from app.core.validator import ChallengeValidator
+from app.settings.setting import get_settings
+
+MAX_EXPRESSION_LENGTH = 1000
+MAX_EXPRESSION_STEPS = 128
+EXPRESSION_TOOL_NAME = "evaluate_expression"
+
+
+class StepRef(NamedTuple):
+    """Reference to the result of an earlier step of the same plan."""
+
+    index: int
+
+
+PlanOperand = Union[Number, StepRef]
+
+
+class PlanStep(NamedTuple):
+    operation: str
+    operands: Tuple[PlanOperand, ...]
+
+
+class ExpressionPlan(NamedTuple):
+    expression: str
+    steps: Tuple[PlanStep, ...]
+
+
+# Python operators mapped to registered operations. Left-associative chains of
+# these (e.g. "1 - 2 - 3") become a single step, since every registered
+# operation folds its operands from the left.
+_BINARY_OPERATIONS: Dict[Type[ast.operator], str] = {
+    ast.Add: "sum",
+    ast.Sub: "subtract",
+    ast.Mult: "multiply",
+    ast.Div: "divide",
+    ast.Mod: "modulo",
+    ast.Pow: "power",
+}
+
+# "**" is right-associative ("2 ** 3 ** 2" is 2 ** 9), unlike the power fold.
+_CHAINABLE = frozenset({ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod})
+
+_SYMBOLS = str.maketrans({"×": "*", "÷": "/", "−": "-"})
+_OPERATOR_SPACING = re.compile(r"\s*([-+*/%^(),])\s*")
+
+
+def _strip_operator_spacing(match: "re.Match[str]") -> str:
+    operator = match.group(1)
+    following = match.string[match.end() : match.end() + 1]
+    if operator in "*/" and following in ("*", "/") and match.end() > match.end(1):
+        # Spaced operators stay apart: "2 * * 3" is malformed, not the power "2**3".
+        return operator + " "
+    return operator
+
+
+def normalize_expression(expression: str) -> str:
+    """
+    Returns the canonical text of an expression, used as its plan cache key.
+
+    Whitespace around operators is dropped and the usual alternative symbols
+    ("^", "×", "÷") are rewritten, so equivalent spellings share one plan.
+
+    Args:
+        expression (str): The raw expression.
+
+    Returns:
+        str: The normalized expression.
+    """
+    text = expression.translate(_SYMBOLS).strip()
+    text = _OPERATOR_SPACING.sub(_strip_operator_spacing, text)
+    return text.replace("^", "**")
+
+
+class ExpressionCompiler:
+    """
+    Compiles arithmetic expressions into evaluation plans over the registered operations.
+
+    Expressions are parsed with Python's `ast` module and only numbers, the
+    arithmetic operators, parentheses and calls to registered operations (e.g.
+    `mean(1, 2, 3)`) are accepted. Compiled plans are immutable, so they are kept
+    in a plain LRU dict by normalized text and shared without copies.
+
+    Attributes:
+        logger (LoggerManager): Logger instance for recording compilation results.
+        max_plans (int): Maximum number of plans kept; the least recently used is evicted first.
+        hits (int): Number of expressions served from the plan cache.
+        misses (int): Number of expressions compiled.
+    """
+
+    def __init__(
+        self,
+        max_plans: Optional[int] = None,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self.logger = logger or LOGGER
+        self.max_plans = max_plans or get_settings().cache.plan_max_size
+        self._plans: "OrderedDict[str, ExpressionPlan]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def compile(self, expression: str) -> ExpressionPlan:
+        """
+        Returns the evaluation plan of an expression, compiling it on a cache miss.
+
+        Args:
+            expression (str): The arithmetic expression.
+
+        Returns:
+            ExpressionPlan: The normalized expression and its ordered steps.
+
+        Raises:
+            ValueError: If the expression is too long, malformed, uses an unsupported
+            element or contains no operation.
+        """
+        if len(expression) > MAX_EXPRESSION_LENGTH:
+            raise ValueError("Expression is too long.")
+
+        text = normalize_expression(expression)
+        with self._lock:
+            plan = self._plans.get(text)
+            if plan is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._plans.move_to_end(text)
+                return plan
+
+        try:
+            tree = ast.parse(text, mode="eval")
+        except (SyntaxError, RecursionError, MemoryError):
+            raise ValueError("Malformed expression.") from None
+
+        steps: List[PlanStep] = []
+        self._compile_node(tree.body, steps)
+        if not steps:
+            raise ValueError("Expression must contain at least one operation.")
+
+        plan = ExpressionPlan(text, tuple(steps))
+        with self._lock:
+            self._plans[text] = plan
+            while len(self._plans) > self.max_plans:
+                self._plans.popitem(last=False)
+        self.logger.log_debug(
+            "[expression] compiled %r into %d steps", text, len(steps)
+        )
+        return plan
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the plan cache counters.
+
+        Returns:
+            Dict[str, float]: Hits, misses, hit rate and size of the plan cache.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._plans),
+        }
+
+    def _compile_node(self, node: ast.AST, steps: List[PlanStep]) -> PlanOperand:
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, (int, float)) and not isinstance(
+                node.value, bool
+            ):
+                return node.value
+            raise ValueError("Expression operands must be numbers.")
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self._compile_node(node.operand, steps)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            if isinstance(operand, StepRef):
+                return self._emit(steps, "subtract", (0, operand))
+            return -operand
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATIONS:
+            operand_nodes = [node.right]
+            while (
+                type(node.op) in _CHAINABLE
+                and isinstance(node.left, ast.BinOp)
+                and type(node.left.op) is type(node.op)
+            ):
+                node = node.left
+                operand_nodes.append(node.right)
+            operand_nodes.append(node.left)
+            operands = tuple(
+                self._compile_node(child, steps) for child in reversed(operand_nodes)
+            )
+            return self._emit(steps, _BINARY_OPERATIONS[type(node.op)], operands)
+
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and get_operation(node.func.id) is not None
+            and not node.keywords
+        ):
+            if len(node.args) < 2:
+                raise ValueError(f"'{node.func.id}' requires at least two operands.")
+            operands = tuple(self._compile_node(arg, steps) for arg in node.args)
+            return self._emit(steps, node.func.id, operands)
+
+        raise ValueError(f"Unsupported expression element: {ast.unparse(node)!r}")
+
+    @staticmethod
+    def _emit(
+        steps: List[PlanStep], operation: str, operands: Tuple[PlanOperand, ...]
+    ) -> StepRef:
+        if len(steps) >= MAX_EXPRESSION_STEPS:
+            raise ValueError("Expression has too many operations.")
+        steps.append(PlanStep(operation, operands))
+        return StepRef(len(steps) - 1)
+
+
+class ExpressionEvaluator:
+    """
+    Runs compiled expression plans with the ChallengeEngine primitives.
+
+    Every step goes through the ChallengeValidator checks (e.g. no division by zero)
+    with its resolved operands, exactly as a single-operation tool call would.
+
+    Attributes:
+        engine (ChallengeEngine): Engine executing the plan steps.
+        validator (ChallengeValidator): Validator applied before each step.
+        compiler (ExpressionCompiler): Compiler and plan cache.
+        logger (LoggerManager): Logger instance for recording evaluation steps.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[ChallengeEngine] = None,
+        validator: Optional[ChallengeValidator] = None,
+        compiler: Optional[ExpressionCompiler] = None,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self.engine = engine or ChallengeEngine()
+        self.validator = validator or ChallengeValidator()
+        self.compiler = compiler or ExpressionCompiler()
+        self.logger = logger or LOGGER
+        self._handlers: Dict[str, Callable[[List[Number]], Number]] = {
+            name: self.engine.get_handler(name) for name in operation_names()
+        }
+
+    def evaluate(self, expression: str) -> Number:
+        """
+        Compiles (or fetches from the plan cache) and evaluates an expression.
+
+        Args:
+            expression (str): The arithmetic expression.
+
+        Returns:
+            Number: The value of the expression.
+
+        Raises:
+            ValueError: If the expression cannot be compiled or a step fails validation.
+        """
+        plan = self.compiler.compile(expression)
+        results: List[Number] = []
+        for step in plan.steps:
+            operands = [
+                results[operand.index] if isinstance(operand, StepRef) else operand
+                for operand in step.operands
+            ]
+            if not self.validator.validate(step.operation, operands):
+                raise ValueError("Invalid operation or operands.")
+            results.append(self._handlers[step.operation](operands))
+
+        self.logger.log_debug(
+            "[expression] %r evaluated in %d steps", plan.expression, len(plan.steps)
+        )
+        return results[-1]
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from app.logs.setup_logger import LoggerManager, LOGGER
+from app.settings.setting import OpenAISettings, get_settings
+
+if TYPE_CHECKING:
+    import httpx
+
+    from langchain_core.language_models import BaseChatModel
+
+
+class LLMClientProvider:
+    """
+    Process-wide owner of the chat model and its pooled HTTP transport.
+
+    The client is created once, on first use (or on startup when warmup is
+    enabled), and its keep-alive connection pool is shared by every agent, so
+    requests do not pay for a new client or TLS handshake. httpx and the LangChain
+    libraries are only imported at that point, keeping them off the cold start of
+    processes that never serve a prompt.
+
+    Calls made through `track` are counted, so shutdown can wait for in-flight
+    calls to finish before the pool is closed.
+
+    Attributes:
+        settings (OpenAISettings): OpenAI settings, including pool limits and timeouts.
+        logger (LoggerManager): Logger instance for recording client lifecycle events.
+        in_flight (int): Number of model calls currently running.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[OpenAISettings] = None,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self._settings = settings
+        self.logger = logger or LOGGER
+        self._http_client: Optional["httpx.AsyncClient"] = None
+        self._chat_model: Optional["BaseChatModel"] = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def settings(self) -> OpenAISettings:
+        if self._settings is None:
+            self._settings = get_settings().openai
+        return self._settings
+
+    @property
+    def chat_model(self) -> "BaseChatModel":
+        """
+        The shared chat model, created on first access.
+        """
+        self._ensure_client()
+        return self._chat_model
+
+    async def start(self) -> None:
+        """
+        When warmup is enabled, creates the client and primes a pooled connection.
+
+        Otherwise nothing is done, and the client is created by the first prompt.
+        """
+        if self.settings.warmup:
+            await self.warmup()
+
+    async def warmup(self) -> None:
+        """
+        Opens a keep-alive connection to the API by listing the available models.
+
+        Failures are logged and ignored: the first request will open the connection instead.
+        """
+        import httpx
+
+        self._ensure_client()
+        try:
+            response = await self._http_client.get(
+                f"{self._base_url()}/models",
+                headers={"Authorization": f"Bearer {self.settings.api_key}"},
+            )
+            self.logger.log_info(
+                "[llm] warmup finished with status %d", response.status_code
+            )
+        except httpx.HTTPError as e:
+            self.logger.log_error("[llm] warmup failed: %s", e)
+
+    @asynccontextmanager
+    async def track(self) -> AsyncIterator[None]:
+        """
+        Counts a model call as in flight for the duration of the block.
+        """
+        self.in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if self.in_flight == 0:
+                self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        Waits for the in-flight model calls to finish.
+
+        Args:
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            bool: True if every call finished, False if the timeout expired first.
+        """
+        if self.in_flight:
+            self.logger.log_info("[llm] draining %d in-flight calls", self.in_flight)
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.logger.log_error(
+                "[llm] %d calls still in flight after %.1fs", self.in_flight, timeout
+            )
+            return False
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled connections. A later access creates a new client.
+        """
+        with self._lock:
+            http_client, self._http_client = self._http_client, None
+            self._chat_model = None
+        if http_client is not None:
+            await http_client.aclose()
+
+    def _ensure_client(self) -> None:
+        if self._chat_model is None:
+            with self._lock:
+                if self._chat_model is None:
+                    self._chat_model = self._build_chat_model()
+
+    def _build_chat_model(self) -> "BaseChatModel":
+        import httpx
+
+        from langchain_openai import ChatOpenAI
+
+        settings = self.settings
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(settings.timeout, connect=settings.connect_timeout),
+        )
+        self.logger.log_info("[llm] chat model client created")
+        return ChatOpenAI(
+            model=settings.model_name,
+            api_key=settings.api_key,
+            base_url=settings.base_url,
+            timeout=settings.timeout,
+            # Retries are made by the admission controller, with jittered backoff
+            # and within the concurrency limit.
+            max_retries=0,
+            temperature=0,
+            http_async_client=self._http_client,
+        )
+
+    def _base_url(self) -> str:
+        return (self.settings.base_url or "https://api.openai.com/v1").rstrip("/")
+
+
+LLM_CLIENT = LLMClientProvider()
@@ -0,0 +1,289 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from app.schemas.schema import Number, Precision
+from app.logs.setup_logger import LoggerManager, LOGGER
+from app.core.engine import ChallengeEngine, to_fraction, tree_reduce
+from app.core.registry import get_operation
+from app.metrics.metrics import METRICS
+from app.settings.setting import OffloadSettings, get_settings
+
+# Every integer up to this magnitude is exactly a float64, so operand lists mixing
+# ints and floats can share a float64 buffer without changing any value.
+EXACT_FLOAT_BOUND = 2**53
+
+
+def _read_operands(name: str, dtype: str, start: int, stop: int) -> List[Number]:
+    """
+    Copies a slice of a shared operand buffer into a list of Python numbers.
+
+    Runs in the worker processes; the parent owns the block and unlinks it.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray(
+            (stop - start,),
+            dtype=dtype,
+            buffer=block.buf,
+            offset=start * np.dtype(dtype).itemsize,
+        )
+        values = view.tolist()
+        # The view must be released before the block can be closed.
+        del view
+        return values
+    finally:
+        block.close()
+
+
+def _reduce_exact_chunk(
+    operation: str, name: str, dtype: str, start: int, stop: int
+) -> Any:
+    values = _read_operands(name, dtype, start, stop)
+    if dtype == "float64":
+        values = [to_fraction(value) for value in values]
+    # int64 operands stay ints: they combine exactly and faster than Fractions.
+    return tree_reduce(values, get_operation(operation).exact_combine)
+
+
+def _reduce_exact_list(operation: str, operands: List[Number]) -> Union[Number, str]:
+    return ChallengeEngine().reduce_with_precision(operation, operands, "exact")
+
+
+def _combine_exact(
+    operation: str, first: Any, partials: List[Any], count: int
+) -> Union[Number, str]:
+    combined = tree_reduce(partials, get_operation(operation).exact_combine)
+    return ChallengeEngine().combine_exact(operation, first, combined, count)
+
+
+class ReductionOffloader:
+    """
+    Runs large exact reductions on a pool of worker processes instead of the event loop.
+
+    Exact arithmetic costs microseconds per operand (Fraction conversion, growing
+    big-integer products) and holds the GIL, so a request with thousands of operands
+    stalls every other request of the worker. Such jobs are sent to a
+    `ProcessPoolExecutor`, with the operands copied once into shared memory: each
+    worker process reads its slice of the buffer instead of receiving a pickled list.
+
+    The operands after the first one are split into one chunk per worker, each
+    reduced as a balanced tree with the operation's associative `exact_combine`;
+    the partial results are then combined in a single worker. Exact arithmetic does
+    not depend on grouping, so results are identical to the inline path.
+
+    Native float folds are not offloaded: they cost nanoseconds per operand, less
+    than copying the operands into a buffer on the event loop.
+
+    Operand lists that do not fit an int64 or float64 buffer without changing a
+    value (huge integers, ints mixed with floats beyond 2**53, NaN or infinities)
+    are pickled to a single worker, which reduces them with
+    `ChallengeEngine.reduce_with_precision`: big-integer products are the slowest
+    exact jobs, so they must not run on the event loop either.
+
+    The pool is created on the first offloaded job, with the "spawn" start method
+    so workers do not inherit the event loop and threads of the server. A worker
+    that dies (e.g. killed for memory on a huge product) breaks the pool: the job
+    fails, the pool is dropped and the next job starts a new one.
+
+    Attributes:
+        settings (OffloadSettings): Size threshold, chunk size and pool size.
+        logger (LoggerManager): Logger instance for recording offload decisions.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[OffloadSettings] = None,
+        max_workers: Optional[int] = None,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self._settings = settings
+        self._max_workers = max_workers
+        self.logger = logger or LOGGER
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def settings(self) -> OffloadSettings:
+        if self._settings is None:
+            self._settings = get_settings().offload
+        return self._settings
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Size of the pool.
+
+        A configured value of 0 or less shares the CPU cores between the pools of
+        the `APP_WORKERS` server processes (each of which has its own pool), so the
+        host runs about one pool process per core rather than one per core per
+        server process.
+        """
+        if self._max_workers is None:
+            workers = self.settings.max_workers
+            if workers <= 0:
+                cores = os.cpu_count() or 1
+                servers = get_settings().env.workers
+                workers = max(1, cores // servers) if servers > 0 else 1
+            self._max_workers = workers
+        return self._max_workers
+
+    def should_offload(
+        self, operation: str, operands: List[Number], precision: Optional[Precision]
+    ) -> bool:
+        """
+        Tells whether a request is large enough to be worth a round trip to the pool.
+
+        Only exact reductions of operations with an `exact_combine` step qualify.
+
+        Args:
+            operation (str): The operation name.
+            operands (List[Number]): The operands of the request.
+            precision (Optional[Precision]): The precision mode.
+
+        Returns:
+            bool: Whether the request should go through `reduce_exact`.
+        """
+        if not self.settings.enabled or precision != "exact":
+            return False
+        spec = get_operation(operation)
+        return (
+            spec is not None
+            and spec.exact_combine is not None
+            and len(operands) >= self.settings.min_operands
+        )
+
+    async def reduce_exact(
+        self, operation: str, operands: List[Number]
+    ) -> Union[Number, str]:
+        """
+        Reduces the operands exactly on the process pool.
+
+        Results are formatted in the worker like the inline path: a big-integer
+        product beyond the int-to-str digit limit comes back as its decimal string,
+        ready to be encoded, instead of an int the response could not serialize.
+
+        Args:
+            operation (str): The operation name; it must have an `exact_combine` step.
+            operands (List[Number]): The operands of the request.
+
+        Returns:
+            Union[Number, str]: The result of `ChallengeEngine.reduce_with_precision`
+            in "exact" mode, including its decimal string form for huge integers.
+
+        Raises:
+            ValueError: If the operation is unknown or a divisor is zero.
+        """
+        array = self._to_array(operands)
+        if array is None:
+            METRICS.increment(
+                "challenge_offload_reductions_total", (operation, "pickled")
+            )
+            self.logger.log_debug(
+                "[offload] '%s' operands cannot be shared, pickling them", operation
+            )
+            return await self._run(_reduce_exact_list, operation, operands)
+
+        block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        try:
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            METRICS.increment(
+                "challenge_offload_reductions_total", (operation, "process")
+            )
+            return await self._reduce_chunks(
+                operation, operands[0], block.name, array.dtype.name, array.size
+            )
+        finally:
+            block.close()
+            block.unlink()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the pool state.
+
+        Returns:
+            Dict[str, Any]: The pool size and whether the pool has been started.
+        """
+        return {"max_workers": self.max_workers, "started": self._pool is not None}
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes, cancelling the jobs that have not started yet.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            self.logger.log_info("[offload] shutting down the process pool")
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    async def _reduce_chunks(
+        self, operation: str, first: Number, name: str, dtype: str, size: int
+    ) -> Union[Number, str]:
+        chunks = max(1, min(self.max_workers, (size - 1) // self.settings.min_chunk))
+        bounds = np.linspace(1, size, chunks + 1, dtype=np.int64).tolist()
+        self.logger.log_debug(
+            "[offload] exact '%s' of %d operands in %d chunks", operation, size, chunks
+        )
+        partials = await asyncio.gather(
+            *(
+                self._run(_reduce_exact_chunk, operation, name, dtype, start, stop)
+                for start, stop in zip(bounds, bounds[1:])
+            )
+        )
+        return await self._run(
+            _combine_exact, operation, to_fraction(first), partials, size
+        )
+
+    async def _run(self, function: Any, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        try:
+            return await loop.run_in_executor(pool, partial(function, *args))
+        except BrokenProcessPool:
+            self._drop_pool(pool)
+            raise
+
+    def _drop_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            # Concurrent jobs of the same broken pool must not drop its replacement.
+            if self._pool is not pool:
+                return
+            self._pool = None
+        self.logger.log_error("[offload] a worker process died, restarting the pool")
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self.logger.log_info(
+                    "[offload] starting a process pool of %d workers", self.max_workers
+                )
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    @staticmethod
+    def _to_array(operands: List[Number]) -> Optional[np.ndarray]:
+        try:
+            array = np.asarray(operands)
+        except (OverflowError, TypeError, ValueError):
+            return None
+        if array.dtype == np.int64:
+            return array
+        if array.dtype == np.float64 and np.abs(array).max() < EXACT_FLOAT_BOUND:
+            return array
+        return None
+
+
+OFFLOADER = ReductionOffloader()
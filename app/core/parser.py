@@ -0,0 +1,137 @@
+import re
+import threading
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Pattern, Tuple
+
+from app.schemas.schema import Number
+from app.logs.setup_logger import LoggerManager, LOGGER
+
+
+class ParsedOperation(NamedTuple):
+    operation: str
+    operands: List[Number]
+
+
+_NUMBER = r"(-?\d+(?:\.\d+)?)"
+
+_FILLER = re.compile(
+    r"^(?:(?:please|can you|could you|what is|what's|whats|how much is|calculate|"
+    r"compute|tell me|give me|the result of|result of)\s+)+"
+)
+
+# Each rule maps a full-prompt pattern to an operation and the order in which the
+# captured numbers become operands.
+_RULES: List[Tuple[Pattern, str, Callable[[List[Number]], List[Number]]]] = [
+    (re.compile(rf"{_NUMBER}\s*(?:\+|plus)\s*{_NUMBER}"), "sum", list),
+    (
+        re.compile(
+            rf"(?:add(?:ing)?|sum(?:ming)?)\s+{_NUMBER}\s+(?:and|to|plus)\s+{_NUMBER}"
+        ),
+        "sum",
+        list,
+    ),
+    (re.compile(rf"(?:the\s+)?sum\s+of\s+{_NUMBER}\s+and\s+{_NUMBER}"), "sum", list),
+    (re.compile(rf"{_NUMBER}\s*(?:-|minus)\s*{_NUMBER}"), "subtract", list),
+    (
+        re.compile(rf"subtract(?:ing)?\s+{_NUMBER}\s+from\s+{_NUMBER}"),
+        "subtract",
+        lambda n: n[::-1],
+    ),
+    (
+        re.compile(rf"(?:the\s+)?difference\s+between\s+{_NUMBER}\s+and\s+{_NUMBER}"),
+        "subtract",
+        list,
+    ),
+    (
+        re.compile(rf"{_NUMBER}\s*(?:\*|x|times|multiplied\s+by)\s*{_NUMBER}"),
+        "multiply",
+        list,
+    ),
+    (
+        re.compile(rf"multiply(?:ing)?\s+{_NUMBER}\s+(?:and|by|with)\s+{_NUMBER}"),
+        "multiply",
+        list,
+    ),
+    (
+        re.compile(rf"(?:the\s+)?product\s+of\s+{_NUMBER}\s+and\s+{_NUMBER}"),
+        "multiply",
+        list,
+    ),
+    (re.compile(rf"{_NUMBER}\s*(?:/|divided\s+by|over)\s*{_NUMBER}"), "divide", list),
+    (re.compile(rf"divid(?:e|ing)\s+{_NUMBER}\s+by\s+{_NUMBER}"), "divide", list),
+    (
+        re.compile(rf"(?:the\s+)?quotient\s+of\s+{_NUMBER}\s+(?:and|by)\s+{_NUMBER}"),
+        "divide",
+        list,
+    ),
+]
+
+
+class FastPathParser:
+    """
+    Rule-based extractor mapping simple arithmetic prompts to an operation and its operands.
+
+    A prompt is only accepted when it matches a rule in full (after dropping polite
+    filler such as "what is" and trailing punctuation), so anything ambiguous is
+    left to the LLM agent.
+
+    Attributes:
+        logger (LoggerManager): Logger instance for recording parsing results.
+        hits (int): Number of prompts resolved by the fast path.
+        misses (int): Number of prompts left to the LLM agent.
+    """
+
+    def __init__(self, logger: Optional[LoggerManager] = None):
+        self.logger = logger or LOGGER
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+    def parse(self, prompt: str) -> Optional[ParsedOperation]:
+        """
+        Tries to extract the operation and operands from the prompt.
+
+        Args:
+            prompt (str): The user prompt.
+
+        Returns:
+            Optional[ParsedOperation]: The operation and operands, or None when the
+            prompt is not confidently recognized.
+        """
+        text = " ".join(prompt.lower().split()).rstrip("?!. ")
+        text = _FILLER.sub("", text)
+
+        parsed = None
+        for pattern, operation, order in _RULES:
+            match = pattern.fullmatch(text)
+            if match:
+                operands = [self._to_number(group) for group in match.groups()]
+                parsed = ParsedOperation(operation, order(operands))
+                break
+
+        with self._counter_lock:
+            if parsed is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        self.logger.log_debug("[parser] fast path result for %r: %s", prompt, parsed)
+        return parsed
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the fast-path counters.
+
+        Returns:
+            Dict[str, float]: Hits, misses and hit rate of the fast path.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    @staticmethod
+    def _to_number(value: str) -> Number:
+        return float(value) if "." in value else int(value)
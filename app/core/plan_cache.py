@@ -0,0 +1,440 @@
+import asyncio
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from app.schemas.schema import Number
+from app.logs.setup_logger import LoggerManager, LOGGER
+from app.core.cache import normalize_prompt
+from app.core.expression import EXPRESSION_TOOL_NAME
+from app.core.registry import operation_names
+from app.metrics.metrics import METRICS
+from app.settings.setting import PlanCacheSettings, get_settings
+
+# A numeric literal standing on its own: not part of a word ("mp3"), not the
+# right-hand side of a binary minus ("10-3" holds 10 and 3), not followed by more
+# digits or letters ("3rd").
+_LITERAL = re.compile(r"(?<![\w.)])-?\d+(?:\.\d+)?(?![\w.])")
+_PLACEHOLDER = "#"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    template TEXT PRIMARY KEY,
+    plan TEXT NOT NULL,
+    confirmations INTEGER NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    last_used REAL NOT NULL
+)
+"""
+
+# A plan is a list of tool calls whose numeric arguments are prompt slots:
+#   {"tool": "multiply", "operands": [0, 1]}
+#   {"tool": "evaluate_expression", "expression": "({0} + {1}) * {2}"}
+ToolPlan = List[Dict[str, Any]]
+
+
+class PromptTemplate(NamedTuple):
+    """A normalized prompt whose numeric literals are replaced by placeholders."""
+
+    text: str
+    numbers: Tuple[Number, ...]
+
+
+def _to_number(literal: str) -> Number:
+    return float(literal) if "." in literal else int(literal)
+
+
+def templatize(prompt: str) -> Optional[PromptTemplate]:
+    """
+    Splits a prompt into its template and its numeric literals.
+
+    The prompt is normalized as for the response cache key, so "What is 3 times 7?" and
+    "what is 12 times 9" share the template "what is # times #".
+
+    Args:
+        prompt (str): The user prompt.
+
+    Returns:
+        Optional[PromptTemplate]: The template, or None when the prompt holds no number.
+    """
+    normalized = normalize_prompt(prompt)
+    literals = _LITERAL.findall(normalized)
+    if not literals:
+        return None
+    return PromptTemplate(
+        text=_LITERAL.sub(_PLACEHOLDER, normalized),
+        numbers=tuple(_to_number(literal) for literal in literals),
+    )
+
+
+def _slot(value: Any, numbers: Tuple[Number, ...]) -> Optional[int]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    matches = [index for index, number in enumerate(numbers) if number == value]
+    # A value appearing twice in the prompt cannot be traced back to one slot.
+    return matches[0] if len(matches) == 1 else None
+
+
+def extract_plan(
+    tool_calls: List[Dict[str, Any]], numbers: Tuple[Number, ...]
+) -> Optional[ToolPlan]:
+    """
+    Generalizes the tool calls the model made for a prompt into a plan over its slots.
+
+    Every numeric argument must be one of the prompt numbers, found at a single
+    position; calls using constants or intermediate results the prompt does not
+    spell out cannot be generalized.
+
+    Args:
+        tool_calls (List[Dict[str, Any]]): The tool calls, each with its `name` and `args`.
+        numbers (Tuple[Number, ...]): The numbers of the prompt, in order.
+
+    Returns:
+        Optional[ToolPlan]: The plan, or None when the calls cannot be generalized.
+    """
+    operations = set(operation_names())
+    plan: ToolPlan = []
+    for call in tool_calls:
+        name, args = call["name"], call["args"]
+
+        if name == EXPRESSION_TOOL_NAME:
+            expression = args.get("expression")
+            if (
+                not isinstance(expression, str)
+                or "{" in expression
+                or "}" in expression
+            ):
+                return None
+            slots: List[int] = []
+            for literal in _LITERAL.findall(expression):
+                slot = _slot(_to_number(literal), numbers)
+                if slot is None:
+                    return None
+                slots.append(slot)
+            pieces = iter(f"{{{slot}}}" for slot in slots)
+            plan.append(
+                {
+                    "tool": name,
+                    "expression": _LITERAL.sub(lambda _: next(pieces), expression),
+                }
+            )
+
+        elif name in operations:
+            operands = [_slot(value, numbers) for value in args.get("operands", ())]
+            if not operands or None in operands:
+                return None
+            plan.append({"tool": name, "operands": operands})
+
+        else:
+            return None
+    return plan or None
+
+
+def bind_plan(
+    plan: ToolPlan, numbers: Tuple[Number, ...]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Instantiates a plan with the numbers of a new prompt.
+
+    Args:
+        plan (ToolPlan): The cached plan.
+        numbers (Tuple[Number, ...]): The numbers of the prompt, in order.
+
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: The tool calls to execute, as (name, args).
+
+    Raises:
+        ValueError: If the plan refers to a slot the prompt does not have.
+    """
+    calls: List[Tuple[str, Dict[str, Any]]] = []
+    try:
+        for step in plan:
+            if step["tool"] == EXPRESSION_TOOL_NAME:
+                # Parenthesized, so a negative number stays one operand: "-3" in
+                # "{0}**{1}" must give (-3)**2, not -(3**2).
+                literals = [f"({number!r})" for number in numbers]
+                calls.append(
+                    (step["tool"], {"expression": step["expression"].format(*literals)})
+                )
+            else:
+                operands = [numbers[slot] for slot in step["operands"]]
+                calls.append((step["tool"], {"operands": operands}))
+    except (IndexError, KeyError) as e:
+        raise ValueError(f"Plan does not fit the prompt: {e}") from e
+    return calls
+
+
+class PromptPlanCache:
+    """
+    Persistent cache of the tool plans the LLM chose, keyed on prompt templates.
+
+    Prompts differing only in their numbers share a template ("what is # times #").
+    Once the model has picked the same plan for a template `min_confirmations`
+    times, later prompts of that template replay the plan with their own numbers
+    instead of calling the model. A `verify_rate` fraction of those hits still goes
+    to the model; a different plan replaces the cached one and its confirmations
+    start over, so a wrong generalization stops being served.
+
+    Plans are stored in SQLite (WAL mode), so warm state survives restarts and is
+    shared by the workers of a host. The least recently used templates are evicted
+    beyond `max_entries`; the table is only counted when the templates this worker
+    inserted take its size estimate past the limit. Database calls wait on disk I/O and on the writes of the
+    other workers (up to the 5 s busy timeout), so async code uses the `*_async`
+    methods, which run them in a thread instead of on the event loop.
+
+    Attributes:
+        path (str): The SQLite database file, or ":memory:".
+        max_entries (int): Maximum number of templates kept.
+        min_confirmations (int): Identical model plans required before a template is served.
+        verify_rate (float): Fraction of hits re-checked against the model.
+        logger (LoggerManager): Logger instance for recording cache events.
+        hits (int): Number of prompts answered by a cached plan.
+        misses (int): Number of prompts without a trusted plan.
+        verifications (int): Number of hits sent to the model for verification.
+        conflicts (int): Number of model plans that differed from the cached one.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_entries: int = 10000,
+        min_confirmations: int = 2,
+        verify_rate: float = 0.05,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.min_confirmations = max(min_confirmations, 1)
+        self.verify_rate = verify_rate
+        self.logger = logger or LOGGER
+        self.hits = 0
+        self.misses = 0
+        self.verifications = 0
+        self.conflicts = 0
+        self._lock = threading.Lock()
+        self._connection = self._connect(path)
+        # Size of the table, counted on open and on eviction and bumped by this
+        # worker's inserts; the other workers' inserts are found at the next count.
+        (self._size_estimate,) = self._connection.execute(
+            "SELECT COUNT(*) FROM plans"
+        ).fetchone()
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        try:
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            connection = sqlite3.connect(
+                path, timeout=5.0, check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            return connection
+        except (OSError, sqlite3.Error) as e:
+            # A read-only or corrupt file must not take the prompt route down.
+            self.logger.log_error(
+                "[plan_cache] cannot open %s, keeping plans in memory: %s", path, e
+            )
+            self.path = ":memory:"
+            connection = sqlite3.connect(
+                ":memory:", check_same_thread=False, isolation_level=None
+            )
+            connection.execute(_SCHEMA)
+            return connection
+
+    def lookup(self, template: PromptTemplate) -> Optional[ToolPlan]:
+        """
+        Returns the trusted plan of a template.
+
+        Args:
+            template (PromptTemplate): The prompt template.
+
+        Returns:
+            Optional[ToolPlan]: The plan to replay, or None when the model must be
+            called (unknown or unconfirmed template, or a hit picked for verification).
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT plan, confirmations FROM plans WHERE template = ?",
+                (template.text,),
+            ).fetchone()
+
+            if row is None or row[1] < self.min_confirmations:
+                self.misses += 1
+                outcome = "miss"
+            elif random.random() < self.verify_rate:
+                self.verifications += 1
+                outcome = "verify"
+            else:
+                self.hits += 1
+                outcome = "hit"
+                self._connection.execute(
+                    "UPDATE plans SET hits = hits + 1, last_used = ? WHERE template = ?",
+                    (time.time(), template.text),
+                )
+
+        METRICS.increment("challenge_plan_cache_lookups_total", (outcome,))
+        if outcome != "hit":
+            return None
+        self.logger.log_debug("[plan_cache] hit for template: %s", template.text)
+        return json.loads(row[0])
+
+    async def lookup_async(self, template: PromptTemplate) -> Optional[ToolPlan]:
+        """
+        Async variant of `lookup`, run in a thread.
+
+        Args:
+            template (PromptTemplate): The prompt template.
+
+        Returns:
+            Optional[ToolPlan]: The plan to replay, or None when the model must be called.
+        """
+        return await asyncio.to_thread(self.lookup, template)
+
+    def record(
+        self, template: PromptTemplate, tool_calls: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Records the tool calls the model made for a prompt of the template.
+
+        A plan identical to the cached one adds a confirmation; a different plan
+        replaces it with a single confirmation. Calls that cannot be generalized
+        are ignored.
+
+        Args:
+            template (PromptTemplate): The prompt template.
+            tool_calls (List[Dict[str, Any]]): The tool calls, each with its `name` and `args`.
+        """
+        plan = extract_plan(tool_calls, template.numbers)
+        if plan is None:
+            return
+        encoded = json.dumps(plan, sort_keys=True)
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT plan FROM plans WHERE template = ?", (template.text,)
+            ).fetchone()
+            if row is not None and row[0] == encoded:
+                self._connection.execute(
+                    "UPDATE plans SET confirmations = confirmations + 1, last_used = ? "
+                    "WHERE template = ?",
+                    (now, template.text),
+                )
+                return
+
+            if row is not None:
+                self.conflicts += 1
+                self.logger.log_info(
+                    "[plan_cache] model changed its plan for template: %s",
+                    template.text,
+                )
+                METRICS.increment("challenge_plan_cache_conflicts_total", ())
+            else:
+                self._size_estimate += 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO plans (template, plan, confirmations, hits, last_used) "
+                "VALUES (?, ?, 1, 0, ?)",
+                (template.text, encoded, now),
+            )
+            if self._size_estimate > self.max_entries:
+                self._evict()
+
+    async def record_async(
+        self, template: PromptTemplate, tool_calls: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Async variant of `record`, run in a thread.
+
+        Args:
+            template (PromptTemplate): The prompt template.
+            tool_calls (List[Dict[str, Any]]): The tool calls, each with its `name` and `args`.
+        """
+        await asyncio.to_thread(self.record, template, tool_calls)
+
+    def _evict(self) -> None:
+        (size,) = self._connection.execute("SELECT COUNT(*) FROM plans").fetchone()
+        if size > self.max_entries:
+            self._connection.execute(
+                "DELETE FROM plans WHERE template IN "
+                "(SELECT template FROM plans ORDER BY last_used LIMIT ?)",
+                (size - self.max_entries,),
+            )
+        self._size_estimate = min(size, self.max_entries)
+
+    def invalidate(self, template: PromptTemplate) -> None:
+        """
+        Drops the plan of a template, e.g. after it failed to replay.
+
+        Args:
+            template (PromptTemplate): The prompt template.
+        """
+        with self._lock:
+            deleted = self._connection.execute(
+                "DELETE FROM plans WHERE template = ?", (template.text,)
+            ).rowcount
+            self._size_estimate = max(self._size_estimate - deleted, 0)
+
+    async def invalidate_async(self, template: PromptTemplate) -> None:
+        """
+        Async variant of `invalidate`, run in a thread.
+
+        Args:
+            template (PromptTemplate): The prompt template.
+        """
+        await asyncio.to_thread(self.invalidate, template)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit rate, verifications, conflicts and stored templates.
+        """
+        with self._lock:
+            (size,) = self._connection.execute("SELECT COUNT(*) FROM plans").fetchone()
+        total = self.hits + self.misses + self.verifications
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "verifications": self.verifications,
+            "conflicts": self.conflicts,
+            "size": size,
+        }
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+def build_plan_cache(
+    settings: Optional[PlanCacheSettings] = None,
+) -> Optional[PromptPlanCache]:
+    """
+    Builds the prompt plan cache described by the plan cache settings.
+
+    Args:
+        settings (Optional[PlanCacheSettings]): The settings; read from the environment by default.
+
+    Returns:
+        Optional[PromptPlanCache]: The cache, or None when it is disabled.
+    """
+    settings = settings or get_settings().plan_cache
+    if not settings.enabled:
+        return None
+    return PromptPlanCache(
+        path=settings.path,
+        max_entries=settings.max_entries,
+        min_confirmations=settings.min_confirmations,
+        verify_rate=settings.verify_rate,
+    )
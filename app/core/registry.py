@@ -0,0 +1,226 @@
+import math
+import operator
+
+from decimal import ROUND_FLOOR, Decimal
+from fractions import Fraction
+from itertools import chain, islice
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.schemas.schema import Number
+
+
+class DivisionByZeroError(ValueError):
+    """
+    Raised when a divisor is zero, so callers can tell it apart from other value errors.
+    """
+
+    def __init__(self):
+        super().__init__("Division by zero is not allowed.")
+
+    def __reduce__(self):
+        # Rebuilt without arguments, so the error survives the trip back from a
+        # worker process.
+        return (DivisionByZeroError, ())
+
+
+class OperationSpec(NamedTuple):
+    """
+    Everything the application needs to know about one mathematical operation.
+
+    Attributes:
+        name (str): Operation name, used by the DTOs, the workflow and as LLM tool name.
+        description (str): Human readable description, used as LLM tool description.
+        step (Callable[[Number, Number], Number]): Left-fold step applied to each operand.
+        initial (Optional[Number]): Seed of the fold; None seeds it with the first operand.
+        finalize (Optional[Callable[[Number, int], Number]]): Maps the folded value and
+            the operand count to the result (e.g. for the mean).
+        engine_method (Optional[str]): Dedicated ChallengeEngine method; None uses the
+            generic fold over `step`.
+        ufunc (Optional[np.ufunc]): NumPy ufunc equivalent to `step`, used by the batch and
+            array paths; None falls back to the scalar fold.
+        float_accumulator (bool): Whether the array path accumulates in float64.
+        nonzero_divisors (bool): Validator rule rejecting zero operands after the first one.
+        compensated (Optional[Callable[[List[Number]], float]]): Correctly rounded
+            (`math.fsum`) implementation for additive operations; None uses a float fold.
+        exact_step (Optional[Callable[[Any, Any], Any]]): Step used with Fraction and
+            Decimal operands when `step` would fall back to floats.
+        exact_combine (Optional[Callable[[Any, Any], Any]]): Associative step such that the
+            exact result is `step(first, combine(rest...))`; it lets exact reductions be
+            regrouped into balanced trees and split across processes. None keeps the left fold.
+    """
+
+    name: str
+    description: str
+    step: Callable[[Number, Number], Number]
+    initial: Optional[Number] = None
+    finalize: Optional[Callable[[Number, int], Number]] = None
+    engine_method: Optional[str] = None
+    ufunc: Optional[np.ufunc] = None
+    float_accumulator: bool = False
+    nonzero_divisors: bool = False
+    compensated: Optional[Callable[[List[Number]], float]] = None
+    exact_step: Optional[Callable[[Any, Any], Any]] = None
+    exact_combine: Optional[Callable[[Any, Any], Any]] = None
+
+
+OPERATIONS: Dict[str, OperationSpec] = {}
+
+
+def register_operation(spec: OperationSpec) -> OperationSpec:
+    """
+    Registers an operation. The DTOs, validator, workflow, engine and LLM tools all
+    pick it up from the registry.
+
+    Must run at import time, before the DTO module builds its operation Literal.
+
+    Args:
+        spec (OperationSpec): The operation to register.
+
+    Returns:
+        OperationSpec: The registered operation.
+
+    Raises:
+        ValueError: If an operation with the same name is already registered.
+    """
+    if spec.name in OPERATIONS:
+        raise ValueError(f"Operation already registered: {spec.name}")
+    OPERATIONS[spec.name] = spec
+    return spec
+
+
+def get_operation(name: str) -> Optional[OperationSpec]:
+    """
+    Returns the registered operation with the given name, or None.
+    """
+    return OPERATIONS.get(name)
+
+
+def operation_names() -> Tuple[str, ...]:
+    """
+    Returns the names of the registered operations, in registration order.
+    """
+    return tuple(OPERATIONS)
+
+
+def _checked_divide(result: Number, value: Number) -> float:
+    if value == 0:
+        raise DivisionByZeroError()
+    return result / value
+
+
+def _checked_modulo(result: Number, value: Number) -> Number:
+    if value == 0:
+        raise DivisionByZeroError()
+    if isinstance(result, Decimal):
+        # Decimal's % truncates toward zero; keep the floor semantics of the
+        # float and Fraction paths so every mode agrees on the sign.
+        return result - value * (result / value).to_integral_value(ROUND_FLOOR)
+    return result % value
+
+
+def _power(result: Number, value: Number) -> float:
+    # math.pow works on floats, so huge integer exponents fail fast with an
+    # OverflowError instead of building enormous integers.
+    return math.pow(result, value)
+
+
+# Upper bound on the size of exact power results, so a single request cannot
+# build arbitrarily large numbers.
+MAX_EXACT_POWER_BITS = 1 << 20
+
+
+def _exact_power(result: Any, value: Any) -> Any:
+    if value != int(value):
+        raise ValueError("Exact power requires integer exponents.")
+    exponent = int(value)
+    if isinstance(result, Fraction):
+        bits = max(result.numerator.bit_length(), result.denominator.bit_length())
+        if bits * abs(exponent) > MAX_EXACT_POWER_BITS:
+            raise ValueError("Exact power result is too large.")
+    return result**exponent
+
+
+def _fsum_difference(operands: List[Number]) -> float:
+    return math.fsum(
+        chain((operands[0],), (-value for value in islice(operands, 1, None)))
+    )
+
+
+register_operation(
+    OperationSpec(
+        name="sum",
+        description="Adds all operands together.",
+        step=operator.add,
+        engine_method="sum_operands",
+        ufunc=np.add,
+        compensated=math.fsum,
+        exact_combine=operator.add,
+    )
+)
+register_operation(
+    OperationSpec(
+        name="subtract",
+        description="Subtracts every following operand from the first one, in order.",
+        step=operator.sub,
+        engine_method="subtract_operands",
+        ufunc=np.subtract,
+        compensated=_fsum_difference,
+        exact_combine=operator.add,
+    )
+)
+register_operation(
+    OperationSpec(
+        name="multiply",
+        description="Multiplies all operands together.",
+        step=operator.mul,
+        initial=1.0,
+        engine_method="multiply_operands",
+        ufunc=np.multiply,
+        float_accumulator=True,
+        exact_combine=operator.mul,
+    )
+)
+register_operation(
+    OperationSpec(
+        name="divide",
+        description="Divides the first operand by every following operand, in order.",
+        step=_checked_divide,
+        engine_method="divide_operands",
+        ufunc=np.divide,
+        float_accumulator=True,
+        nonzero_divisors=True,
+        exact_combine=operator.mul,
+    )
+)
+register_operation(
+    OperationSpec(
+        name="power",
+        description="Raises the first operand to the power of every following operand, in order.",
+        step=_power,
+        float_accumulator=True,
+        exact_step=_exact_power,
+    )
+)
+register_operation(
+    OperationSpec(
+        name="modulo",
+        description="Takes the remainder of the first operand divided by every following operand, in order.",
+        step=_checked_modulo,
+        ufunc=np.remainder,
+        nonzero_divisors=True,
+    )
+)
+register_operation(
+    OperationSpec(
+        name="mean",
+        description="Computes the arithmetic mean of all operands.",
+        step=operator.add,
+        finalize=lambda total, count: total / count,
+        ufunc=np.add,
+        float_accumulator=True,
+        compensated=lambda operands: math.fsum(operands) / len(operands),
+        exact_combine=operator.add,
+    )
+)
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from app.logs.setup_logger import LoggerManager, LOGGER
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent executions that share a key into a single in-flight call.
+
+    The first caller for a key (the leader) starts the execution as a task; callers
+    arriving while it runs (the followers) await the same task. Everyone receives
+    its result or its exception. The task is shielded from the waiters, so a caller
+    that times out or disconnects does not cancel the execution the others await.
+
+    Must be used from a single event loop.
+
+    Attributes:
+        timeout (Optional[float]): Maximum time, in seconds, a caller waits for the result.
+        logger (LoggerManager): Logger instance for recording coalesced calls.
+        leaders (int): Number of executions started.
+        followers (int): Number of callers served by an execution started by another caller.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        logger: Optional[LoggerManager] = None,
+    ):
+        self.timeout = timeout
+        self.logger = logger or LOGGER
+        self.leaders = 0
+        self.followers = 0
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._counter_lock = threading.Lock()
+
+    async def do(self, key: Optional[Hashable], call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs `call`, or joins the identical call already in flight.
+
+        Args:
+            key (Optional[Hashable]): The coalescing key; None always runs `call`.
+            call (Callable[[], Awaitable[T]]): Factory of the awaitable to execute.
+
+        Returns:
+            T: The result of the shared execution.
+
+        Raises:
+            TimeoutError: If the result is not available within `timeout`.
+            Exception: Any exception raised by the shared execution.
+        """
+        if key is None:
+            return await asyncio.wait_for(call(), self.timeout)
+
+        future = self._in_flight.get(key)
+        with self._counter_lock:
+            if future is None:
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.logger.log_debug("[single_flight] joined in-flight call: %s", key)
+
+        return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the coalescing counters.
+
+        Returns:
+            Dict[str, int]: Executions started, callers coalesced and calls in flight.
+        """
+        return {
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "in_flight": len(self._in_flight),
+        }
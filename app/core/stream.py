@@ -0,0 +1,77 @@
+import json
+
+from typing import List
+
+from app.schemas.schema import Number
+
+
+class NDJSONOperandDecoder:
+    """
+    Incremental decoder for operands sent as newline-delimited JSON.
+
+    Each line holds either a single number or a JSON array of numbers, so clients
+    can stream operands one by one or in chunks. Only the current partial line is
+    buffered.
+
+    Attributes:
+        max_line_bytes (int): Maximum size of a single line.
+    """
+
+    def __init__(self, max_line_bytes: int = 1 << 20):
+        self.max_line_bytes = max_line_bytes
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> List[Number]:
+        """
+        Consumes a chunk of the body and returns the operands of its complete lines.
+
+        Args:
+            chunk (bytes): The next chunk of the request body.
+
+        Returns:
+            List[Number]: The operands decoded from the lines completed by this chunk.
+
+        Raises:
+            ValueError: If a line is not a number or an array of numbers, or is too long.
+        """
+        self._buffer.extend(chunk)
+        end = self._buffer.rfind(b"\n")
+        if end == -1:
+            if len(self._buffer) > self.max_line_bytes:
+                raise ValueError("Operand line is too long.")
+            return []
+
+        lines = self._buffer[:end].split(b"\n")
+        del self._buffer[: end + 1]
+
+        operands: List[Number] = []
+        for line in lines:
+            self._decode_line(line, operands)
+        return operands
+
+    def close(self) -> List[Number]:
+        """
+        Decodes the last line when the body does not end with a newline.
+
+        Returns:
+            List[Number]: The operands of the remaining line.
+        """
+        operands: List[Number] = []
+        self._decode_line(bytes(self._buffer), operands)
+        self._buffer.clear()
+        return operands
+
+    @staticmethod
+    def _decode_line(line: bytes, operands: List[Number]) -> None:
+        if not line.strip():
+            return
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError:
+            raise ValueError("Each line must be a JSON number or array of numbers.")
+
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if isinstance(item, bool) or not isinstance(item, (int, float)):
+                raise ValueError("All operands must be numbers.")
+            operands.append(item)
@@ -0,0 +1,111 @@
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
+
+from app.schemas.schema import Number
+from app.core.engine import ChallengeEngine
+from app.core.expression import (
+    EXPRESSION_TOOL_NAME,
+    MAX_EXPRESSION_LENGTH,
+    ExpressionEvaluator,
+)
+from app.core.registry import OPERATIONS
+from app.core.validator import ChallengeValidator
+
+
+class OperandsToolInput(BaseModel):
+    operands: List[Number] = Field(
+        ..., min_length=2, description="Numbers to apply the operation to, in order."
+    )
+
+
+class ExpressionToolInput(BaseModel):
+    expression: str = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_EXPRESSION_LENGTH,
+        description="The whole arithmetic expression, e.g. '(3 + 4) * 5 / 2'.",
+    )
+
+
+EXPRESSION_TOOL_DESCRIPTION = (
+    "Evaluate a whole arithmetic expression in a single call. Supports numbers, "
+    "parentheses, + - * / % and ** (or ^), and the other operations as functions, "
+    "e.g. 'mean(2, 4, 9) * 3'. Prefer it whenever the prompt combines several "
+    "operations."
+)
+
+
+# OpenAI tool definitions generated once from the operation registry, so binding
+# the tools to a model never rebuilds their JSON schemas.
+TOOL_SCHEMAS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": spec.name,
+            "description": spec.description,
+            "parameters": OperandsToolInput.model_json_schema(),
+        },
+    }
+    for spec in OPERATIONS.values()
+] + [
+    {
+        "type": "function",
+        "function": {
+            "name": EXPRESSION_TOOL_NAME,
+            "description": EXPRESSION_TOOL_DESCRIPTION,
+            "parameters": ExpressionToolInput.model_json_schema(),
+        },
+    }
+]
+
+
+def build_challenge_tools(
+    engine: Optional[ChallengeEngine] = None,
+    validator: Optional[ChallengeValidator] = None,
+    evaluator: Optional[ExpressionEvaluator] = None,
+) -> List[StructuredTool]:
+    """
+    Exposes every registered operation, and the expression evaluator, as LLM tools.
+
+    Every tool runs the ChallengeValidator checks before calling the engine, so the
+    LLM flow keeps the same rules (e.g. no division by zero) as the operation route.
+    The expression tool applies them to each step of the compiled plan.
+
+    Args:
+        engine (Optional[ChallengeEngine]): Engine executing the operations.
+        validator (Optional[ChallengeValidator]): Validator applied before each operation.
+        evaluator (Optional[ExpressionEvaluator]): Evaluator backing the expression tool.
+
+    Returns:
+        List[StructuredTool]: One tool per operation, named after the operation, and
+        the `evaluate_expression` tool.
+    """
+    engine = engine or ChallengeEngine()
+    validator = validator or ChallengeValidator()
+    evaluator = evaluator or ExpressionEvaluator(engine, validator)
+
+    def make_tool(operation: str, handler: Callable[[List[Number]], Number]):
+        def run(operands: List[Number]) -> Number:
+            if not validator.validate(operation, operands):
+                raise ValueError("Invalid operation or operands.")
+            return handler(operands)
+
+        return StructuredTool.from_function(
+            func=run,
+            name=operation,
+            description=OPERATIONS[operation].description,
+            args_schema=OperandsToolInput,
+        )
+
+    expression_tool = StructuredTool.from_function(
+        func=evaluator.evaluate,
+        name=EXPRESSION_TOOL_NAME,
+        description=EXPRESSION_TOOL_DESCRIPTION,
+        args_schema=ExpressionToolInput,
+    )
+
+    return [make_tool(name, engine.get_handler(name)) for name in OPERATIONS] + [
+        expression_tool
+    ]
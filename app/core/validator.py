@@ -1,7 +1,11 @@
+from itertools import islice
 from typing import List, Optional
 
+import numpy as np
+
 from app.schemas.schema import Number
 from app.logs.setup_logger import LoggerManager, LOGGER
+from app.core.registry import get_operation
 
 
 class ChallengeValidator:
@@ -22,7 +26,8 @@ class ChallengeValidator:
         """
         Validates the operation and operands before performing the mathematical challenge.
 
-        For division operations, ensures that no operand (except the first) is zero.
+        The operation must be registered, and for operations with a divisor rule
+        (e.g. division), no operand except the first may be zero.
 
         Args:
             operation (str): The mathematical operation to validate (e.g., "divide").
@@ -32,13 +37,74 @@ class ChallengeValidator:
             bool: True if the operation and operands are valid, False otherwise.
         """
         self.logger.log_debug(
-            f"[validator] Validating operation '{operation}' with operands: {operands}"
+            "[validator] Validating operation '%s' with operands: %s",
+            operation,
+            operands,
+        )
+
+        spec = get_operation(operation)
+        if spec is None:
+            return self.reject_unsupported_operation(operation)
+
+        if spec.nonzero_divisors:
+            if any(value == 0 for value in islice(operands, 1, None)):
+                return self.reject_division_by_zero()
+
+        self.logger.log_debug("[validator] Validation passed")
+        return True
+
+    def reject_division_by_zero(self) -> bool:
+        """
+        Records a division by zero, whether found by `validate` or by the engine
+        during a fused validation and reduction pass.
+
+        Returns:
+            bool: Always False, the validation outcome.
+        """
+        self.logger.log_error("[validator] Division by zero detected")
+        return False
+
+    def reject_unsupported_operation(self, operation: str) -> bool:
+        """
+        Records an operation that is not in the registry.
+
+        Returns:
+            bool: Always False, the validation outcome.
+        """
+        self.logger.log_error("[validator] Unsupported operation '%s'", operation)
+        return False
+
+    def validate_array(self, operation: str, operands: np.ndarray) -> bool:
+        """
+        Validates the operation and a NumPy operand array with vectorized checks.
+
+        Applies the same rules as `validate`, plus the minimum of two operands
+        that the JSON routes enforce through their DTO.
+
+        Args:
+            operation (str): The mathematical operation to validate (e.g., "divide").
+            operands (np.ndarray): The one-dimensional operand array.
+
+        Returns:
+            bool: True if the operation and operands are valid, False otherwise.
+        """
+        self.logger.log_debug(
+            "[validator] Validating operation '%s' with %d array operands",
+            operation,
+            operands.size,
         )
 
-        if operation == "divide":
-            if any(value == 0 for value in operands[1:]):
-                self.logger.log_error("[validator] Division by zero detected")
-                return False
+        if operands.size < 2:
+            self.logger.log_error("[validator] At least two operands are required")
+            return False
+
+        spec = get_operation(operation)
+        if spec is None:
+            return self.reject_unsupported_operation(operation)
+
+        if spec.nonzero_divisors:
+            if not np.all(operands[1:]):
+                return self.reject_division_by_zero()
 
         self.logger.log_debug("[validator] Validation passed")
         return True
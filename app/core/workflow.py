@@ -1,9 +1,47 @@
-from typing import Any, Dict, Optional
+import asyncio
 
-from app.logs.setup_logger import LoggerManager, LOGGER
-from app.routes.challenge.dtos.dto import ChallengeRequestDTO
-from app.core.engine import ChallengeEngine
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+from app.schemas.schema import Number, Precision
+from app.logs.setup_logger import Lazy, LoggerManager, LOGGER
+from app.metrics.metrics import METRICS
+from app.routes.challenge.dtos.dto import (
+    ChallengeBatchRequestDTO,
+    ChallengePromptRequestDTO,
+    ChallengeRequestDTO,
+)
+from app.core.admission import OverloadedError
+from app.core.cache import ResponseCache, build_response_cache, precision_options
+from app.core.engine import ChallengeEngine, json_int
+from app.core.expression import EXPRESSION_TOOL_NAME, ExpressionEvaluator
+from app.core.offload import OFFLOADER, ReductionOffloader
+from app.core.parser import FastPathParser
+from app.core.plan_cache import (
+    PromptPlanCache,
+    PromptTemplate,
+    bind_plan,
+    build_plan_cache,
+    templatize,
+)
+from app.core.registry import DivisionByZeroError, operation_names
+from app.core.stream import NDJSONOperandDecoder
 from app.core.validator import ChallengeValidator
+from app.settings.setting import get_settings
+
+if TYPE_CHECKING:
+    from app.core.agent import ChallengeAgent, EventCallback
 
 
 class ChallengeWorkflow:
@@ -16,6 +54,11 @@ class ChallengeWorkflow:
     Attributes:
         engine (ChallengeEngine): Instance responsible for performing mathematical operations.
         validator (ChallengeValidator): Instance responsible for validating operations and operands.
+        cache (Optional[ResponseCache]): Cache of successful results, None when caching is disabled.
+        parser (Optional[FastPathParser]): Rule-based prompt parser, None when the fast path is disabled.
+        plan_cache (Optional[PromptPlanCache]): Cache of the tool plans chosen by the LLM per prompt template, None when disabled.
+        offloader (ReductionOffloader): Process pool running large exact reductions off the event loop.
+        agent (ChallengeAgent): LLM agent answering the prompts the parser cannot resolve.
         logger (LoggerManager): Logger instance for recording workflow steps and errors.
     """
 
@@ -23,17 +66,34 @@ class ChallengeWorkflow:
         self,
         engine: Optional[ChallengeEngine] = None,
         validator: Optional[ChallengeValidator] = None,
+        cache: Optional[ResponseCache] = None,
+        parser: Optional[FastPathParser] = None,
+        agent: Optional["ChallengeAgent"] = None,
+        plan_cache: Optional[PromptPlanCache] = None,
+        offloader: Optional[ReductionOffloader] = None,
         logger: Optional[LoggerManager] = None,
     ) -> None:
         self.engine = engine or ChallengeEngine()
         self.validator = validator or ChallengeValidator()
+        self.cache = cache if cache is not None else build_response_cache()
+        self.parser = parser or (
+            FastPathParser() if get_settings().openai.fast_path_enabled else None
+        )
+        self.plan_cache = plan_cache if plan_cache is not None else build_plan_cache()
+        self.offloader = offloader or OFFLOADER
+        self._agent = agent
+        self._evaluator: Optional[ExpressionEvaluator] = None
         self.logger = logger or LOGGER
+        self._handlers: Dict[str, Callable[[List[Number]], Number]] = {
+            name: self.engine.get_handler(name) for name in operation_names()
+        }
 
     def process(self, request: ChallengeRequestDTO) -> Dict[str, Any]:
         """
         Processes a challenge request by validating input and executing the specified operation.
 
-        Handles success and error cases, including logging relevant events.
+        Handles success and error cases, including logging relevant events. Successful
+        results are served from and stored in the response cache when it is enabled.
 
         Args:
             request (ChallengeRequestDTO): The incoming challenge request data.
@@ -42,30 +102,284 @@ class ChallengeWorkflow:
             Dict[str, Any]: Dictionary containing success status, message, and data (result or error details).
         """
         self.logger.log_info("[workflow] processing challenge operation")
-        self.logger.log_debug(f"[workflow] request data: {request.model_dump()}")
+        self.logger.log_debug("[workflow] request data: %s", Lazy(request.model_dump))
 
         operation = request.operation
         operands = request.operands
 
-        if not self.validator.validate(operation, operands):
+        precision = request.precision
+        decimal_precision = request.decimal_precision
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.operation_key(
+                operation, operands, *precision_options(precision, decimal_precision)
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.log_info("[workflow] operation served from cache")
+                METRICS.count_operation(operation, cached["success"])
+                return cached
+
+        with METRICS.span("engine", operation):
+            response = self._execute(operation, operands, precision, decimal_precision)
+        METRICS.count_operation(operation, response["success"])
+        if self.cache is not None:
+            self.cache.set(cache_key, response)
+        return response
+
+    async def process_async(self, request: ChallengeRequestDTO) -> Dict[str, Any]:
+        """
+        Async variant of `process`.
+
+        Validation and arithmetic are CPU-only and usually take microseconds, so they
+        run inline on the event loop instead of being sent to a thread. Exact
+        reductions large enough to stall the loop (see `ReductionOffloader`) are
+        reduced on the process pool instead; they are too large to be cached.
+
+        Args:
+            request (ChallengeRequestDTO): The incoming challenge request data.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing success status, message, and data (result or error details).
+        """
+        operation = request.operation
+        precision = request.precision
+        if not self.offloader.should_offload(operation, request.operands, precision):
+            return self.process(request)
+
+        self.logger.log_info("[workflow] offloading challenge operation")
+        with METRICS.span("engine", operation):
+            try:
+                result = await self.offloader.reduce_exact(operation, request.operands)
+                response = self._success_response(result, precision)
+            except Exception as e:
+                response = self._failure_response(e, precision)
+        METRICS.count_operation(operation, response["success"])
+        return response
+
+    async def process_prompt_async(
+        self,
+        request: ChallengePromptRequestDTO,
+        on_event: Optional["EventCallback"] = None,
+    ) -> Dict[str, Any]:
+        """
+        Processes a natural-language challenge prompt.
+
+        Simple prompts recognized by the fast-path parser are executed directly with
+        the engine tools. Prompts whose template (the prompt with its numbers
+        replaced by placeholders) has a trusted plan in the plan cache replay that
+        plan with their own numbers. Anything else is handed to the LLM agent, which
+        must answer through the same tools. Successful tool results are cached by
+        normalized prompt.
+
+        Args:
+            request (ChallengePromptRequestDTO): The incoming prompt request.
+            on_event (Optional[EventCallback]): Receiver of the agent progress events.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing success status, message, and data (result or error details).
+        """
+        self.logger.log_info("[workflow] processing challenge prompt")
+        self.logger.log_debug("[workflow] prompt: %s", request.prompt)
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.prompt_key(request.prompt)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.log_info("[workflow] prompt served from cache")
+                return cached
+
+        with METRICS.span("parser", "prompt"):
+            parsed = (
+                self.parser.parse(request.prompt) if self.parser is not None else None
+            )
+        if parsed is not None:
+            self.logger.log_info(
+                "[workflow] prompt resolved by fast path: %s", parsed.operation
+            )
+            with METRICS.span("engine", parsed.operation):
+                response = self._execute(parsed.operation, parsed.operands)
+        else:
+            template = (
+                templatize(request.prompt) if self.plan_cache is not None else None
+            )
+            response = await self._replay_cached_plan(template) if template else None
+            if response is None:
+                self.logger.log_info("[workflow] prompt sent to LLM agent")
+                with METRICS.span("agent", "prompt"):
+                    response = await self._run_agent(request.prompt, template, on_event)
+        METRICS.count_operation("prompt", response["success"])
+
+        if self.cache is not None:
+            self.cache.set(cache_key, response)
+        return response
+
+    async def stream_prompt_async(
+        self, request: ChallengePromptRequestDTO, keepalive: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Processes a prompt like `process_prompt_async`, yielding its progress as it happens.
+
+        Yields the agent events ("tool_selected", "tool_arguments", "tool_result"),
+        then ("result", response) with the workflow result. Prompts answered without
+        the agent (cache, fast path, cached plan) only yield the result. When nothing
+        happens for `keepalive` seconds, ("keepalive", {}) is yielded, so the consumer
+        can check its client is still there.
+
+        Closing the generator early (e.g. the client disconnected) cancels the
+        processing, including the in-flight LLM call and its admission slot.
+
+        Args:
+            request (ChallengePromptRequestDTO): The incoming prompt request.
+            keepalive (Optional[float]): Idle time, in seconds, before a keepalive; None disables them.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: The event name and its payload.
+
+        Raises:
+            OverloadedError: If the agent's model call was shed.
+        """
+        events: "asyncio.Queue[Tuple[str, Dict[str, Any]]]" = asyncio.Queue()
+        task = asyncio.ensure_future(
+            self.process_prompt_async(
+                request, on_event=lambda *event: events.put_nowait(event)
+            )
+        )
+        next_event: Optional["asyncio.Future[Tuple[str, Dict[str, Any]]]"] = None
+        try:
+            while not task.done() or not events.empty():
+                if not events.empty():
+                    yield events.get_nowait()
+                    continue
+                next_event = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait(
+                    {next_event, task},
+                    timeout=keepalive,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if next_event in done:
+                    yield next_event.result()
+                    continue
+                next_event.cancel()
+                if not done:
+                    yield "keepalive", {}
+            yield "result", task.result()
+
+        finally:
+            if next_event is not None:
+                next_event.cancel()
+            if not task.done():
+                self.logger.log_info("[workflow] prompt stream closed, cancelling it")
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+    async def process_stream_async(
+        self, operation: str, chunks: AsyncIterator[bytes]
+    ) -> Dict[str, Any]:
+        """
+        Processes an operation whose operands arrive as an NDJSON stream.
+
+        Operands are decoded chunk by chunk and folded into the result as they
+        arrive, so memory stays constant whatever the number of operands. Division
+        by zero is detected during the same pass.
+
+        Args:
+            operation (str): The operation to execute.
+            chunks (AsyncIterator[bytes]): The request body chunks.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing success status, message, and data (result or error details).
+        """
+        self.logger.log_info("[workflow] processing streamed operation '%s'", operation)
+
+        decoder = NDJSONOperandDecoder()
+        try:
+            reduction = self.engine.stream_reduction(operation)
+            async for chunk in chunks:
+                reduction.extend(decoder.feed(chunk))
+            reduction.extend(decoder.close())
+            result = reduction.result()
+
+        except DivisionByZeroError as e:
+            # Answered like a division by zero sent to `process`.
+            METRICS.count_operation(operation, False)
+            return self._failure_response(e, None)
+
+        except ValueError as e:
+            self.logger.log_error("[workflow] invalid streamed operands: %s", e)
+            METRICS.count_operation(operation, False)
+            return {
+                "success": False,
+                "message": "Invalid operation or operands.",
+                "data": {"error": str(e)},
+            }
+
+        except Exception as e:
+            self.logger.log_error("[workflow] error during streamed operation: %s", e)
+            METRICS.count_operation(operation, False)
+            return {
+                "success": False,
+                "message": "Error during operation execution.",
+                "data": {"error": str(e)},
+            }
+
+        self.logger.log_info(
+            "[workflow] streamed operation successful over %d operands",
+            reduction.count,
+        )
+        METRICS.count_operation(operation, True)
+        return {
+            "success": True,
+            "message": "Operation completed successfully.",
+            "data": {"result": result},
+        }
+
+    def process_array(self, operation: str, operands: np.ndarray) -> Dict[str, Any]:
+        """
+        Processes an operation over a NumPy operand array (e.g. a decoded binary body).
+
+        The array is validated and reduced with vectorized NumPy calls, without
+        converting it to a Python list. This runs inline on the event loop: a
+        million float64 operands take under a millisecond (see
+        `benchmarks/binary_vs_json.py`), less than handing the buffer to a worker.
+
+        Args:
+            operation (str): The operation to execute.
+            operands (np.ndarray): The one-dimensional operand array.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing success status, message, and data (result or error details).
+        """
+        self.logger.log_info(
+            "[workflow] processing array operation '%s' over %d operands",
+            operation,
+            operands.size,
+        )
+
+        with METRICS.span("validator", operation):
+            valid = self.validator.validate_array(operation, operands)
+        if not valid:
             self.logger.log_info("[workflow] invalid operation or operands")
+            METRICS.count_operation(operation, False)
             return {
                 "success": False,
                 "message": "Invalid operation or operands.",
                 "data": None,
             }
         try:
-            if operation == "sum":
-                result = self.engine.sum_operands(operands)
-            elif operation == "subtract":
-                result = self.engine.subtract_operands(operands)
-            elif operation == "multiply":
-                result = self.engine.multiply_operands(operands)
-            elif operation == "divide":
-                result = self.engine.divide_operands(operands)
+            with METRICS.span("engine", operation):
+                result = self.engine.reduce_array(operation, operands)
+            if isinstance(result, int):
+                result = json_int(result)
 
             self.logger.log_info("[workflow] operation successful")
-            self.logger.log_debug(f"[workflow] operation result: {result}")
+            self.logger.log_debug("[workflow] operation result: %s", result)
+            METRICS.count_operation(operation, True)
 
             return {
                 "success": True,
@@ -74,7 +388,327 @@ class ChallengeWorkflow:
             }
 
         except Exception as e:
-            self.logger.log_error(f"[workflow] error during operation: {e}")
+            self.logger.log_error("[workflow] error during operation: %s", e)
+            METRICS.count_operation(operation, False)
+            return {
+                "success": False,
+                "message": "Error during operation execution.",
+                "data": {"error": str(e)},
+            }
+
+    def process_batch(self, request: ChallengeBatchRequestDTO) -> Dict[str, Any]:
+        """
+        Processes a batch of challenge operations, executing each operation type as one vectorized group.
+
+        Every item is validated on its own, so an invalid item (e.g. a division by zero)
+        only fails that item. Valid items are grouped by operation and each group is
+        reduced by a single engine call; a group the vectorized reduction cannot
+        handle is executed item by item. Results keep the request order.
+
+        Args:
+            request (ChallengeBatchRequestDTO): The incoming batch of challenge operations.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing success status, message, and the per-item results.
+        """
+        self.logger.log_info(
+            "[workflow] processing batch of %d operations", len(request.operations)
+        )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(request.operations)
+        groups: Dict[str, List[int]] = {}
+
+        for index, item in enumerate(request.operations):
+            if item.precision is not None:
+                # Explicit precision modes are not float64-vectorizable.
+                results[index] = self._execute(
+                    item.operation,
+                    item.operands,
+                    item.precision,
+                    item.decimal_precision,
+                )
+                continue
+            with METRICS.span("validator", item.operation):
+                valid = self.validator.validate(item.operation, item.operands)
+            if not valid:
+                results[index] = {
+                    "success": False,
+                    "message": "Invalid operation or operands.",
+                    "precision": None,
+                    "data": None,
+                }
+                continue
+            groups.setdefault(item.operation, []).append(index)
+
+        for operation, indexes in groups.items():
+            try:
+                with METRICS.span("engine", operation):
+                    values = self.engine.reduce_batch(
+                        operation,
+                        [request.operations[index].operands for index in indexes],
+                    )
+                for index, value in zip(indexes, values):
+                    results[index] = {
+                        "success": True,
+                        "message": "Operation completed successfully.",
+                        "precision": None,
+                        "data": {"result": value},
+                    }
+
+            except Exception as e:
+                # A vectorized group fails as a whole (an operand out of the array
+                # range, a floating-point error); executing its items one by one
+                # keeps the error on the items that cause it.
+                self.logger.log_info(
+                    "[workflow] batch group '%s' executed per item: %s", operation, e
+                )
+                for index in indexes:
+                    results[index] = self._execute(
+                        operation, request.operations[index].operands
+                    )
+
+        for item, result in zip(request.operations, results):
+            METRICS.count_operation(item.operation, result["success"])
+
+        self.logger.log_info("[workflow] batch processed")
+        self.logger.log_debug("[workflow] batch results: %s", results)
+
+        return {
+            "success": True,
+            "message": "Batch processed.",
+            "data": {"results": results},
+        }
+
+    def register_metrics(self) -> None:
+        """
+        Exports the counters of the workflow components on the metrics registry.
+
+        The expression evaluator and the agent are built on first use; they report
+        nothing until then.
+        """
+        if self.parser is not None:
+            METRICS.register_collector("fast_path_parser", self.parser.stats)
+        if self.cache is not None:
+            METRICS.register_collector("response_cache", self.cache.stats)
+        if self.plan_cache is not None:
+            METRICS.register_collector("plan_cache", self.plan_cache.stats)
+        METRICS.register_collector(
+            "expression_evaluator",
+            lambda: self._evaluator.stats() if self._evaluator is not None else {},
+        )
+        METRICS.register_collector(
+            "agent", lambda: self._agent.stats() if self._agent is not None else {}
+        )
+
+    @property
+    def agent(self) -> "ChallengeAgent":
+        """
+        The LLM agent, built on first use so operation-only traffic never creates an LLM
+        client nor imports the LLM libraries.
+        """
+        if self._agent is None:
+            from app.core.agent import ChallengeAgent
+
+            self._agent = ChallengeAgent(engine=self.engine, validator=self.validator)
+        return self._agent
+
+    @property
+    def evaluator(self) -> ExpressionEvaluator:
+        """
+        The expression evaluator replaying cached `evaluate_expression` plans, built on first use.
+        """
+        if self._evaluator is None:
+            self._evaluator = ExpressionEvaluator(self.engine, self.validator)
+        return self._evaluator
+
+    def _execute(
+        self,
+        operation: str,
+        operands: List[Number],
+        precision: Optional[Precision] = None,
+        decimal_precision: int = 28,
+    ) -> Dict[str, Any]:
+        """
+        Validates the operands and executes the operation with the engine in a single pass.
+
+        The operation is dispatched through the handlers generated from the
+        operation registry. Zero-divisor checks run inside the engine's reduction
+        instead of in a separate validator scan; a zero divisor still produces the
+        validator's "invalid operation or operands" outcome.
+
+        Args:
+            operation (str): The operation to execute.
+            operands (List[Number]): The operands of the operation.
+            precision (Optional[Precision]): Explicit arithmetic mode; None uses the
+                operation's native handler.
+            decimal_precision (int): Significant digits used by the decimal mode.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing success status, message, and data (result or error details).
+        """
+        handler = self._handlers.get(operation)
+        if handler is not None and precision is not None:
+            handler = partial(
+                self.engine.reduce_with_precision,
+                operation,
+                precision=precision,
+                decimal_precision=decimal_precision,
+            )
+        if handler is None:
+            self.logger.log_error("[workflow] unsupported operation: %s", operation)
+            return {
+                "success": False,
+                "message": "Invalid operation or operands.",
+                "precision": precision,
+                "data": None,
+            }
+        try:
+            return self._success_response(handler(operands), precision)
+        except Exception as e:
+            return self._failure_response(e, precision)
+
+    def _success_response(
+        self, result: Any, precision: Optional[Precision]
+    ) -> Dict[str, Any]:
+        if isinstance(result, int):
+            # Native sums of huge operands can also cross the int-to-str digit limit.
+            result = json_int(result)
+        self.logger.log_info("[workflow] operation successful")
+        self.logger.log_debug("[workflow] operation result: %s", result)
+        return {
+            "success": True,
+            "message": "Operation completed successfully.",
+            "precision": precision,
+            "data": {"result": result},
+        }
+
+    def _failure_response(
+        self, error: Exception, precision: Optional[Precision]
+    ) -> Dict[str, Any]:
+        if isinstance(error, DivisionByZeroError):
+            self.validator.reject_division_by_zero()
+            self.logger.log_info("[workflow] invalid operation or operands")
+            return {
+                "success": False,
+                "message": "Invalid operation or operands.",
+                "precision": precision,
+                "data": None,
+            }
+        self.logger.log_error("[workflow] error during operation: %s", error)
+        return {
+            "success": False,
+            "message": "Error during operation execution.",
+            "precision": precision,
+            "data": {"error": str(error)},
+        }
+
+    async def _replay_cached_plan(
+        self, template: PromptTemplate
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Answers a prompt by replaying the cached plan of its template, without the LLM.
+
+        Plans are replayed through the same validator and engine calls as the tools.
+        A plan that does not fit the prompt or fails with its numbers is dropped, and
+        the prompt goes to the agent, whose answer becomes the new plan.
+
+        Args:
+            template (PromptTemplate): The template and numbers of the prompt.
+
+        Returns:
+            Optional[Dict[str, Any]]: The workflow result, or None when the agent must answer.
+        """
+        plan = await self.plan_cache.lookup_async(template)
+        if plan is None:
+            return None
+
+        with METRICS.span("plan_replay", "prompt"):
+            try:
+                results = [
+                    self._run_tool(name, args)
+                    for name, args in bind_plan(plan, template.numbers)
+                ]
+            except Exception as e:
+                self.logger.log_info(
+                    "[workflow] cached plan failed for template '%s': %s",
+                    template.text,
+                    e,
+                )
+                await self.plan_cache.invalidate_async(template)
+                return None
+
+        self.logger.log_info("[workflow] prompt resolved by cached plan")
+        return {
+            "success": True,
+            "message": "Operation completed successfully.",
+            "data": {"result": results[0] if len(results) == 1 else results},
+        }
+
+    def _run_tool(self, name: str, args: Dict[str, Any]) -> Any:
+        """
+        Executes a tool call of a cached plan, with the semantics of the LLM tools.
+
+        Args:
+            name (str): The tool name.
+            args (Dict[str, Any]): The tool arguments.
+
+        Returns:
+            Any: The tool output.
+
+        Raises:
+            ValueError: If the operation or its operands are invalid.
+        """
+        if name == EXPRESSION_TOOL_NAME:
+            return self.evaluator.evaluate(args["expression"])
+        response = self._execute(name, args["operands"])
+        if not response["success"]:
+            raise ValueError(response["message"])
+        return response["data"]["result"]
+
+    async def _run_agent(
+        self,
+        prompt: str,
+        template: Optional[PromptTemplate] = None,
+        on_event: Optional["EventCallback"] = None,
+    ) -> Dict[str, Any]:
+        """
+        Runs the LLM agent for a prompt and wraps its tool result.
+
+        The tool calls behind a successful result are recorded in the plan cache
+        under the prompt template.
+
+        Args:
+            prompt (str): The user prompt.
+            template (Optional[PromptTemplate]): The prompt template, None when the
+                plan cache is disabled or the prompt holds no number.
+            on_event (Optional[EventCallback]): Receiver of the agent progress events.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing success status, message, and data (result or error details).
+
+        Raises:
+            OverloadedError: If the agent's model call was shed, so the caller can answer 503.
+        """
+        try:
+            run = await self.agent.run_with_trace(prompt, on_event)
+            result = run.result
+            if template is not None:
+                await self.plan_cache.record_async(template, run.tool_calls)
+
+            self.logger.log_info("[workflow] agent operation successful")
+            self.logger.log_debug("[workflow] agent result: %s", result)
+
+            return {
+                "success": True,
+                "message": "Operation completed successfully.",
+                "data": {"result": result},
+            }
+
+        except OverloadedError:
+            raise
+
+        except Exception as e:
+            self.logger.log_error("[workflow] error during agent execution: %s", e)
             return {
                 "success": False,
                 "message": "Error during operation execution.",
@@ -0,0 +1,80 @@
+import logging
+import threading
+import sentry_sdk
+
+from typing import Dict
+
+
+class SentryBatchHandler(logging.Handler):
+    """
+    Logging handler that forwards error records to Sentry in deduplicated batches.
+
+    Records are grouped by their rendered message, so a flood of identical errors
+    (e.g. "Division by zero detected") becomes a single Sentry event carrying the
+    number of occurrences. Pending messages are sent when the batch is full, every
+    `flush_interval` seconds, and when the handler is closed.
+
+    Attributes:
+        batch_size (int): Number of distinct pending messages that triggers a flush.
+        flush_interval (float): Maximum time, in seconds, a message waits before being sent.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        level: int = logging.ERROR,
+    ):
+        super().__init__(level)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._pending: Dict[str, int] = {}
+        self._pending_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._run, name="sentry-batch-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Adds the record to the pending batch, flushing it once it is full.
+
+        Args:
+            record (logging.LogRecord): The error record to forward.
+        """
+        try:
+            message = record.getMessage()
+            with self._pending_lock:
+                self._pending[message] = self._pending.get(message, 0) + 1
+                full = len(self._pending) >= self.batch_size
+            if full:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """
+        Sends every pending message to Sentry, once per distinct message.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+
+        for message, occurrences in pending.items():
+            sentry_sdk.capture_message(
+                message, level="error", extras={"occurrences": occurrences}
+            )
+
+    def close(self) -> None:
+        """
+        Stops the periodic flusher and sends the remaining messages.
+        """
+        self._stop.set()
+        self._flusher.join()
+        self.flush()
+        super().close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
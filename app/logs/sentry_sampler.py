@@ -0,0 +1,40 @@
+from typing import Any, Callable, Dict
+
+from app.settings.setting import SentrySettings
+
+
+def build_traces_sampler(
+    settings: SentrySettings,
+) -> Callable[[Dict[str, Any]], float]:
+    """
+    Builds the Sentry `traces_sampler` for the configured sample rates.
+
+    Requests to the deterministic operation routes (`fast_path_routes`) are sampled
+    at `fast_path_traces_sample_rate`, which defaults to dropping them, while every
+    other transaction uses `traces_sample_rate`. Sampling decisions inherited from
+    an upstream service are always honored.
+
+    Args:
+        settings (SentrySettings): The Sentry settings holding the sample rates.
+
+    Returns:
+        Callable[[Dict[str, Any]], float]: The sampler to pass to `sentry_sdk.init`.
+    """
+    fast_path_routes = frozenset(settings.fast_path_routes)
+
+    def traces_sampler(sampling_context: Dict[str, Any]) -> float:
+        parent_sampled = sampling_context.get("parent_sampled")
+        if parent_sampled is not None:
+            return float(parent_sampled)
+
+        asgi_scope = sampling_context.get("asgi_scope") or {}
+        path = asgi_scope.get("path", "")
+        root_path = asgi_scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+
+        if path in fast_path_routes:
+            return settings.fast_path_traces_sample_rate
+        return settings.traces_sample_rate
+
+    return traces_sampler
@@ -1,10 +1,48 @@
+import atexit
 import logging
-import sentry_sdk
+import queue
+import threading
 
-from sentry_sdk.integrations.logging import LoggingIntegration
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional, Union
 
 from app.settings.setting import get_settings, Environment
 
+LogMessage = Union[str, Callable[[], str]]
+
+
+class Lazy:
+    """
+    Log argument computed only when the message is rendered.
+
+    Wraps a callable, e.g. `Lazy(request.model_dump)`, so nothing is called when
+    the level of the log call is disabled.
+    """
+
+    __slots__ = ("_call",)
+
+    def __init__(self, call: Callable[[], Any]):
+        self._call = call
+
+    def __str__(self) -> str:
+        return str(self._call())
+
+    def __repr__(self) -> str:
+        return repr(self._call())
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queue handler enqueuing records as they are, unformatted.
+
+    `QueueHandler.prepare` renders the message on the calling thread; here the
+    message, its arguments and any exception are rendered by the listener's handlers,
+    off the request path. Records never leave the process, so they need no pickling.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
 class LoggerManager:
     """
@@ -17,90 +55,235 @@ class LoggerManager:
         - Logs informational messages directly to the terminal.
         - Sends error messages to Sentry when in debug mode.
         - Supports user-specific logging by including user IDs in log messages.
+        - Optionally hands records to a background thread through a queue, with
+          batched and deduplicated Sentry submission.
+
+    Construction is free: the settings are read and the handlers installed on the
+    first log call, and the Sentry SDK is only imported and initialized by
+    `init_sentry`, called from the application lifespan.
 
     Attributes:
-        debug (bool): Flag indicating if the logger is running in debug mode.
+        debug (bool): Flag indicating if the logger is running in debug mode;
+            None until configured means "debug in the dev environment".
+        use_queue (bool): Flag indicating if records are processed by a background listener.
+        sentry_enabled (bool): Flag indicating if the Sentry SDK is initialized and used.
+        queue_listener (QueueListener): Background listener, set only in queue mode.
         logger (logging.Logger): The logger instance for managing logs.
     """
 
-    def __init__(self, debug: bool = False):
-        self.settings = get_settings()
+    def __init__(self, debug: Optional[bool] = None, use_queue: Optional[bool] = None):
         self.debug = debug
-
+        self.use_queue = use_queue
+        self.queue_listener: Optional[QueueListener] = None
+        self.sentry_enabled = False
         self.logger = logging.getLogger("logger")
-        self.logger.setLevel(logging.DEBUG if self.debug else logging.INFO)
+        self._configured = False
+        self._sentry_initialized = False
+        self._configure_lock = threading.Lock()
 
-        if not self.logger.handlers:
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.DEBUG if self.debug else logging.INFO)
+    def configure(self) -> None:
+        """
+        Reads the settings and installs the terminal (or queue) handlers.
 
-            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+        Runs once, on the first log call; later calls are no-ops.
+        """
+        with self._configure_lock:
+            if self._configured:
+                return
 
-        if not self.debug:
-            sentry_logging = LoggingIntegration(
-                level=logging.INFO, event_level=logging.ERROR
+            self.settings = get_settings()
+            if self.debug is None:
+                self.debug = self.settings.env.environment == Environment.DEV
+            if self.use_queue is None:
+                self.use_queue = self.settings.logging.use_queue
+            self.sentry_enabled = (
+                not self.debug
+                and self.settings.sentry.enabled
+                and bool(self.settings.sentry.dns)
             )
 
-            sentry_sdk.init(
-                dsn=self.settings.sentry.dns,
-                integrations=[sentry_logging],
-                send_default_pii=True,
-                traces_sample_rate=1.0,
-            )
+            self.logger.setLevel(logging.DEBUG if self.debug else logging.INFO)
+
+            if not self.logger.handlers:
+                console_handler = logging.StreamHandler()
+                console_handler.setLevel(logging.DEBUG if self.debug else logging.INFO)
+
+                formatter = logging.Formatter(
+                    "%(asctime)s - %(levelname)s - %(message)s"
+                )
+                console_handler.setFormatter(formatter)
+
+                if self.use_queue:
+                    self._start_queue_listener(console_handler)
+                else:
+                    self.logger.addHandler(console_handler)
+
+            self._configured = True
+
+    def init_sentry(self) -> None:
+        """
+        Initializes the Sentry SDK when it is enabled.
+
+        Called from the application lifespan, so the SDK is imported and started once
+        per worker process, never at import time. Later calls are no-ops.
+        """
+        self._ensure_configured()
+        if not self.sentry_enabled or self._sentry_initialized:
+            return
+
+        import sentry_sdk
+
+        from sentry_sdk.integrations.logging import LoggingIntegration
+
+        from app.logs.sentry_sampler import build_traces_sampler
+
+        # In queue mode error events are sent by SentryBatchHandler from the
+        # listener thread, so the integration only records breadcrumbs.
+        sentry_logging = LoggingIntegration(
+            level=logging.INFO,
+            event_level=None if self.use_queue else logging.ERROR,
+        )
 
-    def log_info(self, message: str, conversation_id: str = None) -> None:
+        sentry_sdk.init(
+            dsn=self.settings.sentry.dns,
+            integrations=[sentry_logging],
+            send_default_pii=self.settings.sentry.send_default_pii,
+            sample_rate=self.settings.sentry.sample_rate,
+            traces_sampler=build_traces_sampler(self.settings.sentry),
+        )
+        self._sentry_initialized = True
+
+    def log_info(
+        self, message: LogMessage, *args: Any, conversation_id: str = None
+    ) -> None:
         """
         Logs an informational message to the terminal.
 
+        The message is only built when the INFO level is enabled.
+
         Args:
-            message (str): The message to log.
+            message (LogMessage): The message, a %-style format string or a callable returning it.
+            *args (Any): Format arguments; wrap costly ones in `Lazy`.
             conversation_id (str, optional): The conversation UUID.
         """
-        log_message = (
-            f"Conversation UUID: {conversation_id} - {message}"
-            if conversation_id
-            else message
-        )
-        self.logger.info(log_message)
+        self._ensure_configured()
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(self._build_message(message, conversation_id), *args)
 
-    def log_debug(self, message: str, conversation_id: str = None) -> None:
+    def log_debug(
+        self, message: LogMessage, *args: Any, conversation_id: str = None
+    ) -> None:
         """
         Logs a debug message only when in debug mode.
 
+        Nothing is formatted or evaluated when debug logging is disabled.
+
         Args:
-            message (str): The message to log.
+            message (LogMessage): The message, a %-style format string or a callable returning it.
+            *args (Any): Format arguments; wrap costly ones in `Lazy`.
             conversation_id (str, optional): The conversation UUID.
         """
-        if self.debug:
-            debug_message = (
-                f"Conversation UUID: {conversation_id} - {message}"
-                if conversation_id
-                else message
+        self._ensure_configured()
+        if not self.debug or not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug(self._build_message(message, conversation_id), *args)
+
+    def log_error(
+        self, message: LogMessage, *args: Any, conversation_id: str = None
+    ) -> None:
+        """
+        Logs an error message, which is also sent to Sentry when it is enabled.
+
+        Outside queue mode the Sentry logging integration turns the error record into
+        an event; in queue mode SentryBatchHandler forwards it from the listener thread.
+
+        Args:
+            message (LogMessage): The message, a %-style format string or a callable returning it.
+            *args (Any): Format arguments; wrap costly ones in `Lazy`.
+            conversation_id (str, optional): The conversation UUID.
+        """
+        self._ensure_configured()
+        self.logger.error(self._build_message(message, conversation_id), *args)
+
+    def shutdown(self) -> None:
+        """
+        Drains the logging queue and flushes pending Sentry events.
+
+        Safe to call more than once; it is called on application shutdown and at exit.
+        """
+        if self.queue_listener is not None:
+            self.queue_listener.stop()
+            for handler in self.queue_listener.handlers:
+                handler.close()
+            self.queue_listener = None
+
+        if self._sentry_initialized:
+            import sentry_sdk
+
+            sentry_sdk.flush()
+
+    def _ensure_configured(self) -> None:
+        if not self._configured:
+            self.configure()
+
+    def _start_queue_listener(self, console_handler: logging.Handler) -> None:
+        """
+        Routes records through a queue so formatting, writing and Sentry forwarding
+        run on a background thread instead of the request thread.
+
+        Args:
+            console_handler (logging.Handler): The terminal handler fed by the listener.
+        """
+        handlers = [console_handler]
+        if self.sentry_enabled:
+            from app.logs.sentry_handler import SentryBatchHandler
+
+            handlers.append(
+                SentryBatchHandler(
+                    batch_size=self.settings.logging.sentry_batch_size,
+                    flush_interval=self.settings.logging.sentry_flush_interval,
+                )
             )
-            self.logger.debug(debug_message)
 
-    def log_error(self, message: str, conversation_id: str = None) -> None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.logger.addHandler(_RecordQueueHandler(log_queue))
+        self.queue_listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self.queue_listener.start()
+        atexit.register(self.shutdown)
+
+    @staticmethod
+    def _build_message(
+        message: LogMessage, conversation_id: str = None
+    ) -> Union[str, Lazy]:
         """
-        Logs an error message and sends it to Sentry if in debug mode.
+        Builds the format string of a log record, without rendering it.
+
+        The arguments are passed to `logging` with it, so the message is rendered by
+        the handlers, and a formatting error is reported by `Handler.handleError`
+        instead of being raised into the caller.
 
         Args:
-            message (str): The error message to log.
+            message (LogMessage): The message, a %-style format string or a callable returning it.
             conversation_id (str, optional): The conversation UUID.
+
+        Returns:
+            Union[str, Lazy]: The format string; callables are wrapped in `Lazy` and
+            called when the record is rendered.
         """
-        error_message = (
+        if callable(message):
+            if conversation_id:
+                return Lazy(
+                    lambda: f"Conversation UUID: {conversation_id} - {message()}"
+                )
+            return Lazy(message)
+        return (
             f"Conversation UUID: {conversation_id} - {message}"
             if conversation_id
             else message
         )
-        self.logger.error(error_message)
-
-        if not self.debug:
-            sentry_sdk.capture_message(error_message, level="error")
-
 
-ENV = get_settings().env.environment
-DEBUG_FLAG = ENV == Environment.DEV
 
-LOGGER = LoggerManager(debug=DEBUG_FLAG)
+LOGGER = LoggerManager()
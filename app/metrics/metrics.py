@@ -0,0 +1,290 @@
+import threading
+import time
+
+from bisect import bisect_left
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+from app.settings.setting import get_settings
+
+# Latency buckets, in seconds, spanning microsecond engine calls to LLM round trips.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# name: (type, help, label names)
+_METRICS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "challenge_request_duration_seconds": (
+        "histogram",
+        "Time spent handling a request, from body parsing to the response object.",
+        ("route",),
+    ),
+    "challenge_stage_duration_seconds": (
+        "histogram",
+        "Time spent in each layer of the pipeline, including the layers it calls.",
+        ("stage", "operation"),
+    ),
+    "challenge_operations_total": (
+        "counter",
+        "Processed operations by outcome.",
+        ("operation", "outcome"),
+    ),
+    "challenge_plan_cache_lookups_total": (
+        "counter",
+        "Prompt plan cache lookups by outcome.",
+        ("outcome",),
+    ),
+    "challenge_plan_cache_conflicts_total": (
+        "counter",
+        "Model plans that replaced a different cached plan of their template.",
+        (),
+    ),
+    "challenge_offload_reductions_total": (
+        "counter",
+        "Large reductions run on the process pool, by how their operands were sent.",
+        ("operation", "placement"),
+    ),
+    "challenge_component_stats": (
+        "gauge",
+        "Counters reported by the `stats()` method of pipeline components, read at scrape time.",
+        ("component", "stat"),
+    ),
+}
+
+_NOOP_SPAN = nullcontext()
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class _Span:
+    __slots__ = ("_registry", "_stage", "_operation", "_started")
+
+    def __init__(self, registry: "MetricsRegistry", stage: str, operation: str):
+        self._registry = registry
+        self._stage = stage
+        self._operation = operation
+
+    def __enter__(self) -> "_Span":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        self._registry.observe(
+            "challenge_stage_duration_seconds",
+            (self._stage, self._operation),
+            time.perf_counter() - self._started,
+        )
+        return False
+
+
+class MetricsRegistry:
+    """
+    In-process latency histograms and counters, exposed in the Prometheus text format.
+
+    Spans time one layer of the pipeline (controller, service, workflow, validator,
+    engine, llm, tool, serialization) for one operation. Single operations are
+    validated inside the engine's reduction (see `ChallengeWorkflow._execute`), so
+    their validation time is part of "engine"; "validator" only times the separate
+    validation passes of batch and binary requests. When metrics are disabled,
+    `span` returns a shared no-op context manager and nothing is recorded.
+
+    Components keep their own counters; `register_collector` exports them.
+
+    Attributes:
+        buckets (Tuple[float, ...]): Upper bounds of the histogram buckets, in seconds.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self._enabled = enabled
+        self.buckets = buckets
+        self._histograms: Dict[Tuple[str, Tuple[str, ...]], _Histogram] = {}
+        self._counters: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether metrics are recorded, read from the settings on first access.
+        """
+        if self._enabled is None:
+            self._enabled = get_settings().metrics.enabled
+        return self._enabled
+
+    def span(self, stage: str, operation: str = "") -> ContextManager:
+        """
+        Returns a context manager timing a pipeline stage.
+
+        Args:
+            stage (str): The layer being timed (e.g. "engine").
+            operation (str): The operation, or request kind, being processed.
+
+        Returns:
+            ContextManager: The timing span, or a no-op when metrics are disabled.
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, stage, operation)
+
+    def observe(self, name: str, labels: Tuple[str, ...], seconds: float) -> None:
+        """
+        Records a duration in a histogram.
+
+        Args:
+            name (str): The histogram name.
+            labels (Tuple[str, ...]): The label values, in the order of the metric definition.
+            seconds (float): The observed duration.
+        """
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get((name, labels))
+            if histogram is None:
+                histogram = self._histograms[(name, labels)] = _Histogram(
+                    len(self.buckets) + 1
+                )
+            histogram.counts[index] += 1
+            histogram.sum += seconds
+
+    def count_operation(self, operation: str, success: bool) -> None:
+        """
+        Counts a processed operation by outcome.
+
+        Args:
+            operation (str): The operation, or request kind, processed.
+            success (bool): Whether the operation succeeded.
+        """
+        self.increment(
+            "challenge_operations_total",
+            (operation, "success" if success else "failure"),
+        )
+
+    def increment(self, name: str, labels: Tuple[str, ...]) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name (str): The counter name.
+            labels (Tuple[str, ...]): The label values, in the order of the metric definition.
+        """
+        if not self.enabled:
+            return
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+    def register_collector(
+        self, component: str, collect: Callable[[], Dict[str, Any]]
+    ) -> None:
+        """
+        Exports the numeric values returned by a component's `stats()` method.
+
+        The collector is called on each `render`, so components keep their own
+        counters and pay nothing per request. Registering a component again
+        replaces its collector.
+
+        Args:
+            component (str): The component name, used as the `component` label.
+            collect (Callable[[], Dict[str, Any]]): Returns the component counters.
+        """
+        with self._lock:
+            self._collectors[component] = collect
+
+    def render(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            str: The exposition text.
+        """
+        with self._lock:
+            histograms = {
+                key: (list(histogram.counts), histogram.sum)
+                for key, histogram in self._histograms.items()
+            }
+            counters = dict(self._counters)
+            collectors = dict(self._collectors)
+
+        bounds = [_format_float(bound) for bound in self.buckets] + ["+Inf"]
+        lines: List[str] = []
+        for name, (kind, description, label_names) in _METRICS.items():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+
+            if kind == "gauge":
+                for component, collect in sorted(collectors.items()):
+                    for stat, value in sorted(collect().items()):
+                        if isinstance(value, (int, float)):
+                            value = int(value) if isinstance(value, bool) else value
+                            stat_labels = _labels(label_names, (component, stat))
+                            lines.append(f"{name}{stat_labels} {value!r}")
+                continue
+
+            if kind == "counter":
+                for (metric, labels), value in sorted(counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{_labels(label_names, labels)} {value}")
+                continue
+
+            for (metric, labels), (counts, total) in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(bounds, counts):
+                    cumulative += count
+                    bucket_labels = _labels(label_names + ("le",), labels + (bound,))
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{name}_sum{_labels(label_names, labels)} {total!r}")
+                lines.append(f"{name}_count{_labels(label_names, labels)} {cumulative}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """
+        Drops every recorded value.
+        """
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}" if pairs else ""
+
+
+METRICS = MetricsRegistry()
@@ -1,10 +1,32 @@
-from typing import Optional
+import json
+import math
+
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 from pydantic import ValidationError
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
-from app.routes.challenge.dtos.dto import ChallengeRequestDTO, ChallengeResponseDTO
+from app.routes.challenge.dtos.dto import (
+    ChallengeBatchRequestDTO,
+    ChallengePromptRequestDTO,
+    ChallengeRequestDTO,
+    ChallengeResponseDTO,
+)
 from app.routes.challenge.services.service import ChallengeService
-from app.logs.setup_logger import LoggerManager, LOGGER
+from app.core.admission import OverloadedError
+from app.core.binary import (
+    BINARY_MEDIA_TYPE,
+    encode_result,
+    is_encodable,
+    result_dtype,
+)
+from app.logs.setup_logger import Lazy, LoggerManager, LOGGER
+from app.metrics.metrics import METRICS
+
+SSE_MEDIA_TYPE = "text/event-stream"
+# Idle time after which a prompt stream checks that its client is still connected.
+SSE_KEEPALIVE_SECONDS = 1.0
 
 
 class ChallengeController:
@@ -24,7 +46,7 @@ class ChallengeController:
         self.logger = logger or LOGGER
         self.service = service or ChallengeService()
 
-    def process(self, request: ChallengeRequestDTO) -> ChallengeResponseDTO:
+    def process(self, request: ChallengeRequestDTO) -> JSONResponse:
         """
         Processes the incoming challenge request and returns the corresponding response.
 
@@ -35,40 +57,318 @@ class ChallengeController:
             request (ChallengeRequestDTO): The request data containing the operation and operands.
 
         Returns:
-            ChallengeResponseDTO: Response containing the result of the operation or an error message.
+            JSONResponse: Response containing the result of the operation or an error message.
 
         Raises:
             ValidationError: If request validation fails.
             Exception: For any unexpected errors during processing.
         """
         try:
-            self.logger.log_info(
-                f"[controller] request payload: {request.model_dump()}"
+            self.logger.log_debug(
+                "[controller] request payload: %s", Lazy(request.model_dump)
             )
-            response: ChallengeResponseDTO = self.service.handle(request)
-            self.logger.log_debug(f"[controller] response: {response.model_dump()}")
-            status_code = 200 if response.success else 400
-            self.logger.log_info(f"[controller] response sent: {response.model_dump()}")
-            
-            return JSONResponse(
-                status_code=status_code,
-                content=response.model_dump(),
+            with METRICS.span("service", request.operation):
+                response: ChallengeResponseDTO = self.service.handle(request)
+            return self._to_json_response(response)
+
+        except ValidationError as e:
+            return self._validation_error_response(e)
+
+        except Exception as e:
+            return self._internal_error_response(e)
+
+    async def process_async(self, request: ChallengeRequestDTO) -> JSONResponse:
+        """
+        Async variant of `process`, awaiting the service so that the event loop
+        is never blocked by LLM or tool calls.
+
+        Args:
+            request (ChallengeRequestDTO): The request data containing the operation and operands.
+
+        Returns:
+            JSONResponse: Response containing the result of the operation or an error message.
+        """
+        try:
+            self.logger.log_debug(
+                "[controller] request payload: %s", Lazy(request.model_dump)
             )
+            with METRICS.span("service", request.operation):
+                response: ChallengeResponseDTO = await self.service.handle_async(
+                    request
+                )
+            return self._to_json_response(response)
 
         except ValidationError as e:
-            self.logger.log_error(f"[controller] validation error: {e.errors()}")
+            return self._validation_error_response(e)
+
+        except Exception as e:
+            return self._internal_error_response(e)
+
+    async def process_prompt_async(
+        self, request: ChallengePromptRequestDTO
+    ) -> JSONResponse:
+        """
+        Processes a natural-language challenge prompt and returns the tool result.
+
+        Args:
+            request (ChallengePromptRequestDTO): The request data containing the prompt.
+
+        Returns:
+            JSONResponse: Response containing the result of the operation or an error message.
+        """
+        try:
+            self.logger.log_debug(
+                "[controller] prompt payload: %s", Lazy(request.model_dump)
+            )
+            with METRICS.span("service", "prompt"):
+                response: ChallengeResponseDTO = await self.service.handle_prompt_async(
+                    request
+                )
+            return self._to_json_response(response)
+
+        except OverloadedError as e:
+            return self._overloaded_response(e)
+
+        except ValidationError as e:
+            return self._validation_error_response(e)
+
+        except Exception as e:
+            return self._internal_error_response(e)
+
+    def stream_prompt(
+        self,
+        request: ChallengePromptRequestDTO,
+        is_disconnected: Callable[[], Awaitable[bool]],
+    ) -> StreamingResponse:
+        """
+        Answers a natural-language challenge prompt as a stream of Server-Sent Events.
+
+        Agent progress is sent as it happens ("tool_selected", "tool_arguments",
+        "tool_result" events), followed by a "result" event holding the
+        ChallengeResponseDTO. A shed request ends with an "error" event carrying
+        `retry_after`. While the agent is idle, a comment line is sent every
+        SSE_KEEPALIVE_SECONDS after checking the client is connected; once it is
+        gone, the stream is closed, which cancels the in-flight LLM call.
+
+        Args:
+            request (ChallengePromptRequestDTO): The request data containing the prompt.
+            is_disconnected (Callable[[], Awaitable[bool]]): Tells whether the client left.
+
+        Returns:
+            StreamingResponse: The `text/event-stream` response.
+        """
+        self.logger.log_debug(
+            "[controller] streamed prompt payload: %s", Lazy(request.model_dump)
+        )
+        return StreamingResponse(
+            self._prompt_events(request, is_disconnected),
+            media_type=SSE_MEDIA_TYPE,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def _prompt_events(
+        self,
+        request: ChallengePromptRequestDTO,
+        is_disconnected: Callable[[], Awaitable[bool]],
+    ) -> AsyncIterator[str]:
+        try:
+            async with aclosing(
+                self.service.stream_prompt_async(request, SSE_KEEPALIVE_SECONDS)
+            ) as events:
+                async for event, payload in events:
+                    if event == "keepalive":
+                        if await is_disconnected():
+                            self.logger.log_info(
+                                "[controller] client left, closing prompt stream"
+                            )
+                            return
+                        yield ": keepalive\n\n"
+                        continue
+                    if event == "result":
+                        self.logger.log_info(
+                            "[controller] streamed response sent: %s", payload.success
+                        )
+                        payload = payload.model_dump()
+                    yield _sse(event, payload)
+
+        except OverloadedError as e:
+            self.logger.log_error("[controller] request shed: %s", e)
+            yield _sse(
+                "error",
+                {"message": str(e), "retry_after": math.ceil(e.retry_after)},
+            )
+
+        except Exception as e:
+            self.logger.log_error("[controller] internal error: %s", e)
             dto = ChallengeResponseDTO(
                 success=False,
-                message="Validation failed.",
-                data={"errors": e.errors()},
+                message="Internal server error.",
+                data={"error": str(e)},
             )
-            return JSONResponse(status_code=422, content=dto.model_dump())
+            yield _sse("result", dto.model_dump())
+
+    async def process_stream_async(
+        self, operation: str, chunks: AsyncIterator[bytes]
+    ) -> JSONResponse:
+        """
+        Processes an operation whose operands are streamed as NDJSON.
+
+        Args:
+            operation (str): The operation to execute.
+            chunks (AsyncIterator[bytes]): The request body chunks.
+
+        Returns:
+            JSONResponse: Response containing the result of the operation or an error message.
+        """
+        try:
+            self.logger.log_info("[controller] streamed operation: %s", operation)
+            with METRICS.span("service", operation):
+                response: ChallengeResponseDTO = await self.service.handle_stream_async(
+                    operation, chunks
+                )
+            return self._to_json_response(response)
+
+        except Exception as e:
+            return self._internal_error_response(e)
+
+    def process_binary(
+        self, operation: str, dtype: str, body: bytes, binary_response: bool = False
+    ) -> Response:
+        """
+        Processes an operation whose operands are sent as a typed binary buffer.
+
+        Args:
+            operation (str): The operation to execute.
+            dtype (str): The operand type of the buffer, "float64" or "int64".
+            body (bytes): The little-endian operand buffer.
+            binary_response (bool): Whether a successful result is returned as 8 raw bytes
+                instead of JSON. The result type is given by the `X-Result-Dtype` header;
+                integers beyond the int64 range are still returned as JSON.
+
+        Returns:
+            Response: The raw result bytes when requested and successful, otherwise a
+            JSON response containing the result of the operation or an error message.
+        """
+        try:
+            self.logger.log_info(
+                "[controller] binary operation '%s' with %d bytes of %s operands",
+                operation,
+                len(body),
+                dtype,
+            )
+            with METRICS.span("service", operation):
+                response: ChallengeResponseDTO = self.service.handle_binary(
+                    operation, dtype, body
+                )
+            if not (
+                binary_response
+                and response.success
+                and is_encodable(response.data["result"])
+            ):
+                return self._to_json_response(response)
+
+            result = response.data["result"]
+            self.logger.log_debug("[controller] binary response sent: %s", result)
+            return Response(
+                content=encode_result(result),
+                media_type=BINARY_MEDIA_TYPE,
+                headers={"X-Result-Dtype": result_dtype(result)},
+            )
+
+        except Exception as e:
+            return self._internal_error_response(e)
+
+    def process_batch(self, request: ChallengeBatchRequestDTO) -> JSONResponse:
+        """
+        Processes a batch of challenge requests and returns the per-item results.
+
+        Item-level failures (e.g. a division by zero) are reported inside the
+        results list; the status code only reflects failures of the batch itself.
+
+        Args:
+            request (ChallengeBatchRequestDTO): The batch of operations to process.
+
+        Returns:
+            JSONResponse: Response containing one result entry per operation, in request order.
+        """
+        try:
+            self.logger.log_info(
+                "[controller] batch payload with %d operations", len(request.operations)
+            )
+            with METRICS.span("service", "batch"):
+                response: ChallengeResponseDTO = self.service.handle_batch(request)
+            status_code = 200 if response.success else 400
+            self.logger.log_info(
+                "[controller] batch response sent: %s", response.success
+            )
+
+            with METRICS.span("serialization", "batch"):
+                return JSONResponse(
+                    status_code=status_code,
+                    content=response.model_dump(),
+                )
 
         except Exception as e:
-            self.logger.log_error(f"[controller] internal error: {str(e)}")
+            self.logger.log_error("[controller] internal batch error: %s", e)
             dto = ChallengeResponseDTO(
                 success=False,
                 message="Internal server error.",
                 data={"error": str(e)},
             )
             return JSONResponse(status_code=500, content=dto.model_dump())
+
+    def _to_json_response(self, response: ChallengeResponseDTO) -> JSONResponse:
+        """
+        Serializes the service response once and maps its outcome to a status code.
+
+        Args:
+            response (ChallengeResponseDTO): The response returned by the service.
+
+        Returns:
+            JSONResponse: 200 on success, 400 otherwise.
+        """
+        with METRICS.span("serialization"):
+            content = response.model_dump()
+            status_code = 200 if response.success else 400
+            self.logger.log_debug("[controller] response sent: %s", content)
+
+            return JSONResponse(
+                status_code=status_code,
+                content=content,
+            )
+
+    def _validation_error_response(self, error: ValidationError) -> JSONResponse:
+        self.logger.log_error("[controller] validation error: %s", error.errors())
+        dto = ChallengeResponseDTO(
+            success=False,
+            message="Validation failed.",
+            data={"errors": error.errors()},
+        )
+        return JSONResponse(status_code=422, content=dto.model_dump())
+
+    def _overloaded_response(self, error: OverloadedError) -> JSONResponse:
+        self.logger.log_error("[controller] request shed: %s", error)
+        dto = ChallengeResponseDTO(
+            success=False,
+            message=str(error),
+            data=None,
+        )
+        return JSONResponse(
+            status_code=503,
+            content=dto.model_dump(),
+            headers={"Retry-After": str(math.ceil(error.retry_after))},
+        )
+
+    def _internal_error_response(self, error: Exception) -> JSONResponse:
+        self.logger.log_error("[controller] internal error: %s", error)
+        dto = ChallengeResponseDTO(
+            success=False,
+            message="Internal server error.",
+            data={"error": str(error)},
+        )
+        return JSONResponse(status_code=500, content=dto.model_dump())
+
+
+def _sse(event: str, payload: Any) -> str:
+    data = json.dumps(jsonable_encoder(payload), separators=(",", ":"))
+    return f"event: {event}\ndata: {data}\n\n"
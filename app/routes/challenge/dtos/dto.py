@@ -1,32 +1,68 @@
 from typing import List, Optional, Any, Literal
 from pydantic import BaseModel, Field, field_validator
 
-from app.schemas.schema import Number
+from app.schemas.schema import Number, Precision
+from app.core.registry import operation_names
+
+
+# Upper bound on the items of one batch request, so one request cannot carry unbounded work.
+MAX_BATCH_OPERATIONS = 1000
+
+# Generated from the operation registry, so the API accepts exactly the registered operations.
+Operation = Literal[operation_names()]
 
 
 class ChallengeRequestDTO(BaseModel):
-    operation: Literal["sum", "subtract", "multiply", "divide"] = Field(
-        ..., description="Operation to perform: sum, subtract, multiply, divide."
+    operation: Operation = Field(
+        ...,
+        description=f"Operation to perform: {', '.join(operation_names())}.",
     )
     operands: List[Number] = Field(
         ..., min_items=2, description="Operands for the operation."
     )
+    precision: Optional[Precision] = Field(
+        None,
+        description="Arithmetic mode: float (vectorized float64), compensated (fsum), exact (int/Fraction) or decimal. Defaults to native Python arithmetic.",
+    )
+    decimal_precision: int = Field(
+        28, ge=1, le=1000, description="Significant digits used by the decimal mode."
+    )
 
     @field_validator("operands")
     @classmethod
     def validate_operands(cls, v: List[Number]):
+        # Element types are already enforced by the List[Number] annotation, so
+        # only the length is checked here instead of scanning the list again.
         if len(v) < 2:
             raise ValueError("At least two operands are required.")
-        if not all(isinstance(n, (int, float)) for n in v):
-            raise ValueError("All operands must be numbers.")
         return v
 
 
+class ChallengeBatchRequestDTO(BaseModel):
+    operations: List[ChallengeRequestDTO] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_OPERATIONS,
+        description="Operations to perform, processed in order.",
+    )
+
+
+class ChallengePromptRequestDTO(BaseModel):
+    prompt: str = Field(
+        ...,
+        min_length=1,
+        description="Natural-language math question, e.g. 'What is 10 divided by 2?'.",
+    )
+
+
 class ChallengeResponseDTO(BaseModel):
     success: bool = Field(..., description="Indicates if the operation was successful.")
     message: Optional[str] = Field(
         None, description="Contextual message for the operation."
     )
+    precision: Optional[Precision] = Field(
+        None, description="Arithmetic mode used to compute the result, if requested."
+    )
     data: Optional[Any] = Field(
         None, description="Resulting user object or related data."
     )
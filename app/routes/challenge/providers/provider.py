@@ -0,0 +1,54 @@
+from fastapi import FastAPI, Request
+
+from app.routes.challenge.controllers.controller import ChallengeController
+
+
+def build_challenge_controller() -> ChallengeController:
+    """
+    Builds the challenge pipeline (controller, service, workflow, engine and validator).
+
+    Every layer of the pipeline is stateless, so a single instance can be shared
+    by all requests of the application.
+
+    Returns:
+        ChallengeController: The controller at the top of the pipeline.
+    """
+    return ChallengeController()
+
+
+def init_challenge_provider(app: FastAPI) -> None:
+    """
+    Creates the application-scoped challenge pipeline and stores it in the app state.
+
+    Args:
+        app (FastAPI): The application being started.
+    """
+    app.state.challenge_controller = _build_shared_controller()
+
+
+def get_challenge_controller(request: Request) -> ChallengeController:
+    """
+    FastAPI dependency returning the shared challenge controller.
+
+    Falls back to building the pipeline on first use when the application was
+    started without running its lifespan. Tests can replace it through
+    `app.dependency_overrides[get_challenge_controller]`.
+
+    Args:
+        request (Request): The incoming request, used to reach the app state.
+
+    Returns:
+        ChallengeController: The shared controller instance.
+    """
+    controller = getattr(request.app.state, "challenge_controller", None)
+    if controller is None:
+        controller = _build_shared_controller()
+        request.app.state.challenge_controller = controller
+    return controller
+
+
+def _build_shared_controller() -> ChallengeController:
+    # Only the application-scoped pipeline reports its counters on /metrics.
+    controller = build_challenge_controller()
+    controller.service.register_metrics()
+    return controller
@@ -1,19 +1,39 @@
-from fastapi import APIRouter, status
+from typing import Literal
 
-from app.routes.challenge.dtos.dto import ChallengeRequestDTO, ChallengeResponseDTO
-from app.routes.challenge.controllers.controller import ChallengeController
+from fastapi import APIRouter, Depends, Header, Query, Request, status
+from fastapi.responses import StreamingResponse
 
-router = APIRouter()
+from app.routes.challenge.dtos.dto import (
+    ChallengeBatchRequestDTO,
+    ChallengePromptRequestDTO,
+    ChallengeRequestDTO,
+    ChallengeResponseDTO,
+    Operation,
+)
+from app.routes.challenge.controllers.controller import (
+    SSE_MEDIA_TYPE,
+    ChallengeController,
+)
+from app.routes.challenge.providers.provider import get_challenge_controller
+from app.routes.metrics.route import TimedRoute
+from app.core.binary import BINARY_MEDIA_TYPE
+from app.core.registry import operation_names
+from app.metrics.metrics import METRICS
+
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.post(
     "/challenge",
     summary="Perform a mathematical operation",
-    description="Executes a specified mathematical operation ('sum', 'subtract', 'multiply', 'divide') on the provided operands.",
+    description=f"Executes a specified mathematical operation ({', '.join(map(repr, operation_names()))}) on the provided operands.",
     response_model=ChallengeResponseDTO,
     status_code=status.HTTP_200_OK,
 )
-def challenge(request: ChallengeRequestDTO):
+async def challenge(
+    request: ChallengeRequestDTO,
+    controller: ChallengeController = Depends(get_challenge_controller),
+):
     """
     Handles the POST request to perform a mathematical operation on provided operands.
 
@@ -22,6 +42,7 @@ def challenge(request: ChallengeRequestDTO):
 
     Args:
         request (ChallengeRequestDTO): The request body containing the operation type and operands.
+        controller (ChallengeController): The shared controller injected by the provider.
 
     Returns:
         ChallengeResponseDTO: The result of the performed operation.
@@ -29,5 +50,149 @@ def challenge(request: ChallengeRequestDTO):
     Raises:
         HTTPException: If the request is invalid or an error occurs during processing.
     """
-    controller = ChallengeController()
-    return controller.process(request)
+    with METRICS.span("controller", request.operation):
+        return await controller.process_async(request)
+
+
+@router.post(
+    "/challenge/prompt",
+    summary="Answer a mathematical question written in natural language",
+    description="Interprets a prompt such as 'What is 10 divided by 2?' and answers it by calling the mathematical operation tools.",
+    response_model=ChallengeResponseDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def challenge_prompt(
+    request: ChallengePromptRequestDTO,
+    controller: ChallengeController = Depends(get_challenge_controller),
+):
+    """
+    Handles the POST request to answer a natural-language mathematical prompt.
+
+    Simple prompts are resolved by a deterministic parser; the others are sent to
+    the LLM agent, which must use the operation tools to produce the result.
+
+    Args:
+        request (ChallengePromptRequestDTO): The request body containing the prompt.
+        controller (ChallengeController): The shared controller injected by the provider.
+
+    Returns:
+        ChallengeResponseDTO: The result of the performed operation.
+    """
+    with METRICS.span("controller", "prompt"):
+        return await controller.process_prompt_async(request)
+
+
+@router.post(
+    "/challenge/prompt/stream",
+    summary="Answer a natural-language mathematical question as Server-Sent Events",
+    description="Same as /challenge/prompt, but streams the agent progress (tool_selected, tool_arguments, tool_result events) as it happens, then a final 'result' event holding the ChallengeResponseDTO. Disconnecting cancels the in-flight LLM call.",
+    response_class=StreamingResponse,
+    responses={200: {"content": {SSE_MEDIA_TYPE: {}}}},
+    status_code=status.HTTP_200_OK,
+)
+async def challenge_prompt_stream(
+    request: ChallengePromptRequestDTO,
+    raw_request: Request,
+    controller: ChallengeController = Depends(get_challenge_controller),
+):
+    """
+    Handles the POST request to answer a natural-language prompt with an event stream.
+
+    Args:
+        request (ChallengePromptRequestDTO): The request body containing the prompt.
+        raw_request (Request): The raw request, used to detect client disconnection.
+        controller (ChallengeController): The shared controller injected by the provider.
+
+    Returns:
+        StreamingResponse: The `text/event-stream` response.
+    """
+    with METRICS.span("controller", "prompt_stream"):
+        return controller.stream_prompt(request, raw_request.is_disconnected)
+
+
+@router.post(
+    "/challenge/stream",
+    summary="Perform a mathematical operation on streamed operands",
+    description="Executes a mathematical operation on operands streamed as NDJSON (one number or JSON array of numbers per line). Operands are reduced as they arrive, in constant memory.",
+    response_model=ChallengeResponseDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def challenge_stream(
+    request: Request,
+    operation: Operation = Query(..., description="Operation to perform."),
+    controller: ChallengeController = Depends(get_challenge_controller),
+):
+    """
+    Handles the POST request to perform a mathematical operation on a streamed body.
+
+    Args:
+        request (Request): The raw request, whose body is read as a stream.
+        operation (Operation): The operation to perform.
+        controller (ChallengeController): The shared controller injected by the provider.
+
+    Returns:
+        ChallengeResponseDTO: The result of the performed operation.
+    """
+    with METRICS.span("controller", operation):
+        return await controller.process_stream_async(operation, request.stream())
+
+
+@router.post(
+    "/challenge/binary",
+    summary="Perform a mathematical operation on a binary operand buffer",
+    description="Executes a mathematical operation on operands sent as a little-endian float64 or int64 buffer (application/octet-stream). Send 'Accept: application/octet-stream' to receive the result as 8 raw bytes.",
+    response_model=ChallengeResponseDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def challenge_binary(
+    request: Request,
+    operation: Operation = Query(..., description="Operation to perform."),
+    dtype: Literal["float64", "int64"] = Query(
+        "float64", description="Type of the operands in the buffer."
+    ),
+    accept: str = Header("application/json"),
+    controller: ChallengeController = Depends(get_challenge_controller),
+):
+    """
+    Handles the POST request to perform a mathematical operation on a binary body.
+
+    Args:
+        request (Request): The raw request, whose body holds the operand buffer.
+        operation (Operation): The operation to perform.
+        dtype (str): The operand type of the buffer.
+        accept (str): The Accept header, selecting a JSON or binary response.
+        controller (ChallengeController): The shared controller injected by the provider.
+
+    Returns:
+        ChallengeResponseDTO: The result of the performed operation.
+    """
+    body = await request.body()
+    with METRICS.span("controller", operation):
+        return controller.process_binary(
+            operation, dtype, body, binary_response=BINARY_MEDIA_TYPE in accept
+        )
+
+
+@router.post(
+    "/challenge/batch",
+    summary="Perform a batch of mathematical operations",
+    description="Executes many mathematical operations in a single request. Operations of the same type are computed together and results are returned in request order.",
+    response_model=ChallengeResponseDTO,
+    status_code=status.HTTP_200_OK,
+)
+def challenge_batch(
+    request: ChallengeBatchRequestDTO,
+    controller: ChallengeController = Depends(get_challenge_controller),
+):
+    """
+    Handles the POST request to perform a batch of mathematical operations.
+
+    Args:
+        request (ChallengeBatchRequestDTO): The request body containing the list of operations.
+        controller (ChallengeController): The shared controller injected by the provider.
+
+    Returns:
+        ChallengeResponseDTO: The per-item results of the batch, in request order.
+    """
+    with METRICS.span("controller", "batch"):
+        return controller.process_batch(request)
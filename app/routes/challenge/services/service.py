@@ -1,8 +1,31 @@
-from typing import Optional
+import asyncio
 
-from app.routes.challenge.dtos.dto import ChallengeRequestDTO, ChallengeResponseDTO
+from contextlib import aclosing
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+)
+
+from app.routes.challenge.dtos.dto import (
+    ChallengeBatchRequestDTO,
+    ChallengePromptRequestDTO,
+    ChallengeRequestDTO,
+    ChallengeResponseDTO,
+)
+from app.core.admission import OverloadedError
+from app.core.binary import decode_operands
+from app.core.cache import prompt_key
+from app.core.single_flight import SingleFlight
 from app.core.workflow import ChallengeWorkflow
-from app.logs.setup_logger import LoggerManager, LOGGER
+from app.logs.setup_logger import Lazy, LoggerManager, LOGGER
+from app.metrics.metrics import METRICS
+from app.settings.setting import get_settings
 
 
 class ChallengeService:
@@ -10,18 +33,27 @@ class ChallengeService:
     Service class responsible for handling challenge business logic.
 
     This class orchestrates the workflow execution and manages error handling and logging.
+    Concurrent identical prompts (same normalized text) share a single in-flight
+    workflow execution, so a burst of them costs one LLM run. Operation requests are
+    not coalesced: they are deterministic, cheap and already served by the response cache.
 
     Attributes:
         workflow (ChallengeWorkflow): The workflow instance used to process the challenge logic.
+        single_flight (Optional[SingleFlight]): Request coalescer, None when coalescing is disabled.
         logger (LoggerManager): Logger instance for logging service events and errors.
     """
 
     def __init__(
         self,
         workflow: Optional[ChallengeWorkflow] = None,
+        single_flight: Optional[SingleFlight] = None,
         logger: Optional[LoggerManager] = None,
     ):
+        settings = get_settings().coalescing
         self.workflow = workflow or ChallengeWorkflow()
+        self.single_flight = single_flight or (
+            SingleFlight(timeout=settings.timeout) if settings.enabled else None
+        )
         self.logger = logger or LOGGER
 
     def handle(self, request: ChallengeRequestDTO) -> ChallengeResponseDTO:
@@ -40,23 +72,251 @@ class ChallengeService:
         """
         try:
             self.logger.log_info("[service] processing challenge request")
-            self.logger.log_debug(f"[service] request data: {request.model_dump()}")
-            result = self.workflow.process(request)
-            self.logger.log_debug(f"[service] response: {result}")
+            self.logger.log_debug(
+                "[service] request data: %s", Lazy(request.model_dump)
+            )
+            with METRICS.span("workflow", request.operation):
+                result = self.workflow.process(request)
+            self.logger.log_debug("[service] response: %s", result)
             return ChallengeResponseDTO(**result)
 
         except ValueError as ve:
-            self.logger.log_error(f"[service] value error: {str(ve)}")
-            return ChallengeResponseDTO(
-                success=False,
-                message="Invalid input or operation error.",
-                data={"error": str(ve)},
+            return self._value_error_response(ve)
+
+        except Exception as e:
+            return self._unexpected_error_response(e)
+
+    async def handle_async(self, request: ChallengeRequestDTO) -> ChallengeResponseDTO:
+        """
+        Async variant of `handle`, awaiting the workflow on the event loop.
+
+        Args:
+            request (ChallengeRequestDTO): The challenge request data containing operation and operands.
+
+        Returns:
+            ChallengeResponseDTO: Response DTO with the operation result or error information.
+        """
+        try:
+            self.logger.log_info("[service] processing challenge request")
+            self.logger.log_debug(
+                "[service] request data: %s", Lazy(request.model_dump)
             )
+            with METRICS.span("workflow", request.operation):
+                result = await self.workflow.process_async(request)
+            self.logger.log_debug("[service] response: %s", result)
+            return ChallengeResponseDTO(**result)
+
+        except ValueError as ve:
+            return self._value_error_response(ve)
+
+        except Exception as e:
+            return self._unexpected_error_response(e)
+
+    async def handle_prompt_async(
+        self, request: ChallengePromptRequestDTO
+    ) -> ChallengeResponseDTO:
+        """
+        Handles a natural-language challenge prompt by invoking the prompt workflow.
+
+        Args:
+            request (ChallengePromptRequestDTO): The challenge prompt.
+
+        Returns:
+            ChallengeResponseDTO: Response DTO with the operation result or error information.
+
+        Raises:
+            OverloadedError: If the LLM admission controller shed the request.
+        """
+        try:
+            self.logger.log_info("[service] processing challenge prompt")
+            with METRICS.span("workflow", "prompt"):
+                result = await self._coalesce(
+                    prompt_key(request.prompt),
+                    lambda: self.workflow.process_prompt_async(request),
+                )
+            self.logger.log_debug("[service] response: %s", result)
+            return ChallengeResponseDTO(**result)
+
+        except OverloadedError:
+            # Shed requests are answered with 503 by the controller.
+            raise
+
+        except asyncio.TimeoutError:
+            return self._timeout_response()
+
+        except ValueError as ve:
+            return self._value_error_response(ve)
 
         except Exception as e:
-            self.logger.log_error(f"[service] unexpected error: {str(e)}")
+            return self._unexpected_error_response(e)
+
+    async def stream_prompt_async(
+        self, request: ChallengePromptRequestDTO, keepalive: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Handles a natural-language challenge prompt, yielding the workflow progress events.
+
+        Streams are not coalesced: every client receives the events of its own run.
+
+        Args:
+            request (ChallengePromptRequestDTO): The challenge prompt.
+            keepalive (Optional[float]): Idle time, in seconds, before a keepalive event.
+
+        Yields:
+            Tuple[str, Any]: The event name and its payload; the last event is
+            ("result", ChallengeResponseDTO).
+
+        Raises:
+            OverloadedError: If the LLM admission controller shed the request.
+        """
+        self.logger.log_info("[service] streaming challenge prompt")
+        try:
+            async with aclosing(
+                self.workflow.stream_prompt_async(request, keepalive)
+            ) as events:
+                async for event, payload in events:
+                    if event == "result":
+                        self.logger.log_debug("[service] response: %s", payload)
+                        payload = ChallengeResponseDTO(**payload)
+                    yield event, payload
+
+        except OverloadedError:
+            raise
+
+        except ValueError as ve:
+            yield "result", self._value_error_response(ve)
+
+        except Exception as e:
+            yield "result", self._unexpected_error_response(e)
+
+    async def handle_stream_async(
+        self, operation: str, chunks: AsyncIterator[bytes]
+    ) -> ChallengeResponseDTO:
+        """
+        Handles an operation whose operands are streamed in the request body.
+
+        Args:
+            operation (str): The operation to execute.
+            chunks (AsyncIterator[bytes]): The NDJSON request body chunks.
+
+        Returns:
+            ChallengeResponseDTO: Response DTO with the operation result or error information.
+        """
+        try:
+            self.logger.log_info("[service] processing streamed challenge request")
+            with METRICS.span("workflow", operation):
+                result = await self.workflow.process_stream_async(operation, chunks)
+            self.logger.log_debug("[service] response: %s", result)
+            return ChallengeResponseDTO(**result)
+
+        except ValueError as ve:
+            return self._value_error_response(ve)
+
+        except Exception as e:
+            return self._unexpected_error_response(e)
+
+    def handle_binary(
+        self, operation: str, dtype: str, body: bytes
+    ) -> ChallengeResponseDTO:
+        """
+        Handles an operation whose operands are sent as a typed binary buffer.
+
+        The buffer is wrapped as a NumPy array without copying it and handed to the workflow.
+
+        Args:
+            operation (str): The operation to execute.
+            dtype (str): The operand type of the buffer, "float64" or "int64".
+            body (bytes): The little-endian operand buffer.
+
+        Returns:
+            ChallengeResponseDTO: Response DTO with the operation result or error information.
+        """
+        try:
+            self.logger.log_info("[service] processing binary challenge request")
+            operands = decode_operands(body, dtype)
+            with METRICS.span("workflow", operation):
+                result = self.workflow.process_array(operation, operands)
+            self.logger.log_debug("[service] response: %s", result)
+            return ChallengeResponseDTO(**result)
+
+        except ValueError as ve:
+            return self._value_error_response(ve)
+
+        except Exception as e:
+            return self._unexpected_error_response(e)
+
+    def handle_batch(self, request: ChallengeBatchRequestDTO) -> ChallengeResponseDTO:
+        """
+        Handles a batch of challenge requests by invoking the batch workflow.
+
+        Args:
+            request (ChallengeBatchRequestDTO): The batch of challenge operations.
+
+        Returns:
+            ChallengeResponseDTO: Response DTO with the per-item results or error information.
+        """
+        try:
+            self.logger.log_info("[service] processing challenge batch request")
+            with METRICS.span("workflow", "batch"):
+                result = self.workflow.process_batch(request)
+            self.logger.log_debug("[service] batch response: %s", result)
+            return ChallengeResponseDTO(**result)
+
+        except Exception as e:
+            self.logger.log_error("[service] unexpected batch error: %s", e)
             return ChallengeResponseDTO(
                 success=False,
-                message="Unexpected error during operation.",
+                message="Unexpected error during batch operation.",
                 data={"error": str(e)},
             )
+
+    def register_metrics(self) -> None:
+        """
+        Exports the counters of the service and of its workflow on the metrics registry.
+        """
+        if self.single_flight is not None:
+            METRICS.register_collector("single_flight", self.single_flight.stats)
+        self.workflow.register_metrics()
+
+    async def _coalesce(
+        self,
+        key: Optional[Hashable],
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Runs a workflow call through the single-flight layer, when enabled.
+
+        Args:
+            key (Optional[Hashable]): The request key; None disables coalescing for the call.
+            call (Callable[[], Awaitable[Dict[str, Any]]]): Factory of the workflow call.
+
+        Returns:
+            Dict[str, Any]: The workflow result, shared by every coalesced request.
+        """
+        if self.single_flight is None:
+            return await call()
+        return await self.single_flight.do(key, call)
+
+    def _timeout_response(self) -> ChallengeResponseDTO:
+        self.logger.log_error("[service] operation timed out")
+        return ChallengeResponseDTO(
+            success=False,
+            message="Operation timed out.",
+            data=None,
+        )
+
+    def _value_error_response(self, error: ValueError) -> ChallengeResponseDTO:
+        self.logger.log_error("[service] value error: %s", error)
+        return ChallengeResponseDTO(
+            success=False,
+            message="Invalid input or operation error.",
+            data={"error": str(error)},
+        )
+
+    def _unexpected_error_response(self, error: Exception) -> ChallengeResponseDTO:
+        self.logger.log_error("[service] unexpected error: %s", error)
+        return ChallengeResponseDTO(
+            success=False,
+            message="Unexpected error during operation.",
+            data={"error": str(error)},
+        )
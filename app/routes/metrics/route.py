@@ -0,0 +1,65 @@
+import time
+
+from typing import Any, Callable
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
+
+from app.metrics.metrics import METRICS
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+
+class TimedRoute(APIRoute):
+    """
+    Route class recording the full handling time of each request.
+
+    The timing covers body parsing, DTO validation, dependencies, the endpoint and
+    the response object, so its difference with the "controller" stage is the
+    framework overhead.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        # The endpoint name is stable whatever the prefix the router is mounted under.
+        route = self.name
+
+        async def timed_handler(request: Any) -> Any:
+            if not METRICS.enabled:
+                return await handler(request)
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                METRICS.observe(
+                    "challenge_request_duration_seconds",
+                    (route,),
+                    time.perf_counter() - started,
+                )
+
+        return timed_handler
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus metrics",
+    description="Exposes per-stage latency histograms and per-operation counters in the Prometheus text format.",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+)
+def metrics():
+    """
+    Handles the GET request of the Prometheus scraper.
+
+    Returns:
+        PlainTextResponse: The metrics in the Prometheus text exposition format.
+
+    Raises:
+        HTTPException: 404 when metrics are disabled.
+    """
+    if not METRICS.enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(METRICS.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
 from app.routes.challenge.route import router as challenge_router
+from app.routes.metrics.route import router as metrics_router
 
 api_router = APIRouter()
 
 api_router.include_router(challenge_router, prefix="/api/v1", tags=["Challenge"])
+api_router.include_router(metrics_router, tags=["Metrics"])
@@ -1,3 +1,5 @@
-from typing import Union
+from typing import Literal, Union
 
 Number = Union[int, float]
+
+Precision = Literal["float", "compensated", "exact", "decimal"]
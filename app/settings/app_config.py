@@ -1,4 +1,4 @@
-from settings.setting import get_settings, Environment
+from app.settings.setting import get_settings, Environment
 
 
 class AppConfig:
@@ -1,5 +1,7 @@
 from enum import Enum
 from functools import lru_cache
+from typing import List, Optional
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -14,6 +16,12 @@ class Environment(str, Enum):
 
 class AppEnvironmentSettings(BaseSettings):
     environment: Environment = Environment.DEV
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1
+    graceful_timeout: float = 30.0
+    drain_timeout: float = 5.0
+    keepalive_timeout: int = 5
 
     model_config = {
         "env_prefix": "APP_",
@@ -24,6 +32,23 @@ class AppEnvironmentSettings(BaseSettings):
 class OpenAISettings(BaseSettings):
     api_key: str
     model_name: str = "gpt-4o"
+    fast_path_enabled: bool = True
+    max_agent_iterations: int = 5
+    base_url: Optional[str] = None
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+    max_retries: int = 2
+    retry_backoff_base: float = 0.5
+    retry_backoff_max: float = 8.0
+    max_concurrent_calls: int = 16
+    max_queued_calls: int = 64
+    queue_timeout: float = 10.0
+    rate_limit_per_second: float = 10.0
+    rate_limit_burst: int = 20
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    warmup: bool = False
 
     model_config = {
         "env_prefix": "OPENAI_",
@@ -32,7 +57,18 @@ class OpenAISettings(BaseSettings):
 
 
 class SentrySettings(BaseSettings):
-    dns: str
+    dns: str = ""
+    enabled: bool = True
+    send_default_pii: bool = True
+    sample_rate: float = 1.0
+    traces_sample_rate: float = 1.0
+    fast_path_traces_sample_rate: float = 0.0
+    fast_path_routes: List[str] = [
+        "/api/v1/challenge",
+        "/api/v1/challenge/batch",
+        "/api/v1/challenge/stream",
+        "/api/v1/challenge/binary",
+    ]
 
     model_config = {
         "env_prefix": "SENTRY_",
@@ -40,6 +76,82 @@ class SentrySettings(BaseSettings):
     }
 
 
+class LoggingSettings(BaseSettings):
+    use_queue: bool = False
+    sentry_batch_size: int = 50
+    sentry_flush_interval: float = 5.0
+
+    model_config = {
+        "env_prefix": "LOG_",
+        "extra": "forbid",
+    }
+
+
+class CacheBackendType(str, Enum):
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
+class CacheSettings(BaseSettings):
+    enabled: bool = True
+    backend: CacheBackendType = CacheBackendType.MEMORY
+    redis_url: str = "redis://localhost:6379/0"
+    key_prefix: str = "challenge:cache:"
+    max_size: int = 1024
+    ttl_seconds: float = 300.0
+    max_key_operands: int = 64
+    plan_max_size: int = 256
+
+    model_config = {
+        "env_prefix": "CACHE_",
+        "extra": "forbid",
+    }
+
+
+class PlanCacheSettings(BaseSettings):
+    enabled: bool = True
+    path: str = ".cache/prompt_plans.sqlite3"
+    max_entries: int = 10000
+    min_confirmations: int = 2
+    verify_rate: float = 0.05
+
+    model_config = {
+        "env_prefix": "PLAN_CACHE_",
+        "extra": "forbid",
+    }
+
+
+class CoalescingSettings(BaseSettings):
+    enabled: bool = True
+    timeout: float = 60.0
+
+    model_config = {
+        "env_prefix": "COALESCE_",
+        "extra": "forbid",
+    }
+
+
+class OffloadSettings(BaseSettings):
+    enabled: bool = True
+    max_workers: int = 0
+    min_operands: int = 2000
+    min_chunk: int = 1000
+
+    model_config = {
+        "env_prefix": "OFFLOAD_",
+        "extra": "forbid",
+    }
+
+
+class MetricsSettings(BaseSettings):
+    enabled: bool = True
+
+    model_config = {
+        "env_prefix": "METRICS_",
+        "extra": "forbid",
+    }
+
+
 class SecuritySettings(BaseSettings):
     secret_key: str
 
@@ -50,10 +162,18 @@ class SecuritySettings(BaseSettings):
 
 
 class Settings(BaseSettings):
-    sentry: SentrySettings = SentrySettings()
-    openai: OpenAISettings = OpenAISettings()
-    security: SecuritySettings = SecuritySettings()
-    env: AppEnvironmentSettings = AppEnvironmentSettings()
+    # Sections are built by `get_settings()` on first use, not when this module is
+    # imported, so importing the app does not require the environment to be set.
+    sentry: SentrySettings = Field(default_factory=SentrySettings)
+    openai: OpenAISettings = Field(default_factory=OpenAISettings)
+    security: SecuritySettings = Field(default_factory=SecuritySettings)
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    plan_cache: PlanCacheSettings = Field(default_factory=PlanCacheSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
+    coalescing: CoalescingSettings = Field(default_factory=CoalescingSettings)
+    offload: OffloadSettings = Field(default_factory=OffloadSettings)
+    env: AppEnvironmentSettings = Field(default_factory=AppEnvironmentSettings)
 
     model_config = {
         "env_file": ".env",
@@ -0,0 +1,384 @@
+"""
+Offline benchmark suite with regression checks against a stored baseline.
+
+Measures three levels of the stack, without network access or an OpenAI key:
+    micro  ChallengeEngine handlers and ChallengeValidator.validate across operand sizes.
+    asgi   Full controller -> service -> workflow path through the ASGI app, in process:
+           operation, batch, fast-path prompt and LLM prompt requests. LLM prompts are
+           answered by the stub server of `stub_llm_server.py` (tool call, then text).
+
+Each case reports p50/p95/p99 latency and throughput. With `--check`, cases whose
+p50 latency grew, or whose throughput dropped, by more than `--tolerance` against
+the baseline file fail the run (exit status 1). Only stable cases are gated: tail
+percentiles, and cases whose baseline p50 is below `--min-p50-us` (a few hundred
+nanoseconds of jitter is already a 50% change there), are reported but never fail
+the run.
+
+Baselines are machine specific, so none is committed: record one with
+`--save-baseline` on the machine running the checks, e.g. from the target branch
+before checking a change. `benchmarks/baseline.json` is ignored by git.
+
+Usage:
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --save-baseline
+    python benchmarks/bench_suite.py --check --tolerance 0.25 --min-p50-us 100
+    python benchmarks/bench_suite.py --suite micro --quick
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# Benchmarks run against the stub server with production logging, and measure the
+# serving path rather than the response and plan caches or the client-side rate limit.
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("SECURITY_SECRET_KEY", "benchmark")
+os.environ.update(
+    {
+        "APP_ENVIRONMENT": "prod",
+        "SENTRY_ENABLED": "false",
+        "CACHE_ENABLED": "false",
+        "PLAN_CACHE_ENABLED": "false",
+        "OPENAI_RATE_LIMIT_PER_SECOND": "0",
+        "OPENAI_WARMUP": "false",
+    }
+)
+
+import httpx  # noqa: E402
+
+from stub_llm_server import StubLLMServer, StubSettings  # noqa: E402
+
+OPERATIONS = ("sum", "subtract", "multiply", "divide")
+MICRO_SIZES = (2, 64, 4096)
+# Cases faster than this are dominated by timer and scheduling noise.
+MIN_GATED_P50_US = 20.0
+Stats = Dict[str, float]
+
+
+def summarize(latencies: List[float], elapsed: float, count: int) -> Stats:
+    """
+    Computes the latency percentiles and throughput of a case.
+
+    Args:
+        latencies (List[float]): Latency samples, in seconds.
+        elapsed (float): Wall time of the case, in seconds.
+        count (int): Number of operations performed during `elapsed`.
+
+    Returns:
+        Stats: p50/p95/p99 latency in microseconds and throughput per second.
+    """
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "p50_us": cuts[49] * 1e6,
+        "p95_us": cuts[94] * 1e6,
+        "p99_us": cuts[98] * 1e6,
+        "throughput": count / elapsed,
+    }
+
+
+def operands_for(operation: str, size: int, rng: random.Random) -> List[int]:
+    # Small non-zero integers keep every operation valid and products finite.
+    low, high = (1, 3) if operation == "multiply" else (1, 1000)
+    return [rng.randint(low, high) for _ in range(size)]
+
+
+def time_calls(call: Callable[[], Any], samples: int, inner: int) -> Stats:
+    """
+    Times a synchronous call.
+
+    Each sample times `inner` consecutive calls and keeps the mean, so timer
+    overhead does not dominate sub-microsecond calls.
+
+    Args:
+        call (Callable[[], Any]): The call to time.
+        samples (int): Number of latency samples.
+        inner (int): Calls per sample.
+
+    Returns:
+        Stats: The case statistics.
+    """
+    for _ in range(inner):
+        call()
+
+    latencies = []
+    perf_counter = time.perf_counter
+    started = perf_counter()
+    for _ in range(samples):
+        sample_started = perf_counter()
+        for _ in range(inner):
+            call()
+        latencies.append((perf_counter() - sample_started) / inner)
+    return summarize(latencies, perf_counter() - started, samples * inner)
+
+
+def run_micro(scale: float) -> Dict[str, Stats]:
+    from app.core.engine import ChallengeEngine
+    from app.core.validator import ChallengeValidator
+
+    engine = ChallengeEngine()
+    validator = ChallengeValidator()
+    rng = random.Random(7)
+    results: Dict[str, Stats] = {}
+
+    for operation in OPERATIONS:
+        handler = engine.get_handler(operation)
+        for size in MICRO_SIZES:
+            operands = operands_for(operation, size, rng)
+            inner = max(1, 4096 // size)
+            samples = max(20, int(300 * scale))
+            results[f"micro/engine/{operation}/{size}"] = time_calls(
+                lambda: handler(operands), samples, inner
+            )
+            results[f"micro/validator/{operation}/{size}"] = time_calls(
+                lambda: validator.validate(operation, operands), samples, inner
+            )
+    return results
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    path: str,
+    payloads: Iterator[Dict[str, Any]],
+    requests: int,
+    concurrency: int,
+) -> Stats:
+    """
+    Sends requests from concurrent clients and times each one.
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the ASGI app.
+        path (str): The route to call.
+        payloads (Iterator[Dict[str, Any]]): Source of request bodies.
+        requests (int): Number of requests to send.
+        concurrency (int): Number of concurrent clients.
+
+    Returns:
+        Stats: The case statistics, with the number of non-200 responses.
+    """
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            body = next(payloads)
+            started = time.perf_counter()
+            response = await client.post(path, json=body)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200 or not response.json().get("success"):
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    stats = summarize(latencies, time.perf_counter() - started, requests)
+    stats["errors"] = errors
+    return stats
+
+
+def operation_payloads(rng: random.Random, size: int) -> Iterator[Dict[str, Any]]:
+    while True:
+        operation = rng.choice(OPERATIONS)
+        yield {"operation": operation, "operands": operands_for(operation, size, rng)}
+
+
+def batch_payloads(rng: random.Random, items: int) -> Iterator[Dict[str, Any]]:
+    operations = operation_payloads(rng, 8)
+    while True:
+        yield {"operations": [next(operations) for _ in range(items)]}
+
+
+def fast_path_payloads(rng: random.Random) -> Iterator[Dict[str, Any]]:
+    while True:
+        yield {"prompt": f"What is {rng.randint(1, 999)} plus {rng.randint(1, 999)}?"}
+
+
+def llm_payloads(rng: random.Random) -> Iterator[Dict[str, Any]]:
+    # Worded so the fast-path parser declines and the agent loop runs.
+    while True:
+        a, b, c = (rng.randint(1, 99) for _ in range(3))
+        yield {"prompt": f"Please work out ({a} + {b}) * {c} for me, step by step."}
+
+
+async def run_asgi(
+    scale: float, llm_latency_ms: float, concurrency: int
+) -> Dict[str, Stats]:
+    rng = random.Random(11)
+    stub = StubLLMServer(StubSettings(latency_ms=llm_latency_ms))
+    with stub:
+        os.environ["OPENAI_BASE_URL"] = stub.base_url
+
+        from main import app
+        from app.logs.setup_logger import LOGGER
+
+        # Keep the request logs out of the measurements and the report.
+        LOGGER.configure()
+        LOGGER.logger.setLevel(logging.WARNING)
+
+        cases = {
+            "asgi/operation": ("/api/v1/challenge", operation_payloads(rng, 16), 2000),
+            "asgi/batch": ("/api/v1/challenge/batch", batch_payloads(rng, 32), 500),
+            "asgi/prompt_fast_path": (
+                "/api/v1/challenge/prompt",
+                fast_path_payloads(rng),
+                2000,
+            ),
+            "asgi/prompt_llm": ("/api/v1/challenge/prompt", llm_payloads(rng), 300),
+        }
+
+        results: Dict[str, Stats] = {}
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench", timeout=60.0
+            ) as client:
+                for name, (path, payloads, requests) in cases.items():
+                    await drive(client, path, payloads, concurrency, concurrency)
+                    results[name] = await drive(
+                        client,
+                        path,
+                        payloads,
+                        max(concurrency, int(requests * scale)),
+                        concurrency,
+                    )
+                    if name == "asgi/prompt_llm" and stub.settings.calls == 0:
+                        raise RuntimeError("LLM prompts never reached the stub server.")
+    return results
+
+
+def compare(
+    results: Dict[str, Stats],
+    baseline: Dict[str, Stats],
+    tolerance: float,
+    min_p50_us: float = MIN_GATED_P50_US,
+) -> List[str]:
+    """
+    Lists the cases that regressed against the baseline.
+
+    Failed requests are always reported; latency and throughput are only compared
+    for the cases stable enough to gate on.
+
+    Args:
+        results (Dict[str, Stats]): Statistics of this run.
+        baseline (Dict[str, Stats]): Stored statistics.
+        tolerance (float): Allowed relative degradation (0.5 for 50%).
+        min_p50_us (float): Cases whose baseline p50 is below this are not timed against it.
+
+    Returns:
+        List[str]: One description per regression; cases absent from the baseline are skipped.
+    """
+    regressions = []
+    for name, stats in results.items():
+        if stats.get("errors"):
+            regressions.append(f"{name}: {stats['errors']:.0f} failed requests")
+        reference = baseline.get(name)
+        if reference is None or reference["p50_us"] < min_p50_us:
+            continue
+        if stats["p50_us"] > reference["p50_us"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p50_us {stats['p50_us']:.1f} > baseline "
+                f"{reference['p50_us']:.1f}"
+            )
+        if stats["throughput"] < reference["throughput"] / (1 + tolerance):
+            regressions.append(
+                f"{name}: throughput {stats['throughput']:.1f}/s < baseline "
+                f"{reference['throughput']:.1f}/s"
+            )
+    return regressions
+
+
+def print_report(
+    results: Dict[str, Stats], baseline: Dict[str, Stats], min_p50_us: float
+) -> None:
+    print(
+        f"{'case':<34} {'p50 us':>10} {'p95 us':>10} {'p99 us':>10} "
+        f"{'ops/s':>12} {'errors':>7} {'vs base':>8}"
+    )
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        delta = ""
+        if reference:
+            delta = f"{stats['p50_us'] / reference['p50_us'] - 1:>+7.0%}"
+            # Ungated cases are marked so their swings are not read as regressions.
+            if reference["p50_us"] < min_p50_us:
+                delta = f"({delta.strip()})"
+        print(
+            f"{name:<34} {stats['p50_us']:>10.2f} {stats['p95_us']:>10.2f} "
+            f"{stats['p99_us']:>10.2f} {stats['throughput']:>12.1f} "
+            f"{stats.get('errors', 0):>7.0f} {delta:>8}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--suite", choices=("all", "micro", "asgi"), default="all")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument(
+        "--min-p50-us",
+        type=float,
+        default=MIN_GATED_P50_US,
+        help="Do not gate cases whose baseline p50 is below this.",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Run a tenth of the samples."
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--llm-latency-ms", type=float, default=20.0)
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON.")
+    args = parser.parse_args(argv)
+
+    scale = 0.1 if args.quick else 1.0
+    results: Dict[str, Stats] = {}
+    if args.suite in ("all", "micro"):
+        results.update(run_micro(scale))
+    if args.suite in ("all", "asgi"):
+        results.update(
+            asyncio.run(run_asgi(scale, args.llm_latency_ms, args.concurrency))
+        )
+
+    baseline: Dict[str, Stats] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+    print_report(results, baseline, args.min_p50_us)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    if args.save_baseline:
+        merged = {**baseline, **results}
+        args.baseline.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n")
+        print(f"baseline saved to {args.baseline}")
+
+    if args.check:
+        if not baseline:
+            print(f"no baseline at {args.baseline}; run with --save-baseline first")
+            return 1
+        regressions = compare(results, baseline, args.tolerance, args.min_p50_us)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"no regression beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Benchmark of the JSON and binary operand formats at 10, 10k and 1M operands.
+
+Sends the same float64 operands, through the ASGI app in process, as:
+    json         POST /challenge with a JSON body.
+    binary       POST /challenge/binary with a little-endian float64 body and a
+                 JSON response.
+    binary/raw   The same binary body, answered with 8 raw bytes
+                 (`Accept: application/octet-stream`).
+
+Reports the body size, the request latency percentiles and, for the binary body,
+the time `process_binary` holds the event loop (decode, validation and reduction
+all run inline on the loop), which tells whether large binary payloads need to be
+offloaded to a worker.
+
+Usage:
+    python benchmarks/binary_vs_json.py
+    python benchmarks/binary_vs_json.py --sizes 10 10000 1000000 --operation multiply
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+from bench_suite import Stats, summarize, time_calls
+
+BINARY_HEADERS = {"Content-Type": "application/octet-stream"}
+
+
+def samples_for(size: int) -> int:
+    return max(5, min(300, 3_000_000 // (size * 10)))
+
+
+def build_operands(operation: str, size: int, rng: random.Random) -> List[float]:
+    # Factors close to 1 keep a product of a million operands finite.
+    low, high = (0.9999, 1.0001) if operation == "multiply" else (1.0, 1000.0)
+    return [rng.uniform(low, high) for _ in range(size)]
+
+
+async def time_requests(
+    client: httpx.AsyncClient, requests: int, **request: object
+) -> Stats:
+    await client.post(**request)
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        call_started = time.perf_counter()
+        response = await client.post(**request)
+        latencies.append(time.perf_counter() - call_started)
+        if response.status_code != 200:
+            raise RuntimeError(f"{request['url']} failed: {response.text[:200]}")
+    return summarize(latencies, time.perf_counter() - started, requests)
+
+
+async def run(args: argparse.Namespace) -> List[Tuple[int, str, int, Stats]]:
+    from main import app
+    from app.logs.setup_logger import LOGGER
+    from app.routes.challenge.providers.provider import build_challenge_controller
+
+    LOGGER.configure()
+    LOGGER.logger.setLevel(logging.WARNING)
+
+    controller = build_challenge_controller()
+    rows: List[Tuple[int, str, int, Stats]] = []
+    rng = random.Random(17)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            timeout=120.0,
+        ) as client:
+            for size in args.sizes:
+                operands = build_operands(args.operation, size, rng)
+                requests = samples_for(size)
+                json_body = json.dumps(
+                    {"operation": args.operation, "operands": operands}
+                ).encode()
+                binary_body = np.asarray(operands, dtype="<f8").tobytes()
+                binary_url = f"/api/v1/challenge/binary?operation={args.operation}"
+
+                cases: Dict[str, Tuple[int, dict]] = {
+                    "json": (
+                        len(json_body),
+                        {
+                            "url": "/api/v1/challenge",
+                            "content": json_body,
+                            "headers": {"Content-Type": "application/json"},
+                        },
+                    ),
+                    "binary": (
+                        len(binary_body),
+                        {
+                            "url": binary_url,
+                            "content": binary_body,
+                            "headers": BINARY_HEADERS,
+                        },
+                    ),
+                    "binary/raw": (
+                        len(binary_body),
+                        {
+                            "url": binary_url,
+                            "content": binary_body,
+                            "headers": {
+                                **BINARY_HEADERS,
+                                "Accept": "application/octet-stream",
+                            },
+                        },
+                    ),
+                }
+                for name, (body_size, request) in cases.items():
+                    stats = await time_requests(client, requests, **request)
+                    rows.append((size, name, body_size, stats))
+
+                blocking = time_calls(
+                    lambda: controller.process_binary(
+                        args.operation, "float64", binary_body
+                    ),
+                    requests,
+                    1,
+                )
+                rows.append((size, "loop blocked", len(binary_body), blocking))
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 10_000, 1_000_000])
+    parser.add_argument(
+        "--operation", default="sum", choices=("sum", "subtract", "multiply", "divide")
+    )
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(run(args))
+    print(
+        f"{'operands':>9}  {'format':<13}{'body KiB':>10}{'p50 ms':>10}"
+        f"{'p99 ms':>10}{'vs json':>9}"
+    )
+    json_p50: Dict[int, float] = {}
+    for size, name, body_size, stats in rows:
+        json_p50.setdefault(size, stats["p50_us"])
+        print(
+            f"{size:>9}  {name:<13}{body_size / 1024:>10.1f}"
+            f"{stats['p50_us'] / 1e3:>10.3f}{stats['p99_us'] / 1e3:>10.3f}"
+            f"{json_p50[size] / stats['p50_us']:>8.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,169 @@
+"""
+Benchmark of /challenge under 1,000 concurrent connections, async against threadpool.
+
+Starts one uvicorn server (in a subprocess, PROD logging) exposing two routes backed
+by the same shared controller:
+    async  /api/v1/challenge, the `async def` handler awaiting `process_async` on
+           the event loop.
+    sync   /api/v1/bench/challenge-sync, a `def` handler calling `process`, which
+           Starlette runs on its threadpool (40 threads by default), as the route
+           did before the async path.
+
+Each case keeps `--connections` keep-alive connections open, every one sending
+operation requests back to back for `--duration` seconds, and reports throughput,
+latency percentiles and failed requests. The client shares the machine with the
+server, so absolute numbers are bounded by the cores available; compare the rows.
+
+Usage:
+    python benchmarks/concurrency_1k.py
+    python benchmarks/concurrency_1k.py --connections 1000 --duration 10
+"""
+
+import argparse
+import asyncio
+import random
+import subprocess
+import sys
+import time
+
+from typing import Dict, List, Optional
+
+import httpx
+
+from bench_suite import ROOT, Stats, operation_payloads, summarize
+from load_test import free_port, wait_ready
+
+PATHS = {
+    "async": "/api/v1/challenge",
+    "sync": "/api/v1/bench/challenge-sync",
+}
+
+
+def serve(port: int) -> None:
+    """
+    Runs the application with the extra threadpool route, until terminated.
+
+    Args:
+        port (int): The port to listen on.
+    """
+    import uvicorn
+
+    from fastapi import Depends
+
+    from app.routes.challenge.controllers.controller import ChallengeController
+    from app.routes.challenge.dtos.dto import ChallengeRequestDTO
+    from app.routes.challenge.providers.provider import get_challenge_controller
+    from main import app
+
+    @app.post(PATHS["sync"])
+    def challenge_sync(
+        request: ChallengeRequestDTO,
+        controller: ChallengeController = Depends(get_challenge_controller),
+    ):
+        return controller.process(request)
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", backlog=4096)
+
+
+async def run_case(
+    base_url: str, path: str, connections: int, duration: float
+) -> Stats:
+    """
+    Drives one route with a fixed number of concurrent keep-alive connections.
+
+    Args:
+        base_url (str): The server URL.
+        path (str): The route to call.
+        connections (int): Number of concurrent connections.
+        duration (float): Length of the measurement, in seconds.
+
+    Returns:
+        Stats: Latency percentiles and throughput, plus `errors`.
+    """
+    payloads = operation_payloads(random.Random(11), 16)
+    latencies: List[float] = []
+    errors = 0
+    limits = httpx.Limits(
+        max_connections=connections, max_keepalive_connections=connections
+    )
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60.0
+    ) as client:
+
+        async def connection(deadline: float) -> None:
+            nonlocal errors
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(path, json=next(payloads))
+                    failed = response.status_code != 200
+                except httpx.HTTPError:
+                    failed = True
+                latencies.append(time.perf_counter() - started)
+                errors += failed
+
+        # A short warm-up opens the connections before the measured run.
+        await asyncio.gather(
+            *(connection(time.monotonic() + 1.0) for _ in range(connections))
+        )
+        latencies.clear()
+        errors = 0
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(connection(time.monotonic() + duration) for _ in range(connections))
+        )
+        elapsed = time.perf_counter() - started
+
+    stats = summarize(latencies, elapsed, len(latencies))
+    stats["errors"] = errors
+    return stats
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Stats]:
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", str(port)],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        await wait_ready(base_url)
+        return {
+            name: await run_case(base_url, path, args.connections, args.duration)
+            for name, path in PATHS.items()
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--serve", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        serve(args.serve)
+        return 0
+
+    results = asyncio.run(run(args))
+    print(
+        f"{'route':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'errors':>8}"
+    )
+    for name, stats in results.items():
+        print(
+            f"{name:<8}{stats['throughput']:>10.1f}{stats['p50_us'] / 1e3:>10.1f}"
+            f"{stats['p95_us'] / 1e3:>10.1f}{stats['p99_us'] / 1e3:>10.1f}"
+            f"{stats['errors']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+"""
+Benchmark corpus of prompts showing the latency distribution of each prompt path.
+
+Sends a corpus of prompt templates, filled with random numbers, to /challenge/prompt
+through the ASGI app, one request at a time, with the LLM answered by the stub
+server of `stub_llm_server.py`. Each prompt is assigned to the path that answered it:
+    fast_path  Recognized by FastPathParser and executed directly with the engine.
+    llm        Declined by the parser and answered by the agent loop (two stub
+               completions: a tool call, then the final text).
+
+Reports, per path, the number of prompts and the latency percentiles, then the
+fast-path counters as exported on /metrics. The response and plan caches are
+disabled, so every prompt takes its path.
+
+Usage:
+    python benchmarks/fast_path_corpus.py
+    python benchmarks/fast_path_corpus.py --repeats 50 --llm-latency-ms 300
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import time
+
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from bench_suite import Stats, summarize
+from stub_llm_server import StubLLMServer, StubSettings
+
+# Templates are filled with random integers; the expected path is not stored, the
+# parser of the app decides it.
+CORPUS = (
+    "What is {} plus {}?",
+    "what's {} + {}",
+    "add {} and {}",
+    "the sum of {} and {}",
+    "{} minus {}",
+    "subtract {} from {}",
+    "What is the difference between {} and {}?",
+    "multiply {} and {}",
+    "{} times {}",
+    "calculate the product of {} and {}",
+    "{} divided by {}",
+    "Can you tell me what {} over {} is?",
+    "I bought {} apples and ate {}, how many are left?",
+    "Please work out ({} + {}) * 3 for me, step by step.",
+    "If a box holds {} pens, how many pens are in {} boxes?",
+    "Split {} dollars between {} friends, how much does each get?",
+)
+
+
+def build_prompts(repeats: int, rng: random.Random) -> List[str]:
+    prompts = [
+        template.format(*(rng.randint(1, 999) for _ in range(template.count("{}"))))
+        for template in CORPUS
+        for _ in range(repeats)
+    ]
+    rng.shuffle(prompts)
+    return prompts
+
+
+async def run(args: argparse.Namespace) -> Tuple[Dict[str, Stats], List[str]]:
+    stub = StubLLMServer(StubSettings(latency_ms=args.llm_latency_ms))
+    with stub:
+        os.environ["OPENAI_BASE_URL"] = stub.base_url
+
+        from main import app
+        from app.core.parser import FastPathParser
+        from app.logs.setup_logger import LOGGER
+
+        LOGGER.configure()
+        LOGGER.logger.setLevel(logging.WARNING)
+
+        parser = FastPathParser()
+        prompts = build_prompts(args.repeats, random.Random(13))
+        latencies: Dict[str, List[float]] = {"fast_path": [], "llm": []}
+        elapsed = {"fast_path": 0.0, "llm": 0.0}
+
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://bench",
+                timeout=60.0,
+            ) as client:
+                # The first LLM prompt imports and builds the agent; keep it out.
+                for prompt in (CORPUS[0], CORPUS[-1]):
+                    await client.post(
+                        "/api/v1/challenge/prompt",
+                        json={"prompt": prompt.format(*range(1, 3))},
+                    )
+                for prompt in prompts:
+                    path = "llm" if parser.parse(prompt) is None else "fast_path"
+                    started = time.perf_counter()
+                    response = await client.post(
+                        "/api/v1/challenge/prompt", json={"prompt": prompt}
+                    )
+                    took = time.perf_counter() - started
+                    if response.status_code != 200:
+                        raise RuntimeError(f"{prompt!r} failed: {response.text}")
+                    latencies[path].append(took)
+                    elapsed[path] += took
+                scrape = (await client.get("/metrics")).text
+
+    exported = [
+        line
+        for line in scrape.splitlines()
+        if line.startswith('challenge_component_stats{component="fast_path_parser"')
+    ]
+    results: Dict[str, Stats] = {}
+    for path, samples in latencies.items():
+        if len(samples) > 1:
+            results[path] = summarize(samples, elapsed[path], len(samples))
+            results[path]["prompts"] = len(samples)
+    return results, exported
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    results, exported = asyncio.run(run(args))
+    print(f"{'path':<12}{'prompts':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for path, stats in results.items():
+        print(
+            f"{path:<12}{stats['prompts']:>9}{stats['p50_us'] / 1e3:>10.2f}"
+            f"{stats['p95_us'] / 1e3:>10.2f}{stats['p99_us'] / 1e3:>10.2f}"
+        )
+    print("\n".join(exported))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+"""
+Benchmark of the fused validation and execution path of ChallengeWorkflow.
+
+Compares, for the four operations and growing operand counts:
+    separate  The pre-fusion sequence: the DTO type scan of the operands, the
+              ChallengeValidator divisor pre-scan, a copy of the operands after the
+              first (the engine's former `operands[1:]` for subtract and divide),
+              then the engine reduction.
+    fused     `ChallengeWorkflow._execute`, which validates divisors inside the
+              reduction and iterates without copying.
+
+Both variants go through the same `_execute` call, so the logging and response
+building are identical and only the extra passes differ. `passes` counts the full
+traversals of the operand list (iterations and slice copies) made by each variant.
+
+Usage:
+    python benchmarks/fused_execution.py
+    python benchmarks/fused_execution.py --sizes 16 4096 262144
+"""
+
+import argparse
+import random
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from bench_suite import OPERATIONS, Stats, operands_for, time_calls
+
+from app.core.validator import ChallengeValidator
+from app.core.workflow import ChallengeWorkflow
+from app.schemas.schema import Number
+
+TAIL_COPYING = ("subtract", "divide")
+
+
+class CountingList(list):
+    """List counting the traversals made over it and its copies: iterations and slices."""
+
+    passes = 0
+
+    def __iter__(self):
+        CountingList.passes += 1
+        return super().__iter__()
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            CountingList.passes += 1
+        return super().__getitem__(index)
+
+
+def separate(
+    workflow: ChallengeWorkflow,
+    validator: ChallengeValidator,
+    operation: str,
+    operands: List[Number],
+) -> Dict[str, Any]:
+    all(isinstance(value, (int, float)) for value in operands)
+    if not validator.validate(operation, operands):
+        return {"success": False}
+    if operation in TAIL_COPYING:
+        tail = operands[1:]
+        # Rebuilt with the type of the input, so passes over the copy are counted too.
+        operands = type(operands)([operands[0], *tail])
+    return workflow._execute(operation, operands)
+
+
+def fused(
+    workflow: ChallengeWorkflow,
+    validator: ChallengeValidator,
+    operation: str,
+    operands: List[Number],
+) -> Dict[str, Any]:
+    return workflow._execute(operation, operands)
+
+
+def count_passes(call: Any, *args: Any) -> int:
+    *head, operands = args
+    CountingList.passes = 0
+    call(*head, CountingList(operands))
+    return CountingList.passes
+
+
+def run(
+    sizes: List[int], samples: int
+) -> List[Tuple[str, int, int, int, Stats, Stats]]:
+    from app.logs.setup_logger import LOGGER
+
+    LOGGER.configure()
+    workflow = ChallengeWorkflow(cache=None, parser=None, plan_cache=None)
+    validator = ChallengeValidator()
+    rng = random.Random(19)
+    rows = []
+    for operation in OPERATIONS:
+        for size in sizes:
+            operands = operands_for(operation, size, rng)
+            args = (workflow, validator, operation, operands)
+            inner = max(1, 4096 // size)
+            rows.append(
+                (
+                    operation,
+                    size,
+                    count_passes(separate, *args),
+                    count_passes(fused, *args),
+                    time_calls(lambda: separate(*args), samples, inner),
+                    time_calls(lambda: fused(*args), samples, inner),
+                )
+            )
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 4096, 262144])
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'operation':<10}{'operands':>9}{'passes':>9}{'separate us':>13}"
+        f"{'fused us':>11}{'saved':>8}"
+    )
+    for operation, size, before, after, slow, fast in run(args.sizes, args.samples):
+        saved = 1 - fast["p50_us"] / slow["p50_us"]
+        print(
+            f"{operation:<10}{size:>9}{f'{before} -> {after}':>9}"
+            f"{slow['p50_us']:>13.1f}{fast['p50_us']:>11.1f}{saved:>8.0%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+"""
+Import-time benchmark guarding the API cold start.
+
+Imports `main` in fresh interpreters with `python -X importtime`, reports the
+median cumulative import time and the slowest packages, and fails
+when the budget is exceeded or when a module that must stay lazy (LLM
+libraries, Sentry) is imported at startup. The interpreters run without any
+application setting in their environment, so the import also fails if it loads
+and validates the settings. `tests/test_import_time.py` runs this check.
+
+Usage:
+    python benchmarks/import_time.py --budget-ms 1200 --runs 5
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules only needed once a prompt reaches the LLM agent, or once Sentry is
+# initialized by the lifespan.
+LAZY_MODULES = ("langchain_core", "langchain_openai", "openai", "sentry_sdk", "httpx")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+# Prefixes of the application settings (see app/settings/setting.py).
+SETTING_PREFIXES = (
+    "APP_",
+    "CACHE_",
+    "COALESCING_",
+    "LOGGING_",
+    "METRICS_",
+    "OFFLOAD_",
+    "OPENAI_",
+    "PLAN_CACHE_",
+    "SECURITY_",
+    "SENTRY_",
+)
+
+
+def clean_env() -> Dict[str, str]:
+    """
+    Returns the current environment without any application setting.
+    """
+    return {
+        name: value
+        for name, value in os.environ.items()
+        if not name.upper().startswith(SETTING_PREFIXES)
+    }
+
+
+def measure() -> Tuple[float, Dict[str, float], Set[str]]:
+    """
+    Imports `main` once in a fresh interpreter.
+
+    Returns:
+        Tuple[float, Dict[str, float], Set[str]]: The cumulative import time of
+        `main` in milliseconds, the cumulative time of each imported package, and
+        the names of all imported modules.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT,
+        env=clean_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    packages: Dict[str, float] = {}
+    modules: Set[str] = set()
+    total = 0.0
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative_ms = int(match.group(2)) / 1000
+        module = match.group(4)
+        modules.add(module)
+        if module == "main":
+            total = cumulative_ms
+            continue
+        package = module.split(".")[0]
+        packages[package] = max(packages.get(package, 0.0), cumulative_ms)
+    return total, packages, modules
+
+
+def eager_lazy_modules(modules: Iterable[str]) -> List[str]:
+    return sorted({module.split(".")[0] for module in modules} & set(LAZY_MODULES))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=1200.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    # The first run also compiles bytecode; it is not representative of a cold
+    # start from a built image.
+    measure()
+    runs = [measure() for _ in range(args.runs)]
+    median_ms = statistics.median(total for total, _, _ in runs)
+    _, packages, modules = runs[-1]
+
+    print(
+        f"import main: {median_ms:.1f} ms "
+        f"(median of {args.runs}, budget {args.budget_ms:.0f} ms)"
+    )
+    slowest = sorted(packages.items(), key=lambda item: -item[1])[: args.top]
+    for package, elapsed in slowest:
+        print(f"  {elapsed:>8.1f} ms  {package}")
+
+    failed = False
+    eager = eager_lazy_modules(modules)
+    if eager:
+        print(f"FAIL: imported at startup but expected lazy: {', '.join(eager)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"FAIL: import time exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
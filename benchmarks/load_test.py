@@ -0,0 +1,149 @@
+"""
+Load test measuring how the API throughput scales with the number of workers.
+
+For each worker count, the script starts `serve.py` on a free port, sends
+operation requests from concurrent clients for a fixed duration and reports the
+throughput and latency percentiles.
+
+Usage:
+    python benchmarks/load_test.py --workers 1 2 4 --duration 10 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+OPERATIONS = ("sum", "subtract", "multiply", "divide")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(
+    workers: int, port: int, extra_env: Optional[Dict[str, str]] = None
+) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "APP_HOST": "127.0.0.1",
+        "APP_PORT": str(port),
+        "APP_WORKERS": str(workers),
+        # Measure the serving path, not the response cache.
+        "CACHE_ENABLED": "false",
+        **(extra_env or {}),
+    }
+    return subprocess.Popen(
+        [sys.executable, "serve.py"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(f"{base_url}/openapi.json")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError("Server did not start in time.")
+
+
+def random_payload() -> Dict[str, object]:
+    return {
+        "operation": random.choice(OPERATIONS),
+        "operands": [random.randint(1, 1000) for _ in range(random.randint(2, 16))],
+    }
+
+
+async def client_loop(
+    client: httpx.AsyncClient, url: str, deadline: float, latencies: List[float]
+) -> int:
+    errors = 0
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        response = await client.post(url, json=random_payload())
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors += 1
+    return errors
+
+
+async def run_load(
+    base_url: str, duration: float, concurrency: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        deadline = time.monotonic() + duration
+        errors = await asyncio.gather(
+            *(
+                client_loop(client, f"{base_url}/api/v1/challenge", deadline, latencies)
+                for _ in range(concurrency)
+            )
+        )
+
+    if len(latencies) < 2:
+        raise RuntimeError(
+            f"Only {len(latencies)} requests completed in {duration}s; "
+            "increase the duration."
+        )
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "rps": len(latencies) / duration,
+        "p50_ms": cuts[49] * 1000,
+        "p99_ms": cuts[98] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    baseline = None
+    print(
+        f"{'workers':>7} {'req/s':>10} {'scaling':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}"
+    )
+    for workers in args.workers:
+        port = free_port()
+        server = start_server(workers, port)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            await wait_ready(base_url)
+            result = await run_load(base_url, args.duration, args.concurrency)
+        finally:
+            server.terminate()
+            server.wait()
+
+        baseline = baseline or result["rps"]
+        print(
+            f"{workers:>7} {result['rps']:>10.1f} {result['rps'] / baseline:>7.2f}x "
+            f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+"""
+Microbenchmark of the logging work done per /challenge request in PROD mode.
+
+Replays the log calls one operation request makes through the controller, service
+and workflow, in two styles:
+    eager  f-strings with `model_dump()` evaluated before every call, as the call
+           sites did before the lazy LoggerManager API.
+    lazy   The current calls: %-style arguments, `Lazy` payload dumps and payloads
+           logged at DEBUG.
+
+PROD logging runs at INFO with DEBUG disabled. Records go to a NullHandler, so only
+the message building and level checks are measured, not the terminal output.
+
+Usage:
+    python benchmarks/logging_overhead.py
+    python benchmarks/logging_overhead.py --operands 2 64 4096
+"""
+
+import argparse
+import logging
+import random
+
+from typing import List, Optional
+
+from bench_suite import Stats, operands_for, time_calls
+
+from app.logs.setup_logger import LOGGER, Lazy
+from app.routes.challenge.dtos.dto import ChallengeRequestDTO, ChallengeResponseDTO
+
+
+def eager_request(request: ChallengeRequestDTO, response: ChallengeResponseDTO) -> None:
+    LOGGER.log_info(f"[controller] request payload: {request.model_dump()}")
+    LOGGER.log_info("[service] processing challenge request")
+    LOGGER.log_debug(f"[service] request data: {request.model_dump()}")
+    LOGGER.log_info("[workflow] processing challenge operation")
+    LOGGER.log_debug(f"[workflow] request data: {request.model_dump()}")
+    LOGGER.log_info("[workflow] operation successful")
+    LOGGER.log_debug(f"[workflow] operation result: {response.data['result']}")
+    LOGGER.log_debug(f"[service] response: {response.model_dump()}")
+    LOGGER.log_info(f"[controller] response sent: {response.model_dump()}")
+
+
+def lazy_request(request: ChallengeRequestDTO, response: ChallengeResponseDTO) -> None:
+    LOGGER.log_debug("[controller] request payload: %s", Lazy(request.model_dump))
+    LOGGER.log_info("[service] processing challenge request")
+    LOGGER.log_debug("[service] request data: %s", Lazy(request.model_dump))
+    LOGGER.log_info("[workflow] processing challenge operation")
+    LOGGER.log_debug("[workflow] request data: %s", Lazy(request.model_dump))
+    LOGGER.log_info("[workflow] operation successful")
+    LOGGER.log_debug("[workflow] operation result: %s", response.data["result"])
+    LOGGER.log_debug("[service] response: %s", response)
+    LOGGER.log_debug("[controller] response sent: %s", Lazy(response.model_dump))
+
+
+def run(sizes: List[int], samples: int) -> dict:
+    LOGGER.configure()
+    for handler in list(LOGGER.logger.handlers):
+        LOGGER.logger.removeHandler(handler)
+    LOGGER.logger.addHandler(logging.NullHandler())
+
+    rng = random.Random(3)
+    results = {}
+    for size in sizes:
+        request = ChallengeRequestDTO(
+            operation="sum", operands=operands_for("sum", size, rng)
+        )
+        response = ChallengeResponseDTO(
+            success=True,
+            message="Operation completed successfully.",
+            data={"result": sum(request.operands)},
+        )
+        inner = max(1, 2000 // size)
+        for name, replay in (("eager", eager_request), ("lazy", lazy_request)):
+            results[f"{name}/{size}"] = time_calls(
+                lambda: replay(request, response), samples, inner
+            )
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--operands", type=int, nargs="+", default=[2, 64, 4096])
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    results = run(args.operands, args.samples)
+    print(f"{'case':<14}{'p50 us':>10}{'p99 us':>10}{'saved':>10}")
+    for size in args.operands:
+        eager: Stats = results[f"eager/{size}"]
+        lazy: Stats = results[f"lazy/{size}"]
+        for name, stats in (("eager", eager), ("lazy", lazy)):
+            saved = eager["p50_us"] / stats["p50_us"]
+            print(
+                f"{f'{name}/{size}':<14}{stats['p50_us']:>10.2f}"
+                f"{stats['p99_us']:>10.2f}{saved:>9.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
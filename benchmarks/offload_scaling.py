@@ -0,0 +1,201 @@
+"""
+Core-scaling benchmark of the process-pool offload of large reductions.
+
+Runs large exact reductions inline on the event loop and through `ReductionOffloader`
+pools of increasing size, and reports for each:
+    ms      Median wall time of one reduction.
+    speedup Inline time divided by the offloaded time.
+    stall   Longest event-loop stall seen by a 5 ms ticker during the reduction.
+    jobs/s  Throughput of `--concurrent` simultaneous reductions.
+
+Cases:
+    exact/multiply  Exact product of random integers (chunked tree reduction).
+    exact/sum       Exact sum of decimal floats (chunked tree reduction of Fractions).
+    exact/bigint    Exact product of integers beyond int64, pickled to one worker.
+
+Speedups are bounded by the cores available to the process, which are printed
+first: on a single core only the stall column shows a gain. The pool start-up is
+excluded from the timings.
+
+Usage:
+    python benchmarks/offload_scaling.py
+    python benchmarks/offload_scaling.py --workers 1 2 4 8 --quick
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("SECURITY_SECRET_KEY", "benchmark")
+os.environ.update({"APP_ENVIRONMENT": "prod", "SENTRY_ENABLED": "false"})
+
+from app.core.engine import ChallengeEngine  # noqa: E402
+from app.core.offload import ReductionOffloader  # noqa: E402
+from app.settings.setting import OffloadSettings  # noqa: E402
+
+Case = Tuple[str, List[Any]]
+
+
+def build_cases(scale: float, rng: random.Random) -> Dict[str, Case]:
+    """
+    Builds the operands of each case.
+
+    Args:
+        scale (float): Multiplier of the operand counts.
+        rng (random.Random): Seeded random generator.
+
+    Returns:
+        Dict[str, Case]: Operation and operands of each case.
+    """
+    ints = int(40_000 * scale)
+    floats = int(200_000 * scale)
+    bigints = int(10_000 * scale)
+    return {
+        "exact/multiply": (
+            "multiply",
+            [rng.randint(2, 10**6) for _ in range(ints)],
+        ),
+        "exact/sum": (
+            "sum",
+            [round(rng.uniform(-1e3, 1e3), 3) for _ in range(floats)],
+        ),
+        "exact/bigint": (
+            "multiply",
+            [rng.randint(2**64, 2**70) for _ in range(bigints)],
+        ),
+    }
+
+
+async def measure(
+    run: Callable[[], Awaitable[Any]], repeats: int
+) -> Tuple[float, float]:
+    """
+    Times a reduction while a ticker measures how long the event loop is blocked.
+
+    Args:
+        run (Callable[[], Awaitable[Any]]): Factory of the reduction.
+        repeats (int): Number of timed runs.
+
+    Returns:
+        Tuple[float, float]: Median wall time and longest loop stall, in milliseconds.
+    """
+    stalls: List[float] = []
+
+    async def ticker() -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            stalls.append(time.perf_counter() - start - 0.005)
+
+    times = []
+    for _ in range(repeats):
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        await run()
+        times.append(time.perf_counter() - start)
+        # Lets the ticker record a stall caused by a blocking run before it stops.
+        await asyncio.sleep(0.01)
+        task.cancel()
+    return statistics.median(times) * 1e3, max(stalls, default=0.0) * 1e3
+
+
+async def throughput(run: Callable[[], Awaitable[Any]], concurrent: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(run() for _ in range(concurrent)))
+    return concurrent / (time.perf_counter() - start)
+
+
+async def run_case(
+    name: str,
+    case: Case,
+    workers: List[int],
+    repeats: int,
+    concurrent: int,
+) -> List[Tuple[str, float, float, float]]:
+    operation, operands = case
+    engine = ChallengeEngine()
+
+    async def inline() -> Any:
+        return engine.reduce_with_precision(operation, operands, "exact")
+
+    expected = await inline()
+    rows = [
+        (
+            "inline",
+            *await measure(inline, repeats),
+            await throughput(inline, concurrent),
+        )
+    ]
+    for count in workers:
+        offloader = ReductionOffloader(OffloadSettings(), max_workers=count)
+        try:
+
+            async def offloaded() -> Any:
+                return await offloader.reduce_exact(operation, operands)
+
+            # The first job starts the pool and checks the result against the inline path.
+            if await offloaded() != expected:
+                raise AssertionError(f"{name}: offloaded result differs from inline")
+            rows.append(
+                (
+                    f"{count} worker{'s' if count > 1 else ''}",
+                    *await measure(offloaded, repeats),
+                    await throughput(offloaded, concurrent),
+                )
+            )
+        finally:
+            offloader.shutdown()
+    return rows
+
+
+def print_rows(name: str, rows: List[Tuple[str, float, float, float]]) -> None:
+    inline_ms = rows[0][1]
+    print(name)
+    print(f"  {'placement':<12}{'ms':>10}{'speedup':>10}{'stall ms':>10}{'jobs/s':>10}")
+    for placement, ms, stall, jobs in rows:
+        print(
+            f"  {placement:<12}{ms:>10.1f}{inline_ms / ms:>9.2f}x"
+            f"{stall:>10.1f}{jobs:>10.2f}"
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    cases = build_cases(0.25 if args.quick else 1.0, random.Random(7))
+    cores = (
+        len(os.sched_getaffinity(0))
+        if hasattr(os, "sched_getaffinity")
+        else os.cpu_count()
+    )
+    print(f"CPU cores available: {cores}")
+    for name, case in cases.items():
+        rows = await run_case(
+            name, case, args.workers, 1 if args.quick else 3, args.concurrent
+        )
+        print_rows(name, rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrent", type=int, default=4)
+    parser.add_argument(
+        "--quick", action="store_true", help="Quarter-size operands, single run."
+    )
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
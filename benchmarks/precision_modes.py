@@ -0,0 +1,94 @@
+"""
+Benchmark of the throughput cost of each arithmetic precision mode.
+
+Runs the same operands through `ChallengeWorkflow._execute` in every mode:
+    native       No `precision`: the operation's default handler.
+    float        float64 through the vectorized array path.
+    compensated  `math.fsum` for additive operations, float64 fold otherwise.
+    exact        int/Fraction arithmetic.
+    decimal/28   Decimal arithmetic with 28 significant digits (the default).
+    decimal/60   Decimal arithmetic with 60 significant digits.
+
+Operands are decimal floats (two decimals), the case where the modes disagree.
+Reports the p50 latency, the operands reduced per second and the cost relative to
+the native handler, per operation and operand count.
+
+Usage:
+    python benchmarks/precision_modes.py
+    python benchmarks/precision_modes.py --sizes 16 4096 --operations sum divide
+"""
+
+import argparse
+import random
+
+from typing import List, Optional, Tuple
+
+from bench_suite import OPERATIONS, Stats, time_calls
+
+from app.core.workflow import ChallengeWorkflow
+from app.schemas.schema import Number
+
+MODES: Tuple[Tuple[str, Optional[str], int], ...] = (
+    ("native", None, 28),
+    ("float", "float", 28),
+    ("compensated", "compensated", 28),
+    ("exact", "exact", 28),
+    ("decimal/28", "decimal", 28),
+    ("decimal/60", "decimal", 60),
+)
+
+
+def build_operands(operation: str, size: int, rng: random.Random) -> List[Number]:
+    # Factors close to 1 keep long products and quotients finite in every mode.
+    if operation in ("multiply", "divide"):
+        return [round(rng.uniform(0.5, 2.0), 2) for _ in range(size)]
+    return [round(rng.uniform(-1000, 1000), 2) for _ in range(size)]
+
+
+def run(
+    operations: List[str], sizes: List[int], samples: int
+) -> List[Tuple[str, int, str, Stats]]:
+    from app.logs.setup_logger import LOGGER
+
+    LOGGER.configure()
+    workflow = ChallengeWorkflow(cache=None, parser=None, plan_cache=None)
+    rng = random.Random(23)
+    rows = []
+    for operation in operations:
+        for size in sizes:
+            operands = build_operands(operation, size, rng)
+            inner = max(1, 2048 // size)
+            for name, precision, digits in MODES:
+                stats = time_calls(
+                    lambda: workflow._execute(operation, operands, precision, digits),
+                    samples,
+                    inner,
+                )
+                rows.append((operation, size, name, stats))
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 4096])
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'operation':<10}{'operands':>9}  {'mode':<13}{'p50 us':>10}"
+        f"{'Mops/s':>9}{'cost':>8}"
+    )
+    native = 0.0
+    for operation, size, name, stats in run(args.operations, args.sizes, args.samples):
+        if name == "native":
+            native = stats["p50_us"]
+        print(
+            f"{operation:<10}{size:>9}  {name:<13}{stats['p50_us']:>10.1f}"
+            f"{size / stats['p50_us']:>9.2f}{stats['p50_us'] / native:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+"""
+Benchmark of the application-scoped challenge pipeline against a pipeline per request.
+
+Compares, for /challenge operation requests:
+    shared       The controller built once by the lifespan and injected with Depends.
+    per_request  A new controller, service, workflow, engine and validator per request
+                 (the behaviour before the provider), through a dependency override.
+
+Reports, for each variant:
+    micro  Latency of `ChallengeController.process_async` and the memory allocated
+           per request (tracemalloc peak above the steady state).
+    asgi   Latency percentiles and throughput through the ASGI app, in process.
+
+Usage:
+    python benchmarks/provider_reuse.py
+    python benchmarks/provider_reuse.py --requests 5000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+import tracemalloc
+
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from bench_suite import Stats, drive, operation_payloads, summarize
+
+from app.routes.challenge.controllers.controller import ChallengeController
+from app.routes.challenge.dtos.dto import ChallengeRequestDTO
+from app.routes.challenge.providers.provider import (
+    build_challenge_controller,
+    get_challenge_controller,
+)
+
+
+async def run_micro(
+    controller_for: Callable[[], ChallengeController], requests: int
+) -> Stats:
+    """
+    Times `process_async` calls and measures the memory allocated by each one.
+
+    Args:
+        controller_for (Callable[[], ChallengeController]): Returns the controller
+            serving a request.
+        requests (int): Number of timed requests.
+
+    Returns:
+        Stats: Latency percentiles, throughput and `alloc_kib` per request.
+    """
+    rng = random.Random(5)
+    payloads = operation_payloads(rng, 16)
+    dtos = [ChallengeRequestDTO(**next(payloads)) for _ in range(requests)]
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for dto in dtos:
+        call_started = time.perf_counter()
+        await controller_for().process_async(dto)
+        latencies.append(time.perf_counter() - call_started)
+    stats = summarize(latencies, time.perf_counter() - started, requests)
+
+    peaks: List[int] = []
+    tracemalloc.start()
+    try:
+        for dto in dtos[:200]:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await controller_for().process_async(dto)
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    stats["alloc_kib"] = sum(peaks) / len(peaks) / 1024
+    return stats
+
+
+async def run_asgi(per_request: bool, requests: int, concurrency: int) -> Stats:
+    from main import app
+
+    if per_request:
+        app.dependency_overrides[get_challenge_controller] = build_challenge_controller
+    try:
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://bench"
+            ) as client:
+                payloads = operation_payloads(random.Random(9), 16)
+                await drive(
+                    client, "/api/v1/challenge", payloads, concurrency, concurrency
+                )
+                return await drive(
+                    client, "/api/v1/challenge", payloads, requests, concurrency
+                )
+    finally:
+        app.dependency_overrides.clear()
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Stats]:
+    from app.logs.setup_logger import LOGGER
+
+    LOGGER.configure()
+    LOGGER.logger.setLevel(logging.WARNING)
+
+    shared = build_challenge_controller()
+    return {
+        "micro/shared": await run_micro(lambda: shared, args.requests),
+        "micro/per_request": await run_micro(build_challenge_controller, args.requests),
+        "asgi/shared": await run_asgi(False, args.requests, args.concurrency),
+        "asgi/per_request": await run_asgi(True, args.requests, args.concurrency),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args))
+    print(
+        f"{'case':<22}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}"
+        f"{'ops/s':>10}{'alloc KiB':>11}"
+    )
+    for name, stats in results.items():
+        alloc = stats.get("alloc_kib")
+        print(
+            f"{name:<22}{stats['p50_us']:>10.1f}{stats['p95_us']:>10.1f}"
+            f"{stats['p99_us']:>10.1f}{stats['throughput']:>10.1f}"
+            f"{'' if alloc is None else f'{alloc:.1f}':>11}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
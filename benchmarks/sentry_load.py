@@ -0,0 +1,111 @@
+"""
+Load test comparing API throughput with Sentry tracing off, sampled and full.
+
+Each mode starts `serve.py` in PROD mode with its own Sentry settings and runs the
+`load_test.py` operation load against it. Events and traces are sent to a local
+sink standing in for Sentry, which counts the envelopes it receives:
+    off        SENTRY_ENABLED=false; the SDK is never imported or initialized.
+    default    Default sampler: operation routes dropped, other routes traced.
+    sampled    Operation routes traced at `--sample-rate`.
+    full       Every request traced.
+
+Usage:
+    python benchmarks/sentry_load.py --duration 10 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+from load_test import free_port, run_load, start_server, wait_ready
+
+
+class SentrySink(ThreadingHTTPServer):
+    """
+    Local HTTP server accepting Sentry envelopes and counting them.
+
+    Attributes:
+        envelopes (int): Number of envelopes received.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        self.envelopes = 0
+        self._lock = threading.Lock()
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with sink._lock:
+                    sink.envelopes += 1
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args) -> None:
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+
+    @property
+    def dsn(self) -> str:
+        return f"http://benchmark@127.0.0.1:{self.server_address[1]}/1"
+
+
+def modes(dsn: str, sample_rate: float) -> Dict[str, Dict[str, str]]:
+    traced = {"SENTRY_ENABLED": "true", "SENTRY_DNS": dsn}
+    return {
+        "off": {"SENTRY_ENABLED": "false"},
+        "default": traced,
+        "sampled": {**traced, "SENTRY_FAST_PATH_TRACES_SAMPLE_RATE": str(sample_rate)},
+        "full": {**traced, "SENTRY_FAST_PATH_TRACES_SAMPLE_RATE": "1.0"},
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    sink = SentrySink()
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+    print(
+        f"{'mode':>8} {'req/s':>10} {'vs off':>8} {'p50 ms':>8} {'p99 ms':>8}"
+        f" {'envelopes':>10} {'errors':>7}"
+    )
+    baseline = None
+    try:
+        for mode, env in modes(sink.dsn, args.sample_rate).items():
+            sink.envelopes = 0
+            port = free_port()
+            server = start_server(
+                args.workers, port, {"APP_ENVIRONMENT": "prod", **env}
+            )
+            try:
+                base_url = f"http://127.0.0.1:{port}"
+                await wait_ready(base_url)
+                result = await run_load(base_url, args.duration, args.concurrency)
+            finally:
+                server.terminate()
+                server.wait()
+
+            baseline = baseline or result["rps"]
+            print(
+                f"{mode:>8} {result['rps']:>10.1f} {result['rps'] / baseline:>7.2f}x"
+                f" {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+                f" {sink.envelopes:>10} {result['errors']:>7}"
+            )
+    finally:
+        sink.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
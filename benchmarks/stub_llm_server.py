@@ -0,0 +1,233 @@
+"""
+Local OpenAI-compatible chat completions server for offline benchmarks.
+
+The first model turn of a conversation answers with a tool call derived from the
+prompt (numbers and operation keywords, or the whole expression when the
+`evaluate_expression` tool is offered); once tool results are sent back, it
+answers with plain text, ending the agent loop. Latency, jitter and a rate of
+429 responses are configurable.
+
+Usage:
+    python benchmarks/stub_llm_server.py --port 8900 --latency-ms 50
+    OPENAI_BASE_URL=http://127.0.0.1:8900/v1 uvicorn main:app
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import re
+import socket
+import threading
+import time
+
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+_EXPRESSION = re.compile(
+    r"[\d\s.+\-*/%^()]*\d[\d\s.+\-*/%^()]*[+\-*/%^][\d\s.+\-*/%^()]+"
+)
+_KEYWORDS = (
+    ("subtract", ("minus", "subtract", "difference")),
+    ("multiply", ("times", "multiply", "product")),
+    ("divide", ("divided", "divide", "quotient", "over")),
+    ("sum", ("plus", "add", "sum")),
+)
+
+
+class StubSettings:
+    """
+    Behaviour of the stub server.
+
+    Attributes:
+        latency_ms (float): Base delay of every completion, in milliseconds.
+        jitter_ms (float): Uniform random delay added to the base latency.
+        error_rate (float): Fraction of completions answered with a 429.
+        calls (int): Number of completions requested since startup.
+    """
+
+    def __init__(
+        self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.calls = 0
+
+
+def pick_tool_call(prompt: str, tool_names: List[str]) -> Dict[str, Any]:
+    """
+    Chooses the tool and arguments answering a prompt.
+
+    Args:
+        prompt (str): The user prompt.
+        tool_names (List[str]): Names of the tools offered in the request.
+
+    Returns:
+        Dict[str, Any]: The tool name and its arguments.
+    """
+    expression = _EXPRESSION.search(prompt)
+    if "evaluate_expression" in tool_names and expression:
+        return {
+            "name": "evaluate_expression",
+            "arguments": {"expression": expression.group().strip()},
+        }
+
+    lowered = prompt.lower()
+    operation = next(
+        (
+            name
+            for name, words in _KEYWORDS
+            if name in tool_names and any(word in lowered for word in words)
+        ),
+        "sum",
+    )
+    operands = [
+        float(value) if "." in value else int(value)
+        for value in _NUMBER.findall(prompt)
+    ]
+    while len(operands) < 2:
+        operands.append(1)
+    return {"name": operation, "arguments": {"operands": operands}}
+
+
+def create_app(settings: Optional[StubSettings] = None) -> FastAPI:
+    """
+    Builds the stub server application.
+
+    Args:
+        settings (Optional[StubSettings]): Behaviour of the server.
+
+    Returns:
+        FastAPI: The application.
+    """
+    settings = settings or StubSettings()
+    app = FastAPI(title="Stub OpenAI API")
+    app.state.settings = settings
+    call_ids = itertools.count(1)
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "stub", "object": "model"}]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        settings.calls += 1
+
+        delay = settings.latency_ms + random.uniform(0, settings.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if settings.error_rate and random.random() < settings.error_rate:
+            return JSONResponse(
+                status_code=429,
+                content={"error": {"message": "Rate limited.", "type": "rate_limit"}},
+                headers={"retry-after": "0"},
+            )
+
+        messages = body.get("messages", [])
+        tool_names = [tool["function"]["name"] for tool in body.get("tools", [])]
+        message: Dict[str, Any] = {"role": "assistant", "content": None}
+        finish_reason = "tool_calls"
+
+        if any(m.get("role") == "tool" for m in messages) or not tool_names:
+            message["content"] = "Done."
+            finish_reason = "stop"
+        else:
+            prompt = next(
+                (m["content"] for m in reversed(messages) if m.get("role") == "user"),
+                "",
+            )
+            call = pick_tool_call(str(prompt), tool_names)
+            message["tool_calls"] = [
+                {
+                    "id": f"call_{next(call_ids)}",
+                    "type": "function",
+                    "function": {
+                        "name": call["name"],
+                        "arguments": json.dumps(call["arguments"]),
+                    },
+                }
+            ]
+
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [
+                {"index": 0, "message": message, "finish_reason": finish_reason}
+            ],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+
+    return app
+
+
+class StubLLMServer:
+    """
+    Runs the stub server on a background thread, for use inside a benchmark process.
+
+    Attributes:
+        settings (StubSettings): Behaviour of the server.
+        port (int): Port the server listens on.
+    """
+
+    def __init__(self, settings: Optional[StubSettings] = None, port: int = 0):
+        self.settings = settings or StubSettings()
+        self.port = port or _free_port()
+        self._server = uvicorn.Server(
+            uvicorn.Config(
+                create_app(self.settings),
+                host="127.0.0.1",
+                port=self.port,
+                log_level="warning",
+            )
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    def __enter__(self) -> "StubLLMServer":
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Stub LLM server did not start in time.")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    settings = StubSettings(args.latency_ms, args.jitter_ms, args.error_rate)
+    uvicorn.run(create_app(settings), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
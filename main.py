@@ -1,17 +1,54 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.core.llm_client import LLM_CLIENT
+from app.core.offload import OFFLOADER
+from app.logs.setup_logger import LOGGER
 from app.routes.router import api_router
+from app.routes.challenge.providers.provider import init_challenge_provider
 from app.settings.app_config import AppConfig
+from app.settings.setting import get_settings
+
+
+def init_app_config(app: FastAPI) -> None:
+    """
+    Applies the environment-dependent root path and registers the OpenAPI routes under it.
+
+    Runs in the lifespan instead of at import time, so importing `main` neither
+    loads nor validates the settings.
+
+    Args:
+        app (FastAPI): The application being started.
+    """
+    if app.openapi_url is not None:
+        return
+    config = AppConfig()
+    app.root_path = config.get_root_path()
+    app.openapi_url = f"{config.get_root_path()}/openapi.json"
+    app.setup()
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_app_config(app)
+    LOGGER.init_sentry()
+    init_challenge_provider(app)
+    await LLM_CLIENT.start()
+    yield
+    await LLM_CLIENT.drain(get_settings().env.drain_timeout)
+    await LLM_CLIENT.aclose()
+    OFFLOADER.shutdown()
+    LOGGER.shutdown()
 
-config = AppConfig()
 
 app = FastAPI(
     title="Code Challenge API",
     description="API for the team code challenge. Implements mathematical operations via the /challenge route.",
     version="1.0.0",
-    openapi_url=f"{config.get_root_path()}/openapi.json",
-    root_path=config.get_root_path(),
+    # Set by `init_app_config` once the settings are loaded.
+    openapi_url=None,
+    lifespan=lifespan,
 )
 
 app.include_router(api_router)
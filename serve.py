@@ -0,0 +1,45 @@
+import os
+
+import uvicorn
+
+from app.settings.setting import get_settings
+
+
+def resolve_workers(workers: int) -> int:
+    """
+    Resolves the configured worker count; 0 or less means one worker per CPU core.
+    """
+    if workers > 0:
+        return workers
+    return os.cpu_count() or 1
+
+
+def main() -> None:
+    """
+    Production entry point running the API in one or more uvicorn worker processes.
+
+    Settings are loaded and validated here first, so a bad configuration fails once
+    in the supervisor instead of in every worker. `main` is deliberately not
+    imported in this process: each worker is spawned fresh and imports it itself,
+    so Sentry, the logger and the LLM connection pool are created per worker and
+    never inherited across a fork.
+
+    On SIGTERM uvicorn stops accepting connections and waits up to
+    `APP_GRACEFUL_TIMEOUT` seconds for in-flight requests; the lifespan then waits
+    up to `APP_DRAIN_TIMEOUT` seconds for the LLM calls still in flight before
+    closing the client. A shutdown therefore takes at most the sum of both timeouts.
+    """
+    settings = get_settings().env
+    uvicorn.run(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=resolve_workers(settings.workers),
+        timeout_graceful_shutdown=settings.graceful_timeout,
+        timeout_keep_alive=settings.keepalive_timeout,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
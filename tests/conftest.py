@@ -0,0 +1,18 @@
+import os
+import sys
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Tests never reach OpenAI or Sentry, and keep no state on disk between runs.
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("SECURITY_SECRET_KEY", "test")
+os.environ.update(
+    {
+        "SENTRY_ENABLED": "false",
+        "PLAN_CACHE_ENABLED": "false",
+        "OPENAI_WARMUP": "false",
+        "OPENAI_RATE_LIMIT_PER_SECOND": "0",
+    }
+)
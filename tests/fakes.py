@@ -0,0 +1,64 @@
+import asyncio
+
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+
+def tool_call(name: str, call_id: str, **args: Any) -> Dict[str, Any]:
+    return {"name": name, "args": args, "id": call_id, "type": "tool_call"}
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model answering with scripted messages, one per call, and recording each call.
+
+    Attributes:
+        responses (List[AIMessage]): The answers, in call order; the last one is repeated.
+        calls (List[Dict[str, Any]]): The messages and `tool_choice` of every call.
+        delay (float): Seconds each async call waits before answering, like a slow upstream.
+        cancelled (int): Number of async calls cancelled while waiting.
+    """
+
+    responses: List[AIMessage]
+    calls: List[Dict[str, Any]] = []
+    delay: float = 0.0
+    cancelled: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def bind_tools(
+        self, tools: Any, tool_choice: Optional[str] = None, **kwargs: Any
+    ) -> Any:
+        return self.bind(tool_choice=tool_choice)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        tool_choice: Optional[str] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls.append({"messages": list(messages), "tool_choice": tool_choice})
+        message = self.responses[min(len(self.calls), len(self.responses)) - 1]
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.delay:
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return self._generate(messages, stop, **kwargs)
@@ -0,0 +1,238 @@
+import asyncio
+
+import httpx
+import pytest
+
+from langchain_core.messages import AIMessage
+
+from app.core import admission
+from app.core.admission import (
+    PRIORITY_CONTINUATION,
+    PRIORITY_NEW,
+    AdmissionController,
+    OverloadedError,
+    TokenBucket,
+)
+from app.core.agent import ChallengeAgent
+from app.core.workflow import ChallengeWorkflow
+from app.routes.challenge.controllers.controller import ChallengeController
+from app.routes.challenge.providers.provider import get_challenge_controller
+from app.routes.challenge.services.service import ChallengeService
+from app.settings.setting import OpenAISettings
+from fakes import FakeChatModel, tool_call
+
+
+def settings(**overrides):
+    values = {
+        "api_key": "test",
+        "max_concurrent_calls": 1,
+        "max_queued_calls": 8,
+        "queue_timeout": 5.0,
+        "rate_limit_per_second": 0,
+        "max_retries": 0,
+    }
+    return OpenAISettings(**{**values, **overrides})
+
+
+class UpstreamError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"upstream {status_code}")
+        self.status_code = status_code
+        headers = {"retry-after": retry_after} if retry_after is not None else {}
+        self.response = type("Response", (), {"headers": headers})()
+
+
+def test_waiters_get_slots_by_priority_then_arrival():
+    controller = AdmissionController(settings())
+    order = []
+
+    async def run():
+        release = asyncio.Event()
+
+        async def hold():
+            await release.wait()
+
+        async def call(name):
+            order.append(name)
+
+        holder = asyncio.create_task(controller.run(hold))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(controller.run(lambda: call("new 1"), PRIORITY_NEW)),
+            asyncio.create_task(controller.run(lambda: call("new 2"), PRIORITY_NEW)),
+            asyncio.create_task(
+                controller.run(lambda: call("continuation"), PRIORITY_CONTINUATION)
+            ),
+        ]
+        await asyncio.sleep(0)
+        assert controller.waiting == 3
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+    asyncio.run(run())
+
+    assert order == ["continuation", "new 1", "new 2"]
+    assert controller.waiting == 0
+
+
+def test_calls_are_shed_when_the_queue_is_full():
+    controller = AdmissionController(settings(max_queued_calls=1, queue_timeout=2.5))
+
+    async def run():
+        release = asyncio.Event()
+        holder = asyncio.create_task(controller.run(release.wait))
+        queued = asyncio.create_task(controller.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(OverloadedError) as shed:
+            await controller.run(release.wait)
+        release.set()
+        await asyncio.gather(holder, queued)
+        return shed.value
+
+    error = asyncio.run(run())
+
+    assert error.retry_after == 2.5
+    assert controller.stats() == {"waiting": 0, "shed": 1, "retries": 0}
+
+
+def test_calls_are_shed_after_the_queue_timeout():
+    controller = AdmissionController(settings(queue_timeout=0.05))
+
+    async def run():
+        release = asyncio.Event()
+        holder = asyncio.create_task(controller.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(OverloadedError) as shed:
+            await controller.run(release.wait)
+        release.set()
+        await holder
+        # The slot of the holder is free again, not lost to the timed-out waiter.
+        assert await controller.run(lambda: asyncio.sleep(0, "admitted")) == "admitted"
+        return shed.value
+
+    error = asyncio.run(run())
+
+    # Short queue timeouts still ask clients to wait at least a second.
+    assert error.retry_after == 1.0
+    assert controller.shed == 1
+
+
+def test_shed_prompt_is_answered_with_503_and_retry_after():
+    from main import app
+
+    agent = ChallengeAgent(
+        llm=FakeChatModel(
+            responses=[
+                AIMessage(
+                    content="", tool_calls=[tool_call("sum", "a", operands=[1, 2])]
+                ),
+                AIMessage(content="3"),
+            ],
+            delay=0.2,
+        ),
+        admission=AdmissionController(settings(max_queued_calls=0)),
+    )
+    controller = ChallengeController(
+        ChallengeService(workflow=ChallengeWorkflow(agent=agent))
+    )
+
+    async def send():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await asyncio.gather(
+                *(
+                    client.post(
+                        "/api/v1/challenge/prompt",
+                        json={
+                            "prompt": f"Please work out {n} things for me, step by step."
+                        },
+                    )
+                    for n in (1, 2)
+                )
+            )
+
+    app.dependency_overrides[get_challenge_controller] = lambda: controller
+    try:
+        responses = asyncio.run(send())
+    finally:
+        app.dependency_overrides.clear()
+
+    assert sorted(response.status_code for response in responses) == [200, 503]
+    (shed,) = [response for response in responses if response.status_code == 503]
+    assert shed.headers["Retry-After"] == "5"
+    assert shed.json()["success"] is False
+
+
+def test_token_bucket_refills_at_its_rate(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(admission.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert [bucket.reserve(), bucket.reserve()] == [0.0, 0.0]
+    # The third token is a tenth of a second away, the fourth two tenths.
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+    now[0] += 1.0
+    # One second refills ten tokens: the two owed, then up to the burst of two.
+    assert [bucket.reserve(), bucket.reserve()] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+def test_disabled_token_bucket_never_waits():
+    bucket = TokenBucket(rate=0, burst=1)
+
+    assert [bucket.reserve() for _ in range(100)] == [0.0] * 100
+
+
+@pytest.mark.parametrize("jitter", ["low", "high"])
+def test_retry_backoff_stays_within_its_jittered_bounds(jitter, monkeypatch):
+    monkeypatch.setattr(
+        admission.random, "uniform", lambda low, high: low if jitter == "low" else high
+    )
+    controller = AdmissionController(
+        settings(retry_backoff_base=0.5, retry_backoff_max=3.0)
+    )
+    controller._configure()
+    error = UpstreamError(503)
+
+    backoffs = [controller._backoff(attempt, error) for attempt in range(5)]
+
+    if jitter == "low":
+        assert backoffs == [0.0] * 5
+    else:
+        # The ceiling doubles from the base and is capped at the maximum.
+        assert backoffs == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_retry_backoff_honors_upstream_retry_after_up_to_the_maximum(monkeypatch):
+    monkeypatch.setattr(admission.random, "uniform", lambda low, high: low)
+    controller = AdmissionController(
+        settings(retry_backoff_base=0.5, retry_backoff_max=3.0)
+    )
+    controller._configure()
+
+    assert controller._backoff(0, UpstreamError(429, retry_after="2")) == 2.0
+    assert controller._backoff(0, UpstreamError(429, retry_after="60")) == 3.0
+    assert controller._backoff(0, UpstreamError(429, retry_after="soon")) == 0.0
+
+
+def test_transient_errors_are_retried_and_others_are_not(monkeypatch):
+    monkeypatch.setattr(admission.random, "uniform", lambda low, high: 0.0)
+    controller = AdmissionController(settings(max_retries=2))
+    failures = [UpstreamError(503), UpstreamError(429)]
+
+    async def flaky():
+        if failures:
+            raise failures.pop(0)
+        return "answer"
+
+    async def rejected():
+        raise UpstreamError(400)
+
+    assert asyncio.run(controller.run(flaky)) == "answer"
+    assert controller.retries == 2
+    with pytest.raises(UpstreamError):
+        asyncio.run(controller.run(rejected))
+    assert controller.retries == 2
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import StructuredTool
+
+from app.core.agent import ChallengeAgent
+from fakes import FakeChatModel, tool_call
+
+COMPOUND = AIMessage(
+    content="",
+    tool_calls=[
+        tool_call("sum", "a", operands=[3, 4]),
+        tool_call("multiply", "b", operands=[5, 6]),
+        tool_call("divide", "c", operands=[10, 2]),
+    ],
+)
+DONE = AIMessage(content="The results are 7, 30 and 5.")
+
+
+def test_compound_prompt_takes_two_round_trips():
+    model = FakeChatModel(responses=[COMPOUND, DONE])
+    agent = ChallengeAgent(llm=model)
+
+    run = asyncio.run(
+        agent.run_with_trace("add 3 and 4, then multiply 5 by 6 and divide 10 by 2")
+    )
+
+    assert run.round_trips == 2
+    assert len(model.calls) == 2
+    assert run.result == [7, 30, 5.0]
+    assert [call["name"] for call in run.tool_calls] == ["sum", "multiply", "divide"]
+    # Only the first turn forces a tool call; the three results go back in one turn.
+    assert [call["tool_choice"] for call in model.calls] == ["required", None]
+    tool_messages = [
+        message
+        for message in model.calls[1]["messages"]
+        if isinstance(message, ToolMessage)
+    ]
+    assert [message.tool_call_id for message in tool_messages] == ["a", "b", "c"]
+
+
+def test_round_trips_are_counted_per_run():
+    model = FakeChatModel(responses=[COMPOUND, DONE])
+    agent = ChallengeAgent(llm=model)
+
+    first = asyncio.run(agent.run_with_trace("first prompt"))
+    model.calls.clear()
+    second = asyncio.run(agent.run_with_trace("second prompt"))
+
+    assert (first.round_trips, second.round_trips) == (2, 2)
+    assert agent.stats() == {"round_trips": 4}
+
+
+def test_tool_calls_of_one_turn_run_concurrently():
+    started = 0
+    all_started = asyncio.Event()
+
+    async def wait_for_others(operands):
+        nonlocal started
+        started += 1
+        if started == 3:
+            all_started.set()
+        # Deadlocks into the timeout if the calls were awaited one after another.
+        await asyncio.wait_for(all_started.wait(), timeout=1.0)
+        return sum(operands)
+
+    tools = [
+        StructuredTool.from_function(
+            coroutine=wait_for_others, name=name, description=name
+        )
+        for name in ("sum", "multiply", "divide")
+    ]
+    agent = ChallengeAgent(llm=FakeChatModel(responses=[COMPOUND, DONE]), tools=tools)
+
+    run = asyncio.run(agent.run_with_trace("compound"))
+
+    assert run.result == [7, 11, 12]
+
+
+def test_iteration_cap_stops_the_loop():
+    model = FakeChatModel(
+        responses=[
+            AIMessage(content="", tool_calls=[tool_call("sum", "a", operands=[1, 1])])
+        ]
+    )
+    agent = ChallengeAgent(llm=model, max_iterations=3)
+
+    with pytest.raises(ValueError, match="iteration limit"):
+        asyncio.run(agent.run_with_trace("loop forever"))
+    assert len(model.calls) == 3
+
+
+def test_answer_without_tool_call_is_rejected():
+    model = FakeChatModel(responses=[AIMessage(content="It is 4.")])
+    agent = ChallengeAgent(llm=model)
+
+    with pytest.raises(ValueError, match="did not call any tool"):
+        asyncio.run(agent.run_with_trace("what is 2 plus 2"))
+    assert len(model.calls) == 1
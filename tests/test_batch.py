@@ -0,0 +1,82 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.engine import ChallengeEngine
+from app.core.registry import DivisionByZeroError, operation_names
+from app.routes.challenge.dtos.dto import MAX_BATCH_OPERATIONS
+
+OPERAND_LISTS = [[8, 2], [1, 2, 3, 4], [7.5, -2.5], [3, 0.5, 4], [10, -3, 2]]
+
+
+def post(path, body):
+    from main import app
+
+    async def send():
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                return await client.post(f"/api/v1{path}", json=body)
+
+    return asyncio.run(send())
+
+
+@pytest.mark.parametrize("operation", operation_names())
+def test_batch_reduction_matches_the_scalar_handler(operation):
+    engine = ChallengeEngine()
+    handler = engine.get_handler(operation)
+
+    results = engine.reduce_batch(operation, OPERAND_LISTS)
+
+    expected = [handler(operands) for operands in OPERAND_LISTS]
+    assert results == pytest.approx(expected)
+    # Integer-only lists stay ints, mixed lists are floats, as in the scalar handlers.
+    assert [type(value) for value in results] == [type(value) for value in expected]
+
+
+def test_int64_and_float64_groups_keep_the_request_order():
+    results = ChallengeEngine().reduce_batch("sum", [[1, 2], [0.5, 1], [3, 4], [1.5]])
+
+    assert results == [3, 1.5, 7, 1.5]
+    assert [type(value) for value in results] == [int, float, int, float]
+
+
+def test_batch_division_by_zero_fails_the_whole_reduction():
+    with pytest.raises(DivisionByZeroError):
+        ChallengeEngine().reduce_batch("divide", [[8, 2], [1, 0]])
+
+
+def test_batch_reduction_that_could_overflow_int64_is_refused():
+    with pytest.raises(OverflowError):
+        ChallengeEngine().reduce_batch("sum", [[2**62, 2**62], [1, 2]])
+
+
+def test_batch_items_fail_on_their_own_and_match_single_requests():
+    items = [
+        {"operation": "divide", "operands": [8, 2, 2]},
+        {"operation": "divide", "operands": [1, 0]},
+        {"operation": "divide", "operands": [9, 3]},
+        {"operation": "sum", "operands": [2**62, 2**62]},
+        {"operation": "multiply", "operands": [2, 3], "precision": "exact"},
+    ]
+
+    response = post("/challenge/batch", {"operations": items})
+
+    assert response.status_code == 200
+    results = response.json()["data"]["results"]
+    # The zero divisor fails its item only; the overflowing sum is computed per item.
+    assert [result["success"] for result in results] == [True, False, True, True, True]
+    for item, result in zip(items, results):
+        single = post("/challenge", item).json()
+        assert result == single
+    assert [result["precision"] for result in results] == [None] * 4 + ["exact"]
+
+
+def test_batch_larger_than_the_cap_is_rejected():
+    items = [{"operation": "sum", "operands": [1, 2]}] * (MAX_BATCH_OPERATIONS + 1)
+
+    response = post("/challenge/batch", {"operations": items})
+
+    assert response.status_code == 422
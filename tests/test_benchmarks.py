@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+pytestmark = pytest.mark.benchmark
+
+
+def bench_suite(*args: str) -> subprocess.CompletedProcess:
+    # The suite overrides the application settings at import, so it runs in its own
+    # interpreter rather than in the test process.
+    return subprocess.run(
+        [sys.executable, "benchmarks/bench_suite.py", "--suite", "micro", "--quick"]
+        + list(args),
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def baseline(tmp_path_factory):
+    path = tmp_path_factory.mktemp("bench") / "baseline.json"
+    completed = bench_suite("--baseline", str(path), "--save-baseline")
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+    return json.loads(path.read_text())
+
+
+def test_suite_reports_every_micro_case(baseline):
+    assert len(baseline) == 24
+    for stats in baseline.values():
+        assert 0 < stats["p50_us"] <= stats["p95_us"] <= stats["p99_us"]
+        assert stats["throughput"] > 0
+
+
+def test_check_fails_on_a_regression_of_a_stable_case(baseline, tmp_path):
+    stable = "micro/engine/divide/4096"
+    faster = {**baseline, stable: {**baseline[stable]}}
+    # The p50 stays above the gating threshold, so only the throughput regresses.
+    faster[stable]["throughput"] *= 100
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(faster))
+
+    completed = bench_suite("--baseline", str(path), "--check", "--tolerance", "3")
+
+    assert completed.returncode == 1
+    assert f"REGRESSION {stable}: throughput" in completed.stdout
+
+
+def test_check_does_not_gate_sub_microsecond_cases(baseline, tmp_path):
+    noisy = "micro/validator/multiply/4096"
+    assert baseline[noisy]["p50_us"] < 20
+    faster = {**baseline, noisy: {**baseline[noisy]}}
+    faster[noisy]["p50_us"] /= 10
+    faster[noisy]["throughput"] *= 10
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(faster))
+
+    # The tolerance only absorbs the noise of the stable cases between two runs.
+    completed = bench_suite("--baseline", str(path), "--check", "--tolerance", "3")
+
+    assert completed.returncode == 0, completed.stdout
+    assert "REGRESSION" not in completed.stdout
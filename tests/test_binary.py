@@ -0,0 +1,110 @@
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+
+from app.core.binary import decode_operands, encode_result, is_encodable
+from app.core.engine import ChallengeEngine
+
+
+def post_binary(operation, operands, dtype, accept="application/json"):
+    from main import app
+
+    body = np.array(operands, dtype=f"<{'i8' if dtype == 'int64' else 'f8'}")
+
+    async def send():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.post(
+                "/api/v1/challenge/binary",
+                params={"operation": operation, "dtype": dtype},
+                content=body.tobytes(),
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Accept": accept,
+                },
+            )
+
+    return asyncio.run(send())
+
+
+@pytest.mark.parametrize(
+    "dtype, values", [("int64", [1, -2, 2**62]), ("float64", [1.5, -0.25])]
+)
+def test_decode_operands_wraps_the_body_without_copying(dtype, values):
+    body = np.array(values, dtype=dtype).astype(f"<{dtype[0]}8").tobytes()
+
+    operands = decode_operands(body, dtype)
+
+    assert operands.tolist() == values
+    assert not operands.flags.writeable
+    assert not operands.flags.owndata
+
+
+def test_decode_operands_reads_little_endian_buffers():
+    assert decode_operands(b"\x01" + b"\x00" * 7, "int64").tolist() == [1]
+
+
+@pytest.mark.parametrize(
+    "body, dtype, message",
+    [
+        (b"\x00" * 8, "int32", "Unsupported operand dtype"),
+        (b"\x00" * 12, "int64", "multiple of 8 bytes"),
+        (np.array([1.0, np.nan]).tobytes(), "float64", "finite"),
+        (np.array([np.inf, 1.0]).tobytes(), "float64", "finite"),
+    ],
+)
+def test_decode_operands_rejects_invalid_buffers(body, dtype, message):
+    with pytest.raises(ValueError, match=message):
+        decode_operands(body, dtype)
+
+
+def test_decode_operands_accepts_an_empty_body():
+    assert decode_operands(b"", "float64").size == 0
+
+
+@pytest.mark.parametrize(
+    "operation, operands, expected",
+    [
+        ("subtract", [2**62, -(2**62)], 2**63),
+        ("sum", [2**62, 2**62, 2**62], 3 * 2**62),
+        ("sum", [-(2**63), -1], -(2**63) - 1),
+        ("sum", [1, 2, 3], 6),
+    ],
+)
+def test_int64_array_reductions_stay_exact(operation, operands, expected):
+    result = ChallengeEngine().reduce_array(operation, np.array(operands, np.int64))
+
+    assert result == expected
+    assert type(result) is int
+
+
+def test_exact_int64_result_beyond_the_range_is_served_as_json():
+    json_response = post_binary("subtract", [2**62, -(2**62)], "int64")
+    binary_response = post_binary(
+        "subtract", [2**62, -(2**62)], "int64", accept="application/octet-stream"
+    )
+
+    assert json_response.json()["data"] == {"result": 2**63}
+    # 2**63 does not fit the 8-byte int64 response, so JSON is returned instead.
+    assert binary_response.headers["content-type"] == "application/json"
+    assert binary_response.json()["data"] == {"result": 2**63}
+
+
+def test_binary_result_is_encoded_as_raw_bytes():
+    response = post_binary(
+        "sum", [2**62, 1], "int64", accept="application/octet-stream"
+    )
+
+    assert response.headers["X-Result-Dtype"] == "int64"
+    assert np.frombuffer(response.content, "<i8").tolist() == [2**62 + 1]
+
+
+def test_is_encodable():
+    assert is_encodable(1.5)
+    assert is_encodable(2**63 - 1) and is_encodable(-(2**63))
+    assert not is_encodable(2**63)
+    assert not is_encodable("1" * 5000)
+    assert encode_result(-(2**63)) == np.array([-(2**63)], "<i8").tobytes()
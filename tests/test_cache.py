@@ -0,0 +1,145 @@
+import fnmatch
+import time
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.core.cache import (
+    InMemoryCacheBackend,
+    ResponseCache,
+    SharedCacheBackend,
+    operation_key,
+    precision_options,
+)
+
+
+class FakeSharedStore:
+    """In-process stand-in for the Redis client used by SharedCacheBackend."""
+
+    def __init__(self):
+        self.entries: Dict[str, Tuple[float, bytes]] = {}
+
+    def get(self, name: str) -> Optional[bytes]:
+        entry = self.entries.get(name)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, name: str, value: str, px: Optional[int] = None) -> Any:
+        expires_at = time.monotonic() + px / 1000 if px else float("inf")
+        self.entries[name] = (expires_at, value.encode())
+        return True
+
+    def delete(self, *names: str) -> Any:
+        for name in names:
+            self.entries.pop(name, None)
+
+    def scan_iter(self, match: Optional[str] = None) -> Iterator[str]:
+        return iter(
+            [name for name in self.entries if fnmatch.fnmatch(name, match or "*")]
+        )
+
+
+def result(value: Any) -> Dict[str, Any]:
+    return {"success": True, "message": "ok", "data": {"result": value}}
+
+
+def test_memory_backend_returns_copies():
+    cache = ResponseCache(backend=InMemoryCacheBackend())
+    key = cache.operation_key("sum", [1, 2])
+    stored = result(3)
+    cache.set(key, stored)
+    stored["data"]["result"] = 4
+
+    first = cache.get(key)
+    first["data"]["result"] = 5
+
+    assert cache.get(key) == result(3)
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_size=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.size() == 2
+
+
+def test_shared_backend_is_shared_between_caches():
+    store = FakeSharedStore()
+    writer = ResponseCache(backend=SharedCacheBackend(store))
+    reader = ResponseCache(backend=SharedCacheBackend(store))
+
+    writer.set(writer.operation_key("divide", [10, 4]), result(2.5))
+
+    assert reader.get(reader.operation_key("divide", [10, 4])) == result(2.5)
+    # Operand types are part of the key.
+    assert reader.get(reader.operation_key("divide", [10.0, 4.0])) is None
+    assert reader.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "size": 1}
+
+
+def test_shared_backend_expires_entries():
+    store = FakeSharedStore()
+    backend = SharedCacheBackend(store, ttl_seconds=0.01)
+    backend.set(("prompt", "what is 1 plus 1"), result(2))
+    time.sleep(0.02)
+
+    assert backend.get(("prompt", "what is 1 plus 1")) is None
+
+
+def test_shared_backend_misses_when_store_fails():
+    class BrokenStore(FakeSharedStore):
+        def get(self, name: str) -> Optional[bytes]:
+            raise ConnectionError("store down")
+
+    cache = ResponseCache(backend=SharedCacheBackend(BrokenStore()))
+
+    assert cache.get(cache.prompt_key("what is 1 plus 1")) is None
+
+
+def test_shared_backend_survives_a_store_outage():
+    class DownStore(FakeSharedStore):
+        def __getattribute__(self, name):
+            if name in ("get", "set", "delete", "scan_iter"):
+                raise ConnectionError("store down")
+            return super().__getattribute__(name)
+
+    backend = SharedCacheBackend(DownStore())
+    backend.set("key", result(1))
+    backend.clear()
+
+    assert backend.get("key") is None
+    assert backend.size() == 0
+
+
+def test_shared_backend_clear_only_removes_its_own_keys():
+    store = FakeSharedStore()
+    store.set("other:key", "1")
+    backend = SharedCacheBackend(store)
+    backend.set("key", result(1))
+
+    backend.clear()
+
+    assert backend.size() == 0
+    assert store.get("other:key") == b"1"
+
+
+def test_only_tool_results_are_cached():
+    cache = ResponseCache(backend=SharedCacheBackend(FakeSharedStore()))
+    cache.set("failure", {"success": False, "message": "boom", "data": None})
+    cache.set("free text", {"success": True, "message": "ok", "data": "2"})
+
+    assert cache.backend.size() == 0
+
+
+def test_decimal_digits_only_key_decimal_requests():
+    def key(precision, digits):
+        return operation_key("sum", [1, 2], *precision_options(precision, digits))
+
+    assert key("exact", 28) == key("exact", 50)
+    assert key(None, 28) == key(None, 50)
+    assert key("decimal", 28) != key("decimal", 50)
+    assert key("exact", 28) != key("float", 28)
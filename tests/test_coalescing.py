@@ -0,0 +1,73 @@
+import asyncio
+
+from langchain_core.messages import AIMessage
+
+from app.core.agent import ChallengeAgent
+from app.core.single_flight import SingleFlight
+from app.core.workflow import ChallengeWorkflow
+from app.routes.challenge.dtos.dto import ChallengePromptRequestDTO
+from app.routes.challenge.services.service import ChallengeService
+from fakes import FakeChatModel, tool_call
+
+# Declined by the fast-path parser, so every request needs the agent.
+PROMPT = "Please work out the sum of 3 and 4 for me, step by step."
+CONCURRENT = 8
+
+
+def build_service(single_flight):
+    model = FakeChatModel(
+        responses=[
+            AIMessage(content="", tool_calls=[tool_call("sum", "a", operands=[3, 4])]),
+            AIMessage(content="The sum is 7."),
+        ]
+    )
+    workflow = ChallengeWorkflow(agent=ChallengeAgent(llm=model))
+    service = ChallengeService(workflow=workflow)
+    # Set after construction: passing None would build the configured default.
+    service.single_flight = single_flight
+    return service, model
+
+
+async def send_concurrently(service, prompt):
+    request = ChallengePromptRequestDTO(prompt=prompt)
+    return await asyncio.gather(
+        *(service.handle_prompt_async(request) for _ in range(CONCURRENT))
+    )
+
+
+def test_concurrent_identical_prompts_share_one_llm_run():
+    single_flight = SingleFlight(timeout=10.0)
+    service, model = build_service(single_flight)
+
+    responses = asyncio.run(send_concurrently(service, PROMPT))
+
+    assert [response.data for response in responses] == [{"result": 7}] * CONCURRENT
+    # One agent run: the forced tool call, then the final answer.
+    assert [call["tool_choice"] for call in model.calls] == ["required", None]
+    assert single_flight.stats()["leaders"] == 1
+    assert single_flight.stats()["followers"] == CONCURRENT - 1
+
+
+def test_prompts_differing_only_in_case_and_spacing_are_coalesced():
+    service, model = build_service(SingleFlight(timeout=10.0))
+    request = ChallengePromptRequestDTO(prompt=PROMPT)
+    variant = ChallengePromptRequestDTO(prompt="  " + PROMPT.upper() + " ")
+
+    async def send():
+        return await asyncio.gather(
+            service.handle_prompt_async(request),
+            service.handle_prompt_async(variant),
+        )
+
+    asyncio.run(send())
+
+    assert [call["tool_choice"] for call in model.calls] == ["required", None]
+
+
+def test_without_coalescing_every_concurrent_prompt_calls_the_model():
+    service, model = build_service(None)
+
+    asyncio.run(send_concurrently(service, PROMPT))
+
+    required = [call for call in model.calls if call["tool_choice"] == "required"]
+    assert len(required) == CONCURRENT
@@ -0,0 +1,108 @@
+import pytest
+
+from app.core.expression import (
+    ExpressionCompiler,
+    ExpressionEvaluator,
+    PlanStep,
+    StepRef,
+    normalize_expression,
+)
+
+
+@pytest.mark.parametrize(
+    "expression, normalized",
+    [
+        (" 2 + 3 * 4 ", "2+3*4"),
+        ("2 ^ 3", "2**3"),
+        ("6 × 7 ÷ 2 − 1", "6*7/2-1"),
+        ("mean( 1 , 2 )", "mean(1,2)"),
+        # Spaced operators are not joined into a different operator.
+        ("2 * * 3", "2* *3"),
+        ("2 / / 3", "2/ /3"),
+        ("2 ** 3", "2**3"),
+    ],
+)
+def test_normalize_expression(expression, normalized):
+    assert normalize_expression(expression) == normalized
+
+
+def test_left_associative_chains_compile_into_one_step():
+    plan = ExpressionCompiler(max_plans=8).compile("10 - 2 - 3 + 4 * 5")
+
+    assert plan.steps == (
+        PlanStep("subtract", (10, 2, 3)),
+        PlanStep("multiply", (4, 5)),
+        PlanStep("sum", (StepRef(0), StepRef(1))),
+    )
+
+
+def test_power_is_right_associative_and_negation_of_a_step_subtracts():
+    plan = ExpressionCompiler(max_plans=8).compile("-(2 ** 3 ** 2)")
+
+    assert plan.steps == (
+        PlanStep("power", (3, 2)),
+        PlanStep("power", (2, StepRef(0))),
+        PlanStep("subtract", (0, StepRef(1))),
+    )
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "2 * * 3",
+        "2 / / 3",
+        "2 // 3",
+        "1 +",
+        "42",
+        "x + 1",
+        "mean(1)",
+        "abs(1, 2)",
+        "True + 1",
+        "'a' + 'b'",
+        "1 + " * 600 + "1",
+    ],
+)
+def test_invalid_expressions_are_rejected(expression):
+    with pytest.raises(ValueError):
+        ExpressionCompiler(max_plans=8).compile(expression)
+
+
+def test_plans_are_cached_by_normalized_text_and_evicted_least_recently_used():
+    compiler = ExpressionCompiler(max_plans=2)
+
+    first = compiler.compile("1 + 2")
+    assert compiler.compile("1+2") is first
+    compiler.compile("3 * 4")
+    compiler.compile("1 + 2")
+    compiler.compile("5 - 6")
+
+    assert compiler.stats() == {"hits": 2, "misses": 3, "hit_rate": 0.4, "size": 2}
+    # "3*4" was the least recently used plan.
+    compiler.compile("3 * 4")
+    assert compiler.misses == 4
+
+
+@pytest.mark.parametrize(
+    "expression, value",
+    [
+        ("2 + 3 * 4", 14),
+        ("(2 + 3) * 4", 20),
+        ("10 - 2 - 3", 5),
+        ("2 ^ 3 ^ 2", 512),
+        ("-(4 - 1) + 1", -2),
+        ("mean(1, 2, 3) * 2", 4),
+        ("7 % 4", 3),
+        ("1 / 4", 0.25),
+    ],
+)
+def test_evaluator_computes_the_expression(expression, value):
+    assert ExpressionEvaluator(compiler=ExpressionCompiler(max_plans=8)).evaluate(
+        expression
+    ) == pytest.approx(value)
+
+
+def test_evaluator_validates_each_step_with_its_resolved_operands():
+    evaluator = ExpressionEvaluator(compiler=ExpressionCompiler(max_plans=8))
+
+    with pytest.raises(ValueError, match="Invalid operation or operands."):
+        evaluator.evaluate("1 / (2 - 2)")
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Leaves headroom over the ~400 ms measured on a single-core machine.
+IMPORT_BUDGET_MS = 1200
+
+
+@pytest.mark.benchmark
+def test_main_imports_within_budget_without_settings():
+    # The script imports `main` in fresh interpreters whose environment holds no
+    # application setting, and fails on the budget or on an eager LLM/Sentry import.
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "benchmarks/import_time.py",
+            "--runs",
+            "3",
+            "--budget-ms",
+            str(IMPORT_BUDGET_MS),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    assert completed.returncode == 0, completed.stdout + completed.stderr
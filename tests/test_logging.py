@@ -0,0 +1,123 @@
+import logging
+import threading
+
+import pytest
+
+from app.logs import sentry_handler
+from app.logs.setup_logger import Lazy, LoggerManager
+
+
+@pytest.fixture
+def manager(caplog):
+    logger = logging.getLogger("logger")
+    level = logger.level
+    manager = LoggerManager(debug=True, use_queue=False)
+    manager.configure()
+    caplog.set_level(logging.DEBUG, logger="logger")
+    yield manager
+    logger.setLevel(level)
+
+
+def test_arguments_are_rendered_by_logging(manager, caplog):
+    manager.log_info("[test] %s of %d", "sum", 2, conversation_id="c-1")
+
+    (record,) = caplog.records
+    assert record.args == ("sum", 2)
+    assert record.getMessage() == "Conversation UUID: c-1 - [test] sum of 2"
+
+
+def test_formatting_errors_do_not_reach_the_caller(manager, capsys, monkeypatch):
+    # The capture handler of pytest re-raises formatting errors; keep records away from it.
+    monkeypatch.setattr(manager.logger, "propagate", False)
+    manager.log_debug("[test] result: %d", "not a number")
+    manager.log_error("[test] %s %s", "one argument")
+    manager.log_debug("[test] result: %s", 10**5000)
+
+    # Reported by Handler.handleError on stderr instead of raised.
+    assert capsys.readouterr().err.count("--- Logging error ---") == 3
+
+
+def test_lazy_messages_are_only_built_for_enabled_levels(manager, caplog):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return "[test] built"
+
+    manager.debug = False
+    manager.log_debug(build)
+    manager.log_debug("[test] %s", Lazy(build))
+    assert calls == []
+
+    manager.log_info(build, conversation_id="c-2")
+    assert caplog.records[-1].getMessage() == "Conversation UUID: c-2 - [test] built"
+
+
+def test_queue_mode_renders_records_on_the_listener_thread(monkeypatch):
+    rendered_on = []
+
+    class Recording(logging.Handler):
+        def emit(self, record):
+            rendered_on.append((threading.get_ident(), record.getMessage()))
+
+    logger = logging.getLogger("logger")
+    monkeypatch.setattr(logger, "handlers", [])
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    manager = LoggerManager(debug=True, use_queue=True)
+    manager._configured = True
+    manager._start_queue_listener(Recording())
+    try:
+        manager.log_info("[test] %s", Lazy(lambda: threading.get_ident()))
+    finally:
+        manager.shutdown()
+        logger.setLevel(level)
+
+    ((thread, message),) = rendered_on
+    # The Lazy argument was evaluated by the listener, not by the logging thread.
+    assert thread != threading.get_ident()
+    assert message == f"[test] {thread}"
+
+
+def error_record(message, *args):
+    return logging.LogRecord("logger", logging.ERROR, __file__, 1, message, args, None)
+
+
+def test_sentry_batch_handler_deduplicates_and_flushes_full_batches(monkeypatch):
+    sent = []
+    monkeypatch.setattr(
+        sentry_handler.sentry_sdk,
+        "capture_message",
+        lambda message, **kwargs: sent.append((message, kwargs["extras"])),
+    )
+    handler = sentry_handler.SentryBatchHandler(batch_size=2, flush_interval=60)
+    try:
+        for _ in range(3):
+            handler.handle(error_record("[test] division by zero"))
+        assert sent == []
+
+        handler.handle(error_record("[test] error %d", 7))
+        assert sorted(sent) == [
+            ("[test] division by zero", {"occurrences": 3}),
+            ("[test] error 7", {"occurrences": 1}),
+        ]
+
+        handler.handle(error_record("[test] pending"))
+    finally:
+        handler.close()
+    assert sent[-1] == ("[test] pending", {"occurrences": 1})
+
+
+def test_sentry_batch_handler_flushes_on_its_interval(monkeypatch):
+    flushed = threading.Event()
+    monkeypatch.setattr(
+        sentry_handler.sentry_sdk,
+        "capture_message",
+        lambda message, **kwargs: flushed.set(),
+    )
+    handler = sentry_handler.SentryBatchHandler(batch_size=100, flush_interval=0.01)
+    try:
+        handler.handle(error_record("[test] slow error"))
+        assert flushed.wait(5)
+    finally:
+        handler.close()
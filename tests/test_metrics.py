@@ -0,0 +1,50 @@
+import asyncio
+
+import httpx
+
+from app.core.parser import FastPathParser
+from app.metrics.metrics import MetricsRegistry
+
+
+def test_registered_stats_are_rendered_at_scrape_time():
+    registry = MetricsRegistry(enabled=True)
+    parser = FastPathParser()
+    registry.register_collector("fast_path_parser", parser.stats)
+
+    parser.parse("what is 10 divided by 2")
+    parser.parse("split the bill between friends")
+    rendered = registry.render()
+
+    assert "# TYPE challenge_component_stats gauge" in rendered
+    assert (
+        'challenge_component_stats{component="fast_path_parser",stat="hits"} 1\n'
+        in rendered
+    )
+    assert (
+        'challenge_component_stats{component="fast_path_parser",stat="misses"} 1\n'
+        in rendered
+    )
+    assert (
+        'challenge_component_stats{component="fast_path_parser",stat="hit_rate"} 0.5\n'
+        in rendered
+    )
+
+
+def test_application_pipeline_exports_component_stats():
+    from main import app
+
+    async def scrape() -> str:
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                await client.post(
+                    "/api/v1/challenge/prompt", json={"prompt": "what is 3 times 7"}
+                )
+                return (await client.get("/metrics")).text
+
+    rendered = asyncio.run(scrape())
+
+    for component in ("fast_path_parser", "response_cache", "single_flight"):
+        assert f'challenge_component_stats{{component="{component}"' in rendered
+    assert 'component="fast_path_parser",stat="hits"} 1\n' in rendered
@@ -0,0 +1,88 @@
+import asyncio
+import math
+import os
+
+from concurrent.futures.process import BrokenProcessPool
+
+import httpx
+import pytest
+
+from app.core.engine import ChallengeEngine, decimal_str
+from app.core.offload import ReductionOffloader
+from app.metrics.metrics import METRICS
+from app.settings.setting import OffloadSettings, get_settings
+
+# Beyond int64, so the operands cannot be copied into a shared buffer.
+BIG = [2**64 + 1, 3, 2**70 - 5]
+
+
+@pytest.fixture
+def offloader():
+    offloader = ReductionOffloader(OffloadSettings(min_operands=2), max_workers=1)
+    yield offloader
+    offloader.shutdown()
+
+
+def test_operands_beyond_int64_are_reduced_in_the_pool(offloader, monkeypatch):
+    def inline(*args):
+        raise AssertionError("reduced on the event loop")
+
+    expected = ChallengeEngine().reduce_with_precision("multiply", BIG, "exact")
+    monkeypatch.setattr(ChallengeEngine, "reduce_with_precision", inline)
+
+    assert asyncio.run(offloader.reduce_exact("multiply", BIG)) == expected
+
+
+def test_a_dead_worker_does_not_break_later_jobs(offloader):
+    async def run():
+        with pytest.raises(BrokenProcessPool):
+            await offloader._run(os._exit, 1)
+        return await offloader.reduce_exact("sum", [1, 2, 3])
+
+    assert asyncio.run(run()) == 6
+
+
+@pytest.mark.parametrize(
+    ("servers", "cores", "expected"), [(1, 8, 8), (4, 8, 2), (16, 8, 1), (0, 8, 1)]
+)
+def test_default_pool_shares_the_cores_between_server_workers(
+    servers, cores, expected, monkeypatch
+):
+    monkeypatch.setenv("APP_WORKERS", str(servers))
+    monkeypatch.setattr(os, "cpu_count", lambda: cores)
+    get_settings.cache_clear()
+    try:
+        offloader = ReductionOffloader(OffloadSettings(max_workers=0))
+        assert offloader.max_workers == expected
+    finally:
+        get_settings.cache_clear()
+
+
+def test_offloaded_product_beyond_the_str_digit_limit_is_served():
+    from main import app
+
+    operands = list(range(1, 2500))
+    assert len(operands) >= OffloadSettings().min_operands
+
+    async def send():
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                return await client.post(
+                    "/api/v1/challenge",
+                    json={
+                        "operation": "multiply",
+                        "operands": operands,
+                        "precision": "exact",
+                    },
+                )
+
+    response = asyncio.run(send())
+
+    assert response.status_code == 200
+    assert response.json()["data"]["result"] == decimal_str(math.factorial(2499))
+    assert (
+        'challenge_offload_reductions_total{operation="multiply",placement="process"}'
+        in METRICS.render()
+    )
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+from langchain_core.messages import AIMessage
+
+from app.core.agent import ChallengeAgent
+from app.core.plan_cache import PromptPlanCache, templatize
+from app.core.workflow import ChallengeWorkflow
+from app.metrics.metrics import METRICS
+from app.routes.challenge.dtos.dto import ChallengePromptRequestDTO
+from fakes import FakeChatModel
+
+# Declined by the fast-path parser, so only the plan cache can avoid the model.
+PROMPT = "Please work out the product of {} and {} for me, step by step."
+
+
+class ThreadRecordingPlanCache(PromptPlanCache):
+    """Plan cache recording the threads its database calls run on."""
+
+    threads = set()
+
+    def lookup(self, template):
+        self.threads.add(threading.get_ident())
+        return super().lookup(template)
+
+    def record(self, template, tool_calls):
+        self.threads.add(threading.get_ident())
+        super().record(template, tool_calls)
+
+
+def test_learned_plan_is_replayed_off_the_event_loop():
+    plan_cache = ThreadRecordingPlanCache(min_confirmations=2, verify_rate=0.0)
+    model = FakeChatModel(responses=[AIMessage(content="unused")])
+    workflow = ChallengeWorkflow(agent=ChallengeAgent(llm=model), plan_cache=plan_cache)
+
+    async def run():
+        for a, b in ((3, 7), (4, 9)):
+            template = templatize(PROMPT.format(a, b))
+            call = {"name": "multiply", "args": {"operands": [a, b]}}
+            await plan_cache.record_async(template, [call])
+        request = ChallengePromptRequestDTO(prompt=PROMPT.format(12, 5))
+        return await workflow.process_prompt_async(request), threading.get_ident()
+
+    response, loop_thread = asyncio.run(run())
+
+    assert response["data"] == {"result": 60}
+    assert model.calls == []
+    assert plan_cache.stats()["hits"] == 1
+    assert plan_cache.threads and loop_thread not in plan_cache.threads
+
+
+def test_replayed_expression_keeps_negative_numbers_grouped():
+    prompt = "Please work out {} to the power of {} plus {} for me, step by step."
+    plan_cache = PromptPlanCache(min_confirmations=2, verify_rate=0.0)
+    model = FakeChatModel(responses=[AIMessage(content="unused")])
+    workflow = ChallengeWorkflow(agent=ChallengeAgent(llm=model), plan_cache=plan_cache)
+
+    async def run():
+        for a, b, c in ((4, 2, 5), (6, 3, 7)):
+            call = {
+                "name": "evaluate_expression",
+                "args": {"expression": f"{a} ** {b} + {c}"},
+            }
+            await plan_cache.record_async(templatize(prompt.format(a, b, c)), [call])
+        request = ChallengePromptRequestDTO(prompt=prompt.format(-3, 2, 1))
+        return await workflow.process_prompt_async(request)
+
+    response = asyncio.run(run())
+
+    assert model.calls == []
+    assert response["data"]["result"] == 10
+
+
+def multiply_call(a, b):
+    return [{"name": "multiply", "args": {"operands": [a, b]}}]
+
+
+def test_plan_conflicts_have_their_own_counter():
+    plan_cache = PromptPlanCache()
+    template = templatize(PROMPT.format(3, 7))
+    METRICS.reset()
+
+    plan_cache.record(template, multiply_call(3, 7))
+    plan_cache.record(template, [{"name": "sum", "args": {"operands": [3, 7]}}])
+
+    assert plan_cache.stats()["conflicts"] == 1
+    rendered = METRICS.render()
+    assert "challenge_plan_cache_conflicts_total 1\n" in rendered
+    assert 'challenge_plan_cache_lookups_total{outcome="conflict"}' not in rendered
+
+
+def test_table_is_only_counted_when_the_size_estimate_crosses_the_limit():
+    plan_cache = PromptPlanCache(max_entries=3)
+    counts = []
+    plan_cache._connection.set_trace_callback(
+        lambda statement: counts.append(statement) if "COUNT" in statement else None
+    )
+    templates = [
+        templatize(f"{word}: what is 3 times 7")
+        for word in ("alpha", "beta", "gamma", "delta", "epsilon")
+    ]
+
+    for template in templates:
+        plan_cache.record(template, multiply_call(3, 7))
+
+    # Three inserts fit; the fourth and fifth each cross the limit once.
+    assert len(counts) == 2
+    assert plan_cache.stats()["size"] == 3
+
+
+def test_invalidated_templates_leave_room_in_the_size_estimate():
+    plan_cache = PromptPlanCache(max_entries=2)
+    first, second = (
+        templatize(f"{word}: what is 3 times 7") for word in ("alpha", "beta")
+    )
+    plan_cache.record(first, multiply_call(3, 7))
+    plan_cache.record(second, multiply_call(3, 7))
+    plan_cache.invalidate(first)
+    counts = []
+    plan_cache._connection.set_trace_callback(
+        lambda statement: counts.append(statement) if "COUNT" in statement else None
+    )
+
+    plan_cache.record(first, multiply_call(3, 7))
+
+    assert counts == []
+    assert plan_cache.stats()["size"] == 2
@@ -0,0 +1,108 @@
+import asyncio
+import math
+import sys
+
+import httpx
+import pytest
+
+from app.core.engine import ChallengeEngine, decimal_str, json_int
+
+
+def post(path, body):
+    from main import app
+
+    async def send():
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                return await client.post(f"/api/v1{path}", json=body)
+
+    return asyncio.run(send())
+
+
+def test_integers_beyond_the_str_digit_limit_are_formatted_as_decimal_strings():
+    limit = sys.get_int_max_str_digits()
+    huge = 10**limit + 7
+
+    assert json_int(10 ** (limit - 1) - 1) == 10 ** (limit - 1) - 1
+    assert json_int(-huge) == "-1" + "0" * (limit - 1) + "7"
+    assert decimal_str(huge) == "1" + "0" * (limit - 1) + "7"
+
+
+def test_exact_results_beyond_the_str_digit_limit_are_strings():
+    engine = ChallengeEngine()
+
+    product = engine.reduce_with_precision("multiply", list(range(1, 1900)), "exact")
+    quotient = engine.reduce_with_precision("divide", [1, *range(2, 1900)], "exact")
+
+    assert product == decimal_str(math.factorial(1899))
+    numerator, denominator = quotient.split("/")
+    assert (numerator, denominator) == ("1", product)
+
+
+def test_exact_product_beyond_the_str_digit_limit_is_served():
+    response = post(
+        "/challenge",
+        {
+            "operation": "multiply",
+            "operands": list(range(1, 1900)),
+            "precision": "exact",
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["data"]["result"] == decimal_str(math.factorial(1899))
+
+
+@pytest.mark.parametrize(
+    "operation, operands, expected",
+    [
+        ("multiply", [2, 3], {"float": 6.0, "exact": 6, "decimal": "6"}),
+        ("multiply", [2, 0.5], {"float": 1.0, "exact": 1, "decimal": "1.0"}),
+        ("sum", [0.1, 0.2], {"float": 0.30000000000000004, "exact": "3/10"}),
+        ("divide", [1, 3], {"exact": "1/3"}),
+        ("mean", [1, 2], {"float": 1.5, "exact": "3/2", "decimal": "1.5"}),
+        ("sum", [0.1, 0.2], {"decimal": "0.3"}),
+    ],
+)
+def test_precision_modes(operation, operands, expected):
+    engine = ChallengeEngine()
+
+    for precision, value in expected.items():
+        result = engine.reduce_with_precision(operation, operands, precision)
+        assert (result, type(result)) == (value, type(value)), precision
+
+
+def test_compensated_sum_is_correctly_rounded():
+    engine = ChallengeEngine()
+    operands = [1e16, 1.0, -1e16]
+
+    assert engine.reduce_with_precision("sum", operands, "float") == 0.0
+    assert engine.reduce_with_precision("sum", operands, "compensated") == 1.0
+
+
+def test_decimal_mode_uses_the_requested_significant_digits():
+    engine = ChallengeEngine()
+
+    assert engine.reduce_with_precision("divide", [1, 3], "decimal", 5) == "0.33333"
+    assert (
+        engine.reduce_with_precision("divide", [2, 3], "decimal")
+        == "0." + "6" * 27 + "7"
+    )
+
+
+def test_precision_mode_is_reported_in_the_response():
+    response = post(
+        "/challenge",
+        {"operation": "multiply", "operands": [2, 3], "precision": "decimal"},
+    )
+
+    assert response.json() == {
+        "success": True,
+        "message": "Operation completed successfully.",
+        "precision": "decimal",
+        "data": {"result": "6"},
+    }
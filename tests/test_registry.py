@@ -0,0 +1,112 @@
+import typing
+
+import pytest
+
+from pydantic import ValidationError
+
+from app.core.engine import ChallengeEngine
+from app.core.expression import EXPRESSION_TOOL_NAME
+from app.core.registry import MAX_EXACT_POWER_BITS, operation_names
+from app.core.tools import TOOL_SCHEMAS, build_challenge_tools
+from app.routes.challenge.dtos.dto import ChallengeRequestDTO, Operation
+
+PRECISIONS = ("float", "compensated", "exact", "decimal")
+
+
+def test_operation_literal_is_generated_from_the_registry():
+    assert typing.get_args(Operation) == operation_names()
+    assert operation_names() == (
+        "sum",
+        "subtract",
+        "multiply",
+        "divide",
+        "power",
+        "modulo",
+        "mean",
+    )
+    with pytest.raises(ValidationError):
+        ChallengeRequestDTO(operation="sqrt", operands=[1, 2])
+
+
+def test_challenge_route_description_lists_every_operation():
+    from main import app
+
+    operation = app.openapi()["paths"]["/api/v1/challenge"]["post"]
+
+    for name in operation_names():
+        assert repr(name) in operation["description"]
+
+
+def test_tool_schemas_expose_every_operation_and_the_expression_tool():
+    names = [schema["function"]["name"] for schema in TOOL_SCHEMAS]
+
+    assert names == [*operation_names(), EXPRESSION_TOOL_NAME]
+    operands = TOOL_SCHEMAS[0]["function"]["parameters"]
+    assert operands["required"] == ["operands"]
+    assert operands["properties"]["operands"]["minItems"] == 2
+    expression = TOOL_SCHEMAS[-1]["function"]["parameters"]
+    assert expression["required"] == ["expression"]
+
+
+def test_tools_run_the_validator_before_the_engine():
+    tools = {tool.name: tool for tool in build_challenge_tools()}
+
+    assert list(tools) == [*operation_names(), EXPRESSION_TOOL_NAME]
+    assert tools["modulo"].invoke({"operands": [-7, 3]}) == 2
+    with pytest.raises(ValueError, match="Invalid operation or operands."):
+        tools["modulo"].invoke({"operands": [7, 0]})
+
+
+@pytest.mark.parametrize(
+    "operands, expected",
+    [
+        # Floor semantics in every mode: the result takes the sign of the divisor.
+        ([-7, 3], (2, 2.0, 2.0, 2, "2")),
+        ([7, -3], (-2, -2.0, -2.0, -2, "-2")),
+        ([7.5, 2], (1.5, 1.5, 1.5, "3/2", "1.5")),
+        ([100, 7, 3], (2, 2.0, 2.0, 2, "2")),
+    ],
+)
+def test_modulo_semantics(operands, expected):
+    assert_modes("modulo", operands, expected)
+
+
+@pytest.mark.parametrize(
+    "operands, expected",
+    [
+        # Folded from the left: (2 ** 3) ** 2.
+        ([2, 3, 2], (64.0, 64.0, 64.0, 64, "64")),
+        ([2, -2], (0.25, 0.25, 0.25, "1/4", "0.25")),
+        ([4, 0.5], (2.0, 2.0, 2.0, None, None)),
+    ],
+)
+def test_power_semantics(operands, expected):
+    assert_modes("power", operands, expected)
+
+
+def test_mean_semantics():
+    assert_modes("mean", [1, 2, 3, 4], (2.5, 2.5, 2.5, "5/2", "2.5"))
+
+
+def test_exact_power_is_capped_in_bits():
+    engine = ChallengeEngine()
+    # 3 needs 2 bits, so the largest allowed exponent is half the cap.
+    exponent = MAX_EXACT_POWER_BITS // 2
+
+    assert engine.reduce_with_precision("power", [3, exponent], "exact") != 0
+    with pytest.raises(ValueError, match="too large"):
+        engine.reduce_with_precision("power", [3, exponent + 1], "exact")
+    with pytest.raises(ValueError, match="integer exponents"):
+        engine.reduce_with_precision("power", [4, 0.5], "exact")
+
+
+def assert_modes(operation, operands, expected):
+    engine = ChallengeEngine()
+    native, *by_precision = expected
+
+    assert engine.get_handler(operation)(operands) == native
+    for precision, value in zip(PRECISIONS, by_precision):
+        if value is None:
+            continue
+        result = engine.reduce_with_precision(operation, operands, precision)
+        assert (result, type(result)) == (value, type(value)), precision
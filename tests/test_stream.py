@@ -0,0 +1,111 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.stream import NDJSONOperandDecoder
+
+
+def post(path, body):
+    from main import app
+
+    async def send():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.post(f"/api/v1{path}", json=body)
+
+    return asyncio.run(send())
+
+
+def post_stream(operation, chunks):
+    from main import app
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    async def send():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.post(
+                "/api/v1/challenge/stream",
+                params={"operation": operation},
+                content=body(),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+    return asyncio.run(send())
+
+
+def decode(chunks, max_line_bytes=1 << 20):
+    decoder = NDJSONOperandDecoder(max_line_bytes=max_line_bytes)
+    operands = []
+    for chunk in chunks:
+        operands.extend(decoder.feed(chunk))
+    operands.extend(decoder.close())
+    return operands
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [b"1\n2.5\n[3, 4]\n-5\n"],
+        # Lines, numbers and arrays split across chunks.
+        [b"1\n2", b".5\n[3,", b" 4]\n", b"-", b"5"],
+        [bytes([byte]) for byte in b"1\n2.5\n[3, 4]\n-5"],
+        # Blank and whitespace-only lines are skipped.
+        [b"\n1\n\n  \n2.5\r\n[3, 4]\n\n-5\n\n"],
+    ],
+)
+def test_operands_are_decoded_across_chunk_boundaries(chunks):
+    assert decode(chunks) == [1, 2.5, 3, 4, -5]
+
+
+def test_feed_returns_only_the_operands_of_complete_lines():
+    decoder = NDJSONOperandDecoder()
+
+    assert decoder.feed(b"1\n2") == [1]
+    assert decoder.feed(b"3\n") == [23]
+    assert decoder.close() == []
+
+
+@pytest.mark.parametrize(
+    "chunks, message",
+    [
+        ([b"1\nnope\n"], "JSON number or array"),
+        ([b"1\n[1, 2\n"], "JSON number or array"),
+        ([b'1\n"2"\n'], "must be numbers"),
+        ([b"1\ntrue\n"], "must be numbers"),
+        ([b"[1, [2]]\n"], "must be numbers"),
+        ([b"1\n{}"], "must be numbers"),
+        ([b"12345678901"], "too long"),
+    ],
+)
+def test_invalid_lines_are_rejected(chunks, message):
+    with pytest.raises(ValueError, match=message):
+        decode(chunks, max_line_bytes=10)
+
+
+def test_streamed_operation_is_reduced():
+    response = post_stream("divide", [b"100\n[2,", b" 5]\n", b"2"])
+
+    assert response.json()["success"] is True
+    assert response.json()["data"] == {"result": 5.0}
+
+
+@pytest.mark.parametrize("chunks", [[b""], [b"\n\n"], [b"7\n"]])
+def test_streamed_operation_requires_two_operands(chunks):
+    body = post_stream("sum", chunks).json()
+
+    assert body["success"] is False
+    assert body["data"] == {"error": "At least two operands are required."}
+
+
+def test_streamed_division_by_zero_is_answered_like_a_single_request():
+    streamed = post_stream("divide", [b"1\n0\n"]).json()
+    single = post("/challenge", {"operation": "divide", "operands": [1, 0]}).json()
+
+    assert streamed == single
+    assert streamed["data"] is None
@@ -0,0 +1,120 @@
+import asyncio
+
+import httpx
+
+from langchain_core.messages import AIMessage
+
+from app.core.agent import ChallengeAgent
+from app.core.workflow import ChallengeWorkflow
+from app.routes.challenge.controllers import controller as controller_module
+from app.routes.challenge.controllers.controller import ChallengeController
+from app.routes.challenge.dtos.dto import ChallengePromptRequestDTO
+from app.routes.challenge.providers.provider import get_challenge_controller
+from app.routes.challenge.services.service import ChallengeService
+from fakes import FakeChatModel, tool_call
+
+
+def build_controller(delay=0.0):
+    model = FakeChatModel(
+        responses=[
+            AIMessage(content="", tool_calls=[tool_call("sum", "a", operands=[3, 4])]),
+            AIMessage(content="The sum is 7."),
+        ],
+        delay=delay,
+    )
+    workflow = ChallengeWorkflow(agent=ChallengeAgent(llm=model))
+    return ChallengeController(ChallengeService(workflow=workflow)), model
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = block.split("\n")
+        if lines[0].startswith(":"):
+            events.append("keepalive")
+        else:
+            events.append(lines[0].removeprefix("event: "))
+    return events
+
+
+def test_stream_yields_agent_events_then_the_result():
+    from main import app
+
+    controller, _ = build_controller()
+
+    async def send():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.post(
+                "/api/v1/challenge/prompt/stream",
+                # Declined by the fast-path parser, so the agent runs.
+                json={"prompt": "Please stream the sum of 3 and 4, step by step."},
+            )
+
+    app.dependency_overrides[get_challenge_controller] = lambda: controller
+    try:
+        response = asyncio.run(send())
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert parse_sse(response.text) == [
+        "tool_selected",
+        "tool_arguments",
+        "tool_result",
+        "result",
+    ]
+    assert '"data":{"result":7}' in response.text
+
+
+def test_stream_sends_keepalives_while_the_model_is_slow(monkeypatch):
+    monkeypatch.setattr(controller_module, "SSE_KEEPALIVE_SECONDS", 0.02)
+    controller, _ = build_controller(delay=0.1)
+    request = ChallengePromptRequestDTO(
+        prompt="Please add 3 and 4 slowly for me, step by step."
+    )
+
+    async def connected():
+        return False
+
+    async def collect():
+        return [chunk async for chunk in controller._prompt_events(request, connected)]
+
+    events = parse_sse("".join(asyncio.run(collect())))
+
+    assert "keepalive" in events
+    assert events[-1] == "result"
+    assert [event for event in events if event != "keepalive"] == [
+        "tool_selected",
+        "tool_arguments",
+        "tool_result",
+        "result",
+    ]
+
+
+def test_disconnect_cancels_the_in_flight_llm_call(monkeypatch):
+    monkeypatch.setattr(controller_module, "SSE_KEEPALIVE_SECONDS", 0.02)
+    controller, model = build_controller(delay=10.0)
+    request = ChallengePromptRequestDTO(
+        prompt="Please add 3 and 4 for a client that leaves, step by step."
+    )
+
+    async def disconnected():
+        return True
+
+    async def collect():
+        chunks = [
+            chunk async for chunk in controller._prompt_events(request, disconnected)
+        ]
+        # Let the cancellation reach the model call.
+        await asyncio.sleep(0)
+        return chunks
+
+    chunks = asyncio.run(asyncio.wait_for(collect(), timeout=5.0))
+
+    # The stream closes on the first keepalive, without waiting for the model.
+    assert chunks == []
+    assert model.cancelled == 1
+    assert len(model.calls) == 0